@@ -2,16 +2,112 @@
 Enhanced Snake Game Main Entry Point with Sound Effects
 """
 
+import argparse
 import sys
 import os
+import time
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.game.game import SnakeGame
+
+def replay_speed(value):
+    """Parse --speed: 'max' (None) or a positive multiple of real time"""
+    if value == "max":
+        return None
+    try:
+        speed = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid speed: {value!r}")
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("speed must be positive")
+    return speed
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Enhanced Snake Game")
+    parser.add_argument("--replay", nargs="+", metavar="FILE",
+                        help="re-simulate replay files headlessly and verify their results")
+    parser.add_argument("--speed", type=replay_speed, default=None,
+                        help="replay speed: 'max' or a multiple of real time (default: max)")
+
+    simulation = parser.add_argument_group("batch simulation (headless)")
+    simulation.add_argument("--simulate", type=int, metavar="GAMES",
+                            help="play GAMES headless bot games across worker processes")
+    simulation.add_argument("--difficulty", default="medium", choices=["easy", "medium", "hard"],
+                            help="difficulty preset (default: medium)")
+    simulation.add_argument("--policy", default="greedy",
+                            help="bot policy name (default: greedy)")
+    simulation.add_argument("--workers", type=int, default=None,
+                            help="worker processes (default: CPU count)")
+    simulation.add_argument("--seed", type=int, default=0,
+                            help="seed of the first game (default: 0)")
+    simulation.add_argument("--max-ticks", type=int, default=20000,
+                            help="tick limit per game (default: 20000)")
+    args = parser.parse_args(argv)
+
+    # Zero or negative counts would be skipped or misread further down
+    for option, value in (("--simulate", args.simulate), ("--workers", args.workers),
+                          ("--max-ticks", args.max_ticks)):
+        if value is not None and value < 1:
+            parser.error(f"{option} must be at least 1")
+    return args
+
+
+def run_replays(paths, speed):
+    """
+    Play back replay files without a window or audio
+    Args:
+        paths: Replay file paths
+        speed: Playback rate multiple, or None for as fast as possible
+    Returns:
+        bool: True if every replay reproduced its recorded result
+    """
+    # Only the pygame-free core is imported, so no display is needed
+    from src.core.replay import Replay, simulate_replay
+
+    all_ok = True
+    for path in paths:
+        # A bad file (unreadable, corrupt header, unknown difficulty) fails
+        # on its own without stopping the rest of the batch
+        try:
+            replay = Replay.load(path)
+            start = time.perf_counter()
+            core = simulate_replay(replay, speed)
+            elapsed = time.perf_counter() - start
+        except (OSError, ValueError) as e:
+            print(f"✗ {path}: {e}")
+            all_ok = False
+            continue
+
+        # Replays are saved when the game ends, so the game must end on the recorded tick
+        ok = core.game_over and (core.tick, core.score, core.won) == (replay.ticks, replay.score, replay.won)
+        all_ok = all_ok and ok
+        mark = "✓" if ok else "✗"
+        print(f"{mark} {path}: score {core.score} (recorded {replay.score}), "
+              f"ticks {core.tick} (recorded {replay.ticks}), {elapsed:.3f}s")
+
+    return all_ok
+
 
 def main():
     """Main function with launch options"""
+    args = parse_args()
+    if args.replay:
+        sys.exit(0 if run_replays(args.replay, args.speed) else 1)
+    if args.simulate is not None:
+        from src.core.batch_runner import run_batch
+        try:
+            summary = run_batch(args.simulate, args.difficulty, args.policy, args.workers,
+                                args.seed, args.max_ticks)
+        except ValueError as e:
+            sys.exit(f"❌ {e}")
+        print(summary.report())
+        return
+
+    from src.game.game import SnakeGame
+
     print("🐍 Welcome to Enhanced Snake Game! 🐍")
     print("✨ Enhanced with visual effects, animations and sound effects")
     print("🔊 Sound effects enabled - Different sounds for different collisions!")
@@ -30,6 +126,7 @@ def main():
     print("🖥️  Press F to toggle fullscreen mode")
     print("🎵 Press M to toggle background music")
     print("🎶 Press N to switch music style (retro/chiptune/ambient)")
+    print("🤖 Press A to toggle the autopilot")
     print("")
     print("Sound Effects:")
     print("🍎 Eating food - High pitched beep")
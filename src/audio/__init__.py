@@ -0,0 +1 @@
+"""Pygame-free audio synthesis: music generators and signal filters"""
@@ -0,0 +1,88 @@
+"""
+Audio Cache for Snake Game
+Rendered int16 buffers kept as .npy files and memory-mapped on later runs
+"""
+
+import glob
+import hashlib
+import json
+import numpy as np
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+
+AUDIO_CACHE_DIR = os.path.join(CACHE_DIR, "audio")
+
+
+def audio_cache_key(params):
+    """
+    Short hash of a generator's parameters
+    Args:
+        params: Dict of everything the output depends on (BPM, volume,
+                sample rate, style, generator version, ...)
+    """
+    text = json.dumps(params, sort_keys=True)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def audio_cache_path(name, params):
+    """Cache file for one sound rendered with one set of parameters"""
+    return os.path.join(AUDIO_CACHE_DIR, f"{name}_{audio_cache_key(params)}.npy")
+
+
+def load_audio(name, params):
+    """
+    Memory-map a cached buffer
+    Returns:
+        ndarray: Read-only (samples, 2) int16 array, or None on a miss
+    """
+    try:
+        samples = np.load(audio_cache_path(name, params), mmap_mode="r")
+        if samples.dtype == np.int16 and samples.ndim == 2 and samples.shape[1] == 2:
+            return samples
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def store_audio(name, params, samples):
+    """Write a buffer to the cache and drop older renders of the same sound"""
+    path = audio_cache_path(name, params)
+    try:
+        os.makedirs(AUDIO_CACHE_DIR, exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(samples, dtype=np.int16))
+        os.replace(temp_path, path)  # Never leave a half-written cache
+        key_pattern = "?" * len(audio_cache_key(params))  # Skip e.g. "game_over" files for "game"
+        for stale in glob.glob(os.path.join(AUDIO_CACHE_DIR, f"{name}_{key_pattern}.npy")):
+            if stale != path:
+                os.remove(stale)
+    except OSError as e:
+        print(f"⚠️ 无法写入音频缓存: {e}")
+
+
+def cached_render(name, params, render):
+    """
+    Get a rendered sound, from the disk cache when possible
+    Args:
+        name: Sound name (file prefix, e.g. "music_kids_menu")
+        params: Dict of everything the output depends on (the cache key)
+        render: Function returning the (samples, 2) int16 buffer on a miss
+    Returns:
+        ndarray: Stereo int16 samples (memory-mapped on a hit)
+    """
+    if not AUDIO_CACHE_ENABLED:
+        return render()
+    samples = load_audio(name, params)
+    if samples is None:
+        samples = render()
+        store_audio(name, params, samples)
+        stored = load_audio(name, params)  # Hand back the mapped file, so the rendered copy can be freed
+        if stored is not None:
+            samples = stored
+    return samples
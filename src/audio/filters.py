@@ -0,0 +1,79 @@
+"""
+Signal Filters for Snake Game Audio
+O(n) NumPy moving-average, one-pole low-pass and delay filters
+"""
+
+import numpy as np
+
+
+def moving_average(signal, window_size):
+    """
+    Centered moving average in O(n), from a cumulative sum
+    Each sample averages signal[i - window_size // 2 : i + window_size // 2 + 1],
+    the window clipped at both ends (so an even window_size spans one more sample)
+    Args:
+        signal: 1-D float array
+        window_size: Nominal window length in samples
+    Returns:
+        ndarray: Smoothed signal, same length
+    """
+    signal = np.asarray(signal, dtype=np.float64)
+    n = len(signal)
+    half = window_size // 2
+    total = np.concatenate(([0.0], np.cumsum(signal)))
+    index = np.arange(n)
+    start = np.maximum(index - half, 0)
+    end = np.minimum(index + half + 1, n)
+    return (total[end] - total[start]) / (end - start)
+
+
+def one_pole_lowpass(signal, cutoff, sample_rate, initial=0.0):
+    """
+    One-pole low-pass filter: y[n] = y[n-1] + alpha * (x[n] - y[n-1])
+    The recursion is solved block by block with a scaled cumulative sum,
+    so there is no per-sample Python loop.
+    Args:
+        signal: 1-D float array
+        cutoff: -3 dB frequency in Hz
+        sample_rate: Samples per second
+        initial: Filter state before the first sample
+    Returns:
+        ndarray: Filtered signal, same length
+    """
+    signal = np.asarray(signal, dtype=np.float64)
+    alpha = 1.0 - np.exp(-2 * np.pi * cutoff / sample_rate)
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        return signal.copy()
+
+    # Inside a block, y[j] = decay^j * (decay * y_prev + alpha * sum(x[k] / decay^k));
+    # blocks are short enough that 1 / decay^k stays far from overflowing
+    block = int(min(65536, max(1, 200 / -np.log10(decay))))
+    powers = decay ** np.arange(block)
+    out = np.empty_like(signal)
+    state = initial
+    for start in range(0, len(signal), block):
+        chunk = signal[start:start + block]
+        scale = powers[:len(chunk)]
+        out[start:start + len(chunk)] = scale * (decay * state + alpha * np.cumsum(chunk / scale))
+        state = out[start + len(chunk) - 1]
+    return out
+
+
+def delay(signal, delay_samples, gain=1.0):
+    """
+    Delayed, scaled copy of a signal (silence for the first delay_samples)
+    Args:
+        signal: 1-D array
+        delay_samples: Delay in samples
+        gain: Level of the delayed copy
+    Returns:
+        ndarray: Float array, same length as signal
+    """
+    signal = np.asarray(signal)
+    out = np.zeros(len(signal))
+    if 0 < delay_samples < len(signal):
+        out[delay_samples:] = signal[:-delay_samples] * gain
+    elif delay_samples == 0:
+        out[:] = signal * gain
+    return out
@@ -0,0 +1,174 @@
+"""
+Sound Effect Synthesis for Snake Game
+NumPy generators for the short game sound effects
+"""
+
+import numpy as np
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.audio.synth import SAMPLE_RATE, to_stereo
+
+# Bump when any generator below changes its output (part of the cache key)
+SFX_VERSION = 1
+
+
+def tone(frequency, duration, volume=0.3, sample_rate=SAMPLE_RATE):
+    """
+    Simple decaying tone with harmonics
+    Args:
+        frequency: Pitch in Hz
+        duration: Length in milliseconds
+        volume: Output level (0.0 to 1.0)
+    """
+    samples = int(sample_rate * duration / 1000)
+    t = np.linspace(0, duration / 1000, samples, False)
+
+    # Sine wave with some harmonics for a richer sound
+    wave = np.sin(2 * np.pi * frequency * t)
+    wave += 0.3 * np.sin(2 * np.pi * frequency * 2 * t)
+    wave += 0.1 * np.sin(2 * np.pi * frequency * 3 * t)
+
+    # Exponential decay for a smoother sound
+    wave *= np.exp(-t * 5)
+    return to_stereo((wave * 32767 * volume).astype(np.int16))
+
+
+def bomb_place(sample_rate=SAMPLE_RATE):
+    """Metallic click for placing a bomb"""
+    duration = 300  # 0.3 seconds
+    samples = int(sample_rate * duration / 1000)
+    t = np.linspace(0, duration / 1000, samples, False)
+
+    # High frequency with second and third harmonics
+    base_freq = 800
+    wave = np.sin(2 * np.pi * base_freq * t)
+    wave += 0.5 * np.sin(2 * np.pi * base_freq * 2 * t)
+    wave += 0.3 * np.sin(2 * np.pi * base_freq * 3 * t)
+
+    # Sharp envelope, then some noise for metallic texture
+    wave *= np.exp(-t * 10)
+    wave += 0.1 * (np.random.random(samples) - 0.5)
+    return to_stereo((wave * 32767 * 0.4).astype(np.int16))
+
+
+def bomb_explosion(sample_rate=SAMPLE_RATE):
+    """Layered boom, noise and crackle for an exploding bomb"""
+    duration = 800  # 0.8 seconds
+    samples = int(sample_rate * duration / 1000)
+    t = np.linspace(0, duration / 1000, samples, False)
+
+    boom = 0.8 * np.sin(2 * np.pi * 60 * t) * np.exp(-t * 3)        # Low boom, slow decay
+    noise = 0.6 * np.sin(2 * np.pi * 200 * t) * np.exp(-t * 8)      # Mid-range, medium decay
+    crackle = 0.4 * np.sin(2 * np.pi * 1200 * t) * np.exp(-t * 15)  # High crackle, fast decay
+
+    explosion = boom + noise + crackle
+    explosion += 0.2 * (np.random.random(samples) - 0.5)  # Random noise for realism
+    explosion *= np.exp(-t * 4)  # Overall envelope
+    return to_stereo((explosion * 32767 * 0.6).astype(np.int16))
+
+
+def powerup(powerup_type, sample_rate=SAMPLE_RATE):
+    """
+    Short note sequence for collecting a power-up
+    Args:
+        powerup_type: 'slow_potion', 'shield', or 'double_score'
+    """
+    note_duration = 150  # Each note 150ms
+
+    if powerup_type == 'slow_potion':
+        frequencies = [600, 480, 360]  # Descending scale (calming effect)
+    elif powerup_type == 'shield':
+        frequencies = [800, 960, 1200]  # Ascending scale (protective, rising effect)
+    elif powerup_type == 'double_score':
+        frequencies = [1000, 1500, 2000, 1500]  # Flickering pattern (exciting)
+    else:
+        frequencies = [440, 550, 660]
+
+    note_samples = []
+    for freq in frequencies:
+        samples = int(sample_rate * note_duration / 1000)
+        t = np.linspace(0, note_duration / 1000, samples, False)
+
+        # Tone with harmonics
+        wave = np.sin(2 * np.pi * freq * t)
+        wave += 0.3 * np.sin(2 * np.pi * freq * 2 * t)
+        wave += 0.15 * np.sin(2 * np.pi * freq * 3 * t)
+
+        # Attack and release ramps
+        attack = int(samples * 0.1)
+        release = int(samples * 0.3)
+        envelope = np.ones(samples)
+        envelope[:attack] = np.linspace(0, 1, attack)
+        envelope[-release:] = np.linspace(1, 0, release)
+
+        note_samples.append(wave * envelope)
+
+    full_wave = np.concatenate(note_samples)
+    return to_stereo((full_wave * 32767 * 0.4).astype(np.int16))
+
+
+def theme_switch(sample_rate=SAMPLE_RATE):
+    """Quick bell-like C major arpeggio (C-E-G-C)"""
+    note_duration = 80  # Quick 80ms per note
+
+    note_samples = []
+    for freq in [261.63, 329.63, 392.00, 523.25]:
+        samples = int(sample_rate * note_duration / 1000)
+        t = np.linspace(0, note_duration / 1000, samples, False)
+        wave = np.sin(2 * np.pi * freq * t)
+        wave += 0.5 * np.sin(2 * np.pi * freq * 2 * t)
+        note_samples.append(wave * np.exp(-t * 12))
+
+    full_wave = np.concatenate(note_samples)
+    return to_stereo((full_wave * 32767 * 0.35).astype(np.int16))
+
+
+def combo(combo_level, sample_rate=SAMPLE_RATE):
+    """
+    Pulsing tone for an eating combo
+    Args:
+        combo_level: 2, 3, or 5+ (higher pitch for higher combos)
+    """
+    duration = 200  # 0.2 seconds
+    samples = int(sample_rate * duration / 1000)
+    t = np.linspace(0, duration / 1000, samples, False)
+
+    if combo_level == 2:
+        freq = 600
+    elif combo_level == 3:
+        freq = 800
+    else:  # 5+
+        freq = 1000
+
+    # Tone with extra harmonics for excitement
+    wave = np.sin(2 * np.pi * freq * t)
+    wave += 0.4 * np.sin(2 * np.pi * freq * 2 * t)
+    wave += 0.2 * np.sin(2 * np.pi * freq * 3 * t)
+
+    # Decay with a 10 Hz pulse
+    envelope = np.exp(-t * 8)
+    pulse = 1 + 0.3 * np.sin(2 * np.pi * 10 * t)
+    wave *= envelope * pulse
+    return to_stereo((wave * 32767 * 0.4).astype(np.int16))
+
+
+def shield_break(sample_rate=SAMPLE_RATE):
+    """Descending sweep with noise (glass shatter)"""
+    duration = 400  # 0.4 seconds
+    samples = int(sample_rate * duration / 1000)
+    t = np.linspace(0, duration / 1000, samples, False)
+
+    # High frequency sweeping down, plus noise for the shatter
+    start_freq = 2000
+    end_freq = 400
+    freq_sweep = start_freq + (end_freq - start_freq) * t / (duration / 1000)
+    wave = np.sin(2 * np.pi * freq_sweep * t)
+    wave += 0.3 * (np.random.random(samples) - 0.5)
+
+    # Sharp attack, quick decay
+    wave *= np.exp(-t * 10)
+    return to_stereo((wave * 32767 * 0.5).astype(np.int16))
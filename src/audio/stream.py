@@ -0,0 +1,42 @@
+"""
+Music Sources for Streaming Playback
+Endless int16 sample sources read a fixed-size chunk at a time
+"""
+
+import numpy as np
+
+
+class LoopSource:
+    """
+    Endless chunks of a looping buffer
+
+    The buffer is usually a memory-mapped audio cache file, so only the
+    pages of the chunk being read are touched. Any object with the same
+    read(count) method (e.g. a generator rendering a track as it goes)
+    can be streamed the same way.
+    """
+
+    def __init__(self, samples):
+        """
+        Initialize source
+        Args:
+            samples: (samples, 2) int16 loop
+        """
+        if len(samples) == 0:
+            raise ValueError("LoopSource needs at least one sample")
+        self.samples = samples
+        self.position = 0  # Next sample to read
+
+    def read(self, count):
+        """
+        Next count samples, wrapping around to the start of the loop
+        Returns:
+            ndarray: Contiguous (count, 2) int16 array (a copy, not a view)
+        """
+        parts = []
+        while count > 0:
+            part = self.samples[self.position:self.position + count]
+            parts.append(part)
+            count -= len(part)
+            self.position = (self.position + len(part)) % len(self.samples)
+        return np.concatenate(parts).astype(np.int16, copy=False)
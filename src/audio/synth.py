@@ -0,0 +1,493 @@
+"""
+Music Synthesis for Snake Game
+Vectorized NumPy generators for every background music style and phase
+"""
+
+import numpy as np
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+from src.audio.filters import delay, moving_average
+
+SAMPLE_RATE = 22050  # Must match the mixer frequency
+
+# Bump when any track below changes its output (part of the cache key)
+SYNTH_VERSION = 1
+
+MUSIC_STYLES = ["retro_arcade", "chiptune", "ambient", "kids"]
+MUSIC_PHASES = ["menu", "game", "game_over"]
+
+
+# ---------------------------------------------------------------------------
+# Building blocks: every voice is computed for a whole time vector at once
+# ---------------------------------------------------------------------------
+
+def segments(samples, count):
+    """
+    Split a loop into count equal parts (bars or notes)
+    Returns:
+        tuple: (part index of every sample, first sample of each sample's part)
+    """
+    starts = (np.arange(count) * samples / count).astype(int)
+    part = np.repeat(np.arange(count), np.diff(np.append(starts, samples)))
+    return part, starts[part]
+
+
+def sine(freq, t):
+    """Sine wave at freq (scalar or per-sample array)"""
+    return np.sin(2 * np.pi * freq * t)
+
+
+def square(freq, t):
+    """Square wave (chiptune lead)"""
+    return np.sign(np.sin(2 * np.pi * freq * t))
+
+
+def triangle(freq, t):
+    """Triangle wave (chiptune bass)"""
+    return 2 * np.arcsin(np.sin(2 * np.pi * freq * t)) / np.pi
+
+
+def pad(freq, t, depth, lfo_rate):
+    """Sine pad whose phase drifts with a slow LFO"""
+    return np.sin(2 * np.pi * freq * t + depth * np.sin(2 * np.pi * lfo_rate * t))
+
+
+def kick(amplitude, freq, t, decay, mask):
+    """Decaying low sine where mask is set"""
+    return np.where(mask, amplitude * np.sin(2 * np.pi * freq * t) * np.exp(-t * decay), 0.0)
+
+
+def snare(amplitude, t, mask, decay=None):
+    """
+    White noise burst where mask is set
+    Noise is drawn only for the masked samples, in order, so the global
+    NumPy random stream is used exactly as a per-sample loop would use it
+    """
+    out = np.zeros(len(t))
+    hits = amplitude * (np.random.random(np.count_nonzero(mask)) - 0.5)
+    if decay is not None:
+        hits = hits * np.exp(-t[mask] * decay)
+    out[mask] = hits
+    return out
+
+
+def bell(scale, t, amplitude, swell_period, note_period, decay, transpose=1.0):
+    """Slowly swelling bell stepping through a scale, re-struck every note_period seconds"""
+    intensity = amplitude * (1 + np.sin(2 * np.pi * t / swell_period))
+    freq = np.asarray(scale)[(t / note_period).astype(int) % len(scale)] * transpose
+    return intensity * np.sin(2 * np.pi * freq * t) * np.exp(-(t % note_period) * decay)
+
+
+def to_int16(signal, volume, gain=1.0):
+    """Scale a [-1, 1] float signal to 16-bit samples"""
+    return (signal * 32767 * volume * gain).astype(np.int16)
+
+
+def to_stereo(mono):
+    """Duplicate a mono int16 signal into (samples, 2)"""
+    return np.column_stack([mono, mono])
+
+
+# ---------------------------------------------------------------------------
+# Retro arcade
+# ---------------------------------------------------------------------------
+
+def retro_arcade_game(bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME, sample_rate=SAMPLE_RATE):
+    """Professional retro arcade-style background music (16 bars)"""
+    beat_duration = 60.0 / bpm
+    total_duration = beat_duration * 64  # 16 bars * 4 beats
+    samples = int(sample_rate * total_duration)
+
+    # C minor scale and chord progression, one chord every 4 bars
+    c_minor = [261.63, 293.66, 329.63, 349.23, 392.00, 440.00, 523.25]
+    chords = np.array([
+        [c_minor[0], c_minor[2], c_minor[4]],  # C minor (i)
+        [c_minor[3], c_minor[5], c_minor[0] * 0.5],  # F major (iv)
+        [c_minor[4], c_minor[0] * 0.5, c_minor[2] * 0.5],  # G major (V)
+        [c_minor[3], c_minor[5], c_minor[2]],  # F major (iv) variation
+    ])
+
+    i = np.arange(samples)
+    global_t = i / sample_rate
+    bar, bar_start = segments(samples, 16)
+    chord = (bar // 4) % len(chords)
+    beat_samples = int(sample_rate * beat_duration)
+
+    # Bass line - rhythmic, an octave down
+    bass_intensity = np.where(i % beat_samples < int(sample_rate * beat_duration * 0.8), 0.4, 0.1)
+    bass = bass_intensity * sine(chords[chord, 0] / 2, global_t)
+
+    # Melody line - pulsing, a chord note every 2 beats
+    melody_note = chords[chord, (i // int(sample_rate * beat_duration * 2)) % 3]
+    melody = 0.3 * (0.5 + 0.5 * sine(0.5, global_t)) * sine(melody_note, global_t)
+
+    # Arpeggio an octave up, a chord note every half beat
+    arp_note = chords[chord, (i // int(sample_rate * beat_duration * 0.5)) % 3] * 2
+    arpeggio = 0.15 * (0.3 + 0.7 * sine(2, global_t)) * sine(arp_note, global_t)
+
+    # Subtle noise percussion on every beat
+    percussion = snare(0.2, global_t, i % beat_samples < int(sample_rate * 0.05))
+
+    envelope = 1.0 - 0.3 * np.sin(2 * np.pi * global_t / total_duration)
+    music = (bass + melody + arpeggio + percussion) * envelope
+
+    # Low-pass effect for a smoother sound
+    music = to_int16(moving_average(music, 5), volume)
+
+    # Slight stereo depth: 10ms echo on the right channel
+    stereo = to_stereo(music)
+    stereo[:, 1] += delay(music, int(sample_rate * 0.01), 0.1).astype(np.int16)
+    return stereo
+
+
+def retro_arcade_menu(bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME, sample_rate=SAMPLE_RATE):
+    """Energetic retro arcade music for menu/lobby (4 bars)"""
+    beat_duration = 60.0 / (bpm * 1.3)  # Faster tempo for menu
+    total_duration = beat_duration * 16
+    samples = int(sample_rate * total_duration)
+
+    c_major = [261.63, 293.66, 329.63, 349.23, 392.00, 440.00, 493.88, 523.25]
+    chords = np.array([
+        [c_major[0], c_major[2], c_major[4]],  # C major
+        [c_major[3], c_major[5], c_major[0] * 0.5],  # F major
+        [c_major[4], c_major[0] * 0.5, c_major[2] * 0.5],  # G major
+        [c_major[0], c_major[2], c_major[4]],  # Back to C major
+    ])
+
+    i = np.arange(samples)
+    global_t = i / sample_rate
+    bar, bar_start = segments(samples, 4)
+    t = (i - bar_start) / sample_rate
+
+    # Driving bass line
+    bass_intensity = np.where(i % int(sample_rate * beat_duration) < int(sample_rate * beat_duration * 0.8),
+                              0.5, 0.2)
+    bass = bass_intensity * sine(chords[bar, 0] / 2, global_t)
+
+    # Energetic melody
+    melody_note = chords[bar, (i // int(sample_rate * beat_duration * 2)) % 3]
+    melody = 0.4 * (0.6 + 0.4 * sine(1, global_t)) * sine(melody_note, global_t)
+
+    # Percussion - more driving for menu
+    beat_phase = (t % beat_duration) / beat_duration
+    kicks = kick(0.5, 80, t, 12, beat_phase < 0.2)
+    snares = snare(0.3, t, (0.4 < beat_phase) & (beat_phase < 0.6), decay=8)
+
+    music = (bass + melody + kicks + snares) * 1.3  # Louder for menu
+    return to_stereo(to_int16(music, volume))
+
+
+def retro_arcade_game_over(bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME, sample_rate=SAMPLE_RATE):
+    """Calming retro music for game over (8 bars)"""
+    beat_duration = 60.0 / (bpm * 0.6)  # Much slower for game over
+    total_duration = beat_duration * 32
+    samples = int(sample_rate * total_duration)
+
+    a_minor = [220.00, 246.94, 261.63, 293.66, 329.63, 392.00, 440.00]
+    chords = np.array([
+        [a_minor[0], a_minor[2], a_minor[4]],  # A minor
+        [a_minor[3], a_minor[5], a_minor[0] * 0.5],  # D minor
+        [a_minor[4], a_minor[0] * 0.5, a_minor[2] * 0.5],  # E major
+        [a_minor[0], a_minor[2], a_minor[4]],  # Back to A minor
+    ])
+
+    i = np.arange(samples)
+    global_t = i / sample_rate
+    bar, bar_start = segments(samples, 8)
+    t = (i - bar_start) / sample_rate
+    chord = bar % len(chords)
+    two_beats = int(sample_rate * beat_duration * 2)
+
+    # Deep, slow bass
+    bass_intensity = np.where(i % two_beats < int(sample_rate * beat_duration * 1.5), 0.3, 0.1)
+    bass = bass_intensity * sine(chords[chord, 0] / 2, global_t)
+
+    # Gentle, melancholic melody
+    melody_note = chords[chord, (i // int(sample_rate * beat_duration * 4)) % 3]
+    melody = 0.2 * (0.4 + 0.6 * sine(0.2, global_t)) * sine(melody_note, global_t)
+
+    # Very subtle percussion
+    kicks = kick(0.15, 50, t, 4, i % two_beats < int(sample_rate * 0.1))
+
+    music = (bass + melody + kicks) * 0.7  # Quieter for game over
+    return to_stereo(to_int16(moving_average(music, 15), volume))
+
+
+# ---------------------------------------------------------------------------
+# Chiptune
+# ---------------------------------------------------------------------------
+
+def chiptune_game(bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME, sample_rate=SAMPLE_RATE):
+    """Modern chiptune-style background music (8 bars)"""
+    beat_duration = 60.0 / bpm
+    total_duration = beat_duration * 32  # 8 bars * 4 beats
+    samples = int(sample_rate * total_duration)
+
+    # C major pentatonic for a happy feel; the melody walks C E G C every bar
+    c_major_pentatonic = [261.63, 293.66, 329.63, 392.00, 440.00, 523.25, 659.25]
+    melody_notes = np.array([c_major_pentatonic[0], c_major_pentatonic[2],
+                             c_major_pentatonic[4], c_major_pentatonic[5]])
+
+    i = np.arange(samples)
+    global_t = i / sample_rate
+    bar, bar_start = segments(samples, 8)
+    t = (i - bar_start) / sample_rate
+
+    # Square lead and triangle bass
+    lead_freq = melody_notes[(t / (beat_duration * 2)).astype(int) % len(melody_notes)]
+    lead = 0.2 * square(lead_freq, global_t)
+    bass = 0.15 * triangle(c_major_pentatonic[0] / 2, global_t)
+
+    # Kick on the beat, snare on the off-beat
+    beat_phase = (t % beat_duration) / beat_duration
+    kicks = kick(0.3, 60, t, 10, beat_phase < 0.1)
+    snares = snare(0.2, t, (0.4 < beat_phase) & (beat_phase < 0.5), decay=5)
+
+    # Chiptune-style volume envelope
+    envelope = 0.8 + 0.2 * np.sin(2 * np.pi * global_t / total_duration * 4)
+    music = (lead + bass + kicks + snares) * envelope
+    return to_stereo(to_int16(music, volume))
+
+
+def chiptune_menu(bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME, sample_rate=SAMPLE_RATE):
+    """Energetic chiptune music for menu/lobby (4 bars)"""
+    beat_duration = 60.0 / (bpm * 1.2)  # Slightly faster tempo
+    total_duration = beat_duration * 16
+    samples = int(sample_rate * total_duration)
+
+    c_major_pentatonic = np.array([261.63, 293.66, 329.63, 392.00, 440.00, 523.25])
+
+    i = np.arange(samples)
+    t = i / sample_rate
+
+    # Lead melody - more energetic
+    melody_note = c_major_pentatonic[(t / (beat_duration * 2)).astype(int) % len(c_major_pentatonic)]
+    lead = 0.25 * square(melody_note, t)
+
+    # Bass line - driving rhythm
+    beat_samples = int(sample_rate * beat_duration)
+    bass_intensity = np.where(i % beat_samples < int(sample_rate * beat_duration * 0.7), 0.3, 0.1)
+    bass = bass_intensity * square(c_major_pentatonic[0] / 2, t)
+
+    # Percussion - more prominent
+    beat_phase = (t % beat_duration) / beat_duration
+    kicks = kick(0.4, 80, t, 8, beat_phase < 0.15)
+    snares = snare(0.3, t, (0.45 < beat_phase) & (beat_phase < 0.6), decay=6)
+
+    music = (lead + bass + kicks + snares) * 1.2  # Slightly louder for menu
+    return to_stereo(to_int16(music, volume))
+
+
+def chiptune_game_over(bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME, sample_rate=SAMPLE_RATE):
+    """Calming chiptune music for game over (8 bars)"""
+    beat_duration = 60.0 / (bpm * 0.7)  # Slower tempo for game over
+    total_duration = beat_duration * 32
+    samples = int(sample_rate * total_duration)
+
+    a_minor_pentatonic = np.array([220.00, 261.63, 293.66, 329.63, 392.00, 440.00])
+
+    t = np.arange(samples) / sample_rate
+
+    # Slow, gentle melody over a deep bass
+    melody_note = a_minor_pentatonic[(t / (beat_duration * 4)).astype(int) % len(a_minor_pentatonic)]
+    lead = 0.15 * square(melody_note, t)
+    bass = 0.2 * square(a_minor_pentatonic[0] / 2, t)
+
+    # Very subtle percussion every other beat
+    beat_phase = (t % (beat_duration * 2)) / (beat_duration * 2)
+    kicks = kick(0.1, 60, t, 5, beat_phase < 0.1)
+
+    music = (lead + bass + kicks) * 0.8  # Quieter for game over
+    return to_stereo(to_int16(moving_average(music, 20), volume))
+
+
+# ---------------------------------------------------------------------------
+# Ambient
+# ---------------------------------------------------------------------------
+
+def ambient_game(bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME, sample_rate=SAMPLE_RATE):
+    """Soothing ambient background music (32 bars)"""
+    beat_duration = 60.0 / bpm
+    total_duration = beat_duration * 128  # 32 bars * 4 beats
+    samples = int(sample_rate * total_duration)
+
+    d_pentatonic = [293.66, 329.63, 392.00, 440.00, 523.25, 659.25]  # D major pentatonic
+
+    t = np.arange(samples) / sample_rate
+
+    # Slow-moving pads: deep fading drone, mid and high pads with slow LFOs
+    pad1 = 0.2 * sine(d_pentatonic[0] * 0.5, t) * np.exp(-t * 0.1)
+    pad2 = 0.15 * pad(d_pentatonic[2] * 0.7, t, 1, 0.1)
+    pad3 = 0.1 * pad(d_pentatonic[4] * 0.8, t, 0.5, 0.05)
+
+    # Gentle bell, swelling every 20 seconds, new note every 5 seconds
+    bells = bell(d_pentatonic, t, 0.05, 20, 5, 2)
+
+    # Very slow breathing envelope (30-second cycle)
+    envelope = 0.7 + 0.3 * np.sin(2 * np.pi * t / 30)
+    music = (pad1 + pad2 + pad3 + bells) * envelope
+
+    # Heavy smoothing for ambient feel
+    music = to_int16(moving_average(music, 50), volume)
+
+    # Stereo width with different delays per channel (20ms left, 30ms right)
+    stereo = to_stereo(music)
+    stereo[:, 0] += delay(music, int(sample_rate * 0.02), 0.2).astype(np.int16)
+    stereo[:, 1] += delay(music, int(sample_rate * 0.03), 0.15).astype(np.int16)
+    return stereo
+
+
+def ambient_menu(bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME, sample_rate=SAMPLE_RATE):
+    """Ambient music for menu/lobby (8 bars)"""
+    beat_duration = 60.0 / (bpm * 1.1)  # Slightly faster for menu
+    total_duration = beat_duration * 32
+    samples = int(sample_rate * total_duration)
+
+    c_pentatonic = [261.63, 293.66, 329.63, 392.00, 440.00, 523.25]
+
+    t = np.arange(samples) / sample_rate
+
+    # Root, third and fifth pads
+    pad1 = 0.25 * pad(c_pentatonic[0] * 0.7, t, 1, 0.2)
+    pad2 = 0.2 * pad(c_pentatonic[2] * 0.8, t, 0.3, 0.15)
+    pad3 = 0.15 * pad(c_pentatonic[4] * 0.9, t, 0.5, 0.1)
+
+    # Occasional bell tones
+    bells = bell(c_pentatonic, t, 0.1, 15, 8, 0.5)
+
+    music = (pad1 + pad2 + pad3 + bells) * 1.1  # Slightly more energetic for menu
+    return to_stereo(to_int16(moving_average(music, 10), volume))
+
+
+def ambient_game_over(bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME, sample_rate=SAMPLE_RATE):
+    """Deep ambient music for game over (16 bars)"""
+    beat_duration = 60.0 / (bpm * 0.5)  # Much slower for game over
+    total_duration = beat_duration * 64
+    samples = int(sample_rate * total_duration)
+
+    d_minor_pentatonic = [293.66, 329.63, 392.00, 440.00, 587.33]
+
+    t = np.arange(samples) / sample_rate
+
+    # Deep drones and a slow moving pad
+    drone1 = 0.3 * sine(d_minor_pentatonic[0] * 0.3, t)
+    drone2 = 0.25 * pad(d_minor_pentatonic[2] * 0.4, t, 1, 0.05)
+    pad3 = 0.2 * pad(d_minor_pentatonic[1] * 0.6, t, 0.4, 0.08)
+
+    # Occasional deep bell
+    bells = bell(d_minor_pentatonic, t, 0.08, 25, 12, 0.3, transpose=0.8)
+
+    music = (drone1 + drone2 + pad3 + bells) * 0.8  # Quieter and deeper
+    return to_stereo(to_int16(moving_average(music, 30), volume))
+
+
+# ---------------------------------------------------------------------------
+# Kids
+# ---------------------------------------------------------------------------
+
+def kids_game(bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME, sample_rate=SAMPLE_RATE):
+    """Fun, cheerful music for kids (16 notes)"""
+    beat_duration = 60.0 / (bpm * 1.2)  # Slightly faster for kids
+    total_duration = beat_duration * 32
+    samples = int(sample_rate * total_duration)
+
+    # C major pentatonic, higher octave: no dissonance
+    c_pentatonic = np.array([523.25, 587.33, 659.25, 783.99, 880.00, 1046.50])
+    # Happy melody pattern (Mary Had a Little Lamb style)
+    melody_pattern = np.array([2, 1, 0, 1, 2, 2, 2, 1, 1, 1, 2, 4, 4, 2, 1, 0])
+
+    i = np.arange(samples)
+    note, note_start = segments(samples, 16)
+    t = (i - note_start) / sample_rate
+
+    # Bright melody with its second harmonic
+    melody_note = c_pentatonic[melody_pattern[note]]
+    melody = 0.4 * sine(melody_note, t)
+    melody += 0.15 * sine(melody_note * 2, t)
+
+    # Bouncy low C bass
+    bass = 0.2 * sine(c_pentatonic[0] * 0.5, t)
+
+    # Quarter-note rhythm alternating E and A
+    rhythm = np.where((t * 4).astype(int) % 2 == 0,
+                      0.1 * sine(c_pentatonic[2], t),
+                      0.1 * sine(c_pentatonic[4], t))
+
+    # Simple attack/decay envelope per note
+    envelope = np.minimum(1.0, t * 20) * np.maximum(0.3, 1.0 - t * 2)
+    music = (melody + bass + rhythm) * envelope
+    return to_stereo(to_int16(music, volume, 0.9))
+
+
+def kids_menu(bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME, sample_rate=SAMPLE_RATE):
+    """Friendly, inviting menu music for kids (8 notes)"""
+    beat_duration = 60.0 / (bpm * 1.1)
+    total_duration = beat_duration * 16
+    samples = int(sample_rate * total_duration)
+
+    c_pentatonic = np.array([523.25, 587.33, 659.25, 783.99, 880.00])  # C D E G A
+    melody_pattern = np.array([0, 2, 4, 2, 0, 2, 4, 2])  # Up and down
+
+    i = np.arange(samples)
+    note, note_start = segments(samples, 8)
+    t = (i - note_start) / sample_rate
+
+    # Bright tone with a gentle decay per note
+    melody_note = c_pentatonic[melody_pattern[note]]
+    tone = 0.5 * sine(melody_note, t)
+    tone += 0.2 * sine(melody_note * 2, t)
+    music = tone * np.exp(-t * 3)
+    return to_stereo(to_int16(music, volume, 0.8))
+
+
+def kids_game_over(bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME, sample_rate=SAMPLE_RATE):
+    """Encouraging, non-sad game over music for kids (3-second arpeggio)"""
+    samples = int(sample_rate * 3.0)
+
+    c_arpeggio = np.array([523.25, 659.25, 783.99, 1046.50])  # C E G C, ascending
+
+    i = np.arange(samples)
+    note, note_start = segments(samples, len(c_arpeggio))
+    t = (i - note_start) / sample_rate
+
+    freq = c_arpeggio[note]
+    tone = 0.4 * sine(freq, t)
+    tone += 0.15 * sine(freq * 2, t)
+    music = tone * np.exp(-t * 2)
+    return to_stereo(to_int16(music, volume, 0.7))
+
+
+# Generator for every (style, phase)
+TRACKS = {
+    ("retro_arcade", "menu"): retro_arcade_menu,
+    ("retro_arcade", "game"): retro_arcade_game,
+    ("retro_arcade", "game_over"): retro_arcade_game_over,
+    ("chiptune", "menu"): chiptune_menu,
+    ("chiptune", "game"): chiptune_game,
+    ("chiptune", "game_over"): chiptune_game_over,
+    ("ambient", "menu"): ambient_menu,
+    ("ambient", "game"): ambient_game,
+    ("ambient", "game_over"): ambient_game_over,
+    ("kids", "menu"): kids_menu,
+    ("kids", "game"): kids_game,
+    ("kids", "game_over"): kids_game_over,
+}
+
+
+def render_track(style, phase, bpm=BACKGROUND_MUSIC_BPM, volume=BACKGROUND_MUSIC_VOLUME,
+                 sample_rate=SAMPLE_RATE):
+    """
+    Render one music loop
+    Args:
+        style: One of MUSIC_STYLES (unknown styles fall back to retro_arcade)
+        phase: One of MUSIC_PHASES
+    Returns:
+        ndarray: (samples, 2) int16 stereo loop
+    """
+    generator = TRACKS.get((style, phase)) or TRACKS[("retro_arcade", phase)]
+    return generator(bpm, volume, sample_rate)
@@ -4,6 +4,14 @@ Contains game settings and window configurations
 """
 
 from .config import *
-from .window_config import window_manager, create_game_window, toggle_fullscreen_mode, get_window_size
 
-__all__ = ['window_manager', 'create_game_window', 'toggle_fullscreen_mode', 'get_window_size']
\ No newline at end of file
+__all__ = ['window_manager', 'create_game_window', 'toggle_fullscreen_mode', 'get_window_size']
+
+
+def __getattr__(name):
+    """Import the pygame-backed window helpers only when they are used"""
+    # Keeps src.config.config importable for the headless simulation core
+    if name in __all__:
+        from . import window_config
+        return getattr(window_config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -33,6 +33,25 @@ FOOD_SIZE = 20  # Food size
 SPEED_INCREMENT = 2  # Speed increase per food eaten
 MAX_SPEED = 30  # Maximum speed limit
 
+# Frame rate settings - rendering runs independently of snake speed
+RENDER_FPS = 60  # Render frame rate: 60, 120, ... or 0 for uncapped
+EFFECTS_FPS = 60  # Update rate for particles, screen shake and floating text
+MAX_TICKS_PER_FRAME = 8  # Simulation ticks allowed per frame before time is dropped
+
+# Replay settings
+RECORD_REPLAYS = True  # Save a replay of every finished game
+REPLAY_DIR = "replays"  # Directory for replay files (.snkr)
+REPLAY_MAX_TICKS = 500000  # Longest replay that is loaded (a wrapped board can idle forever)
+REPLAY_KEYFRAME_INTERVAL = 0  # Ticks between keyframes saved in replays (0 = none; see Replay.build_keyframes)
+
+# Cache for precomputed data (solver tables)
+CACHE_DIR = ".cache"  # Directory for cached files, safe to delete
+AUDIO_CACHE_ENABLED = True  # Keep rendered music and sound effects in CACHE_DIR/audio
+
+# Bot search settings
+TRANSPOSITION_TABLE_SIZE = 100000  # Positions kept by a search bot's transposition table
+PLANNER_TIME_BUDGET = 0.02  # Seconds the rollout planner thinks per move (Hard runs 15-35 ticks/s)
+
 # Score settings
 SCORE_PER_FOOD = 10  # Points per food item
 
@@ -71,6 +90,7 @@ BACKGROUND_MUSIC_ENABLED = True  # Enable/disable background music
 BACKGROUND_MUSIC_VOLUME = 0.2  # Background music volume (0.0 to 1.0)
 BACKGROUND_MUSIC_STYLE = "retro_arcade"  # Music style: retro_arcade, ambient, chiptune
 BACKGROUND_MUSIC_BPM = 128  # Beats per minute for background music (more moderate tempo)
+MUSIC_CHUNK_SECONDS = 0.5  # Length of each streamed music chunk (must outlast a frame)
 
 # Game states
 GAME_OVER = "game_over"
@@ -0,0 +1,180 @@
+"""
+Autopilot for the Simulation Core
+A* pathfinding toward the food that replans only when its path breaks
+"""
+
+from collections import deque
+import heapq
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+from src.core.simulation import Action
+from src.core.grid import cell_distance, grid_neighbors, is_safe_cell, legal_actions, neighbor_cell
+from src.core.danger import DangerAnalyzer
+
+
+def blast_windows(core):
+    """
+    Find when each cell is inside a live blast
+    Returns:
+        dict: Cell index -> list of (first tick, last tick) from now
+    """
+    windows = {}
+    for bomb in core.bombs:
+        if not bomb.is_threat():
+            continue
+        if bomb.exploded:
+            window = (0, 10 - bomb.explosion_timer)
+        else:
+            window = (bomb.countdown - 1, bomb.countdown + 10)
+        for col, row in bomb.blast_cells():
+            windows.setdefault(row * GRID_WIDTH + col, []).append(window)
+    return windows
+
+
+class Autopilot:
+    """
+    Policy steering the snake along an A* path to the food
+
+    The search is time-aware: a body cell counts as free from the tick
+    its segment moves away, and a blast cell is avoided while any part of
+    the snake could still be on it when the bomb goes off. Because the
+    body only changes shape predictably until the food is eaten, a found
+    path stays valid and is followed move by move; the search runs again
+    only when the food moves, a bomb appears or disappears, the snake is
+    off the planned route or the next cell turns out to be unsafe.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initialize autopilot
+        Args:
+            seed: Unused; accepted so the autopilot fits the policy registry
+        """
+        self.path = deque()        # Planned moves: (cell index after the move, action)
+        self.expected_head = None  # Cell index the head should be on now
+        self.target = None         # Food cell index the path leads to
+        self.bomb_key = ()         # Bombs the path was planned around
+        self.replans = 0
+        self.danger = DangerAnalyzer()
+
+    def __call__(self, core):
+        snake = core.snake
+        head = snake.index_of_cell(snake.head_cell)
+        food = core.food.position
+        target = (food[1] // GRID_SIZE) * GRID_WIDTH + food[0] // GRID_SIZE
+        bomb_key = tuple((bomb.x, bomb.y, bomb.exploded) for bomb in core.bombs if bomb.is_threat())
+
+        if not self._path_still_valid(core, head, target, bomb_key):
+            self.plan(core, head, target, bomb_key)
+
+        if self.path:
+            self.expected_head, action = self.path.popleft()
+            return action
+        self.expected_head = None
+        return self.fallback(core)
+
+    def _path_still_valid(self, core, head, target, bomb_key):
+        """Check whether the current plan can be followed this tick"""
+        if not self.path or target != self.target or bomb_key != self.bomb_key:
+            return False
+        if head != self.expected_head:
+            return False
+        next_index = self.path[0][0]
+        cell = (next_index % GRID_WIDTH, next_index // GRID_WIDTH)
+        return is_safe_cell(core.snake, cell)
+
+    def plan(self, core, head, target, bomb_key):
+        """Search a new path from the head to the target"""
+        self.replans += 1
+        self.target = target
+        self.bomb_key = bomb_key
+        self.expected_head = head
+        self.path = deque(self.search(core, head, target) or ())
+
+    def _room_after(self, core, index):
+        """Free cells reachable from a cell, up to the snake's length"""
+        snake = core.snake
+        return self.danger.reachable_space(snake, (index,), core.settings.wall_wrap_around,
+                                           len(snake.body))
+
+    def search(self, core, start, goal):
+        """
+        Time-aware A* over the occupancy grid
+        Returns:
+            list: (cell index, action) moves from start to goal, or None
+        """
+        snake = core.snake
+        wrap_around = core.settings.wall_wrap_around
+        neighbors = grid_neighbors(wrap_around)
+        length = len(snake.body)
+
+        # Ticks until each body cell is vacated (the tail leaves first)
+        free_at = {}
+        growth = 1 if snake.grow_flag else 0
+        for i, cell in enumerate(snake.body):
+            index = snake.index_of_cell(cell)
+            if index is not None:
+                free_at[index] = max(free_at.get(index, 0), length - i + growth)
+        windows = blast_windows(core)
+
+        goal_cell = (goal % GRID_WIDTH, goal // GRID_WIDTH)
+        back = Action.from_direction((-snake.direction[0], -snake.direction[1]))
+
+        def heuristic(index):
+            return cell_distance((index % GRID_WIDTH, index // GRID_WIDTH), goal_cell, wrap_around)
+
+        best_cost = {start: 0}
+        came_from = {}
+        frontier = [(heuristic(start), 0, start)]
+        while frontier:
+            _, cost, index = heapq.heappop(frontier)
+            if index == goal:
+                break
+            if cost > best_cost[index]:
+                continue
+            arrival = cost + 1
+            for neighbor, action in neighbors[index]:
+                if cost == 0 and action == back:
+                    continue  # The snake cannot reverse into its neck
+                if arrival < free_at.get(neighbor, 0):
+                    continue
+                if neighbor in windows and any(arrival <= last and arrival + length >= first
+                                               for first, last in windows[neighbor]):
+                    continue
+                if arrival < best_cost.get(neighbor, arrival + 1):
+                    best_cost[neighbor] = arrival
+                    came_from[neighbor] = (index, action)
+                    heapq.heappush(frontier, (arrival + heuristic(neighbor), arrival, neighbor))
+        else:
+            return None
+
+        moves = []
+        index = goal
+        while index != start:
+            previous, action = came_from[index]
+            moves.append((index, action))
+            index = previous
+        moves.reverse()
+        return moves
+
+    def fallback(self, core):
+        """No path to the food: take the safe move with the most room behind it"""
+        snake = core.snake
+        wrap_around = core.settings.wall_wrap_around
+        best_action = Action.NONE
+        best_room = -1
+        for action in legal_actions(snake):
+            cell = neighbor_cell(snake.head_cell, Action.DIRECTIONS[action], wrap_around)
+            if not is_safe_cell(snake, cell):
+                continue
+            room = self._room_after(core, snake.index_of_cell(cell))
+            if room > best_room:
+                best_action = action
+                best_room = room
+        return best_action
+
@@ -0,0 +1,146 @@
+"""
+Batch Simulation Runner for the Simulation Core
+Plays many headless games with a bot policy across worker processes
+"""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import time
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.difficulty import DIFFICULTY_PRESETS, DifficultyLevel
+from src.core.simulation import SimulationCore, SimEvent
+from src.core.policies import create_policy
+
+
+@dataclass
+class GameResult:
+    """Outcome of one simulated game"""
+    seed: int
+    score: int
+    ticks: int
+    length: int
+    won: bool
+    cause: str  # "wall", "self", "bomb", "board_full" or "timeout"
+
+
+@dataclass
+class BatchSummary:
+    """Aggregated results of a batch run"""
+    difficulty: str
+    policy: str
+    results: list = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def games(self):
+        return len(self.results)
+
+    @property
+    def total_ticks(self):
+        return sum(result.ticks for result in self.results)
+
+    @property
+    def mean_score(self):
+        return sum(result.score for result in self.results) / max(1, self.games)
+
+    @property
+    def max_score(self):
+        return max((result.score for result in self.results), default=0)
+
+    @property
+    def mean_ticks(self):
+        return self.total_ticks / max(1, self.games)
+
+    @property
+    def wins(self):
+        return sum(1 for result in self.results if result.won)
+
+    @property
+    def causes(self):
+        return Counter(result.cause for result in self.results)
+
+    def report(self):
+        """Format the summary for the console"""
+        rate = self.total_ticks / self.elapsed if self.elapsed else 0
+        causes = ", ".join(f"{cause}: {count}" for cause, count in self.causes.most_common())
+        return "\n".join([
+            f"📊 {self.games} games ({self.difficulty}, policy: {self.policy})",
+            f"   Score: mean {self.mean_score:.1f}, max {self.max_score}",
+            f"   Ticks: mean {self.mean_ticks:.0f}, total {self.total_ticks}",
+            f"   Wins: {self.wins}   Endings: {causes}",
+            f"   Time: {self.elapsed:.2f}s ({rate:,.0f} ticks/s)",
+        ])
+
+
+def play_game(difficulty, policy_name, seed, max_ticks):
+    """
+    Play one headless game to the end
+    Args:
+        difficulty: DifficultyLevel value string
+        policy_name: Name of a registered policy
+        seed: Game seed (also seeds the policy)
+        max_ticks: Tick limit before the game is cut off
+    Returns:
+        GameResult
+    """
+    core = SimulationCore(DIFFICULTY_PRESETS[DifficultyLevel(difficulty)], seed=seed)
+    policy = create_policy(policy_name, seed)
+    cause = "timeout"
+    while core.tick < max_ticks:
+        result = core.step(policy(core))
+        if result.game_over:
+            for event in result.events:
+                if event.kind == SimEvent.DIED:
+                    cause = event.value
+                elif event.kind == SimEvent.BOARD_FULL:
+                    cause = "board_full"
+            break
+    return GameResult(seed, core.score, core.tick, len(core.snake.body), core.won, cause)
+
+
+def _play_shard(difficulty, policy_name, seeds, max_ticks):
+    """Worker entry point: play a list of seeds and send back the results"""
+    return [play_game(difficulty, policy_name, seed, max_ticks) for seed in seeds]
+
+
+def run_batch(games, difficulty="medium", policy="greedy", workers=None,
+              base_seed=0, max_ticks=20000, shards_per_worker=4):
+    """
+    Simulate many games in parallel worker processes
+    Args:
+        games: Number of games; game i uses seed base_seed + i
+        difficulty: DifficultyLevel value string
+        policy: Name of a registered policy
+        workers: Worker processes (CPU count when None, 1 runs in-process)
+        base_seed: Seed of the first game
+        max_ticks: Tick limit per game
+        shards_per_worker: Jobs per worker, to balance uneven game lengths
+    Returns:
+        BatchSummary with results in seed order
+    """
+    DifficultyLevel(difficulty)  # Fail fast on a bad name, before forking
+    create_policy(policy)
+    workers = workers or os.cpu_count() or 1
+    seeds = list(range(base_seed, base_seed + games))
+    summary = BatchSummary(difficulty, policy)
+
+    start = time.perf_counter()
+    if workers == 1:
+        summary.results = _play_shard(difficulty, policy, seeds, max_ticks)
+    else:
+        shard_count = max(1, min(games, workers * shards_per_worker))
+        shards = [seeds[i::shard_count] for i in range(shard_count)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_play_shard, difficulty, policy, shard, max_ticks)
+                       for shard in shards]
+            for future in futures:
+                summary.results.extend(future.result())
+        summary.results.sort(key=lambda result: result.seed)
+    summary.elapsed = time.perf_counter() - start
+    return summary
@@ -0,0 +1,108 @@
+"""
+Bomb Logic for the Simulation Core
+Pygame-free bomb countdown, explosion timing and blast collision rules
+"""
+
+import math
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+
+
+class BombLogic:
+    """Bomb countdown and blast rules without particles or rendering"""
+
+    def __init__(self, x, y, explosion_radius=100, countdown=180):  # 3 second fuse at 60 ticks/s
+        """
+        Initialize bomb
+        Args:
+            x, y: Bomb position
+            explosion_radius: Blast radius in pixels
+            countdown: Ticks until explosion
+        """
+        self.x = x
+        self.y = y
+        self.explosion_radius = explosion_radius
+        self.countdown = countdown
+        self.active = True
+        self.exploded = False
+        self.explosion_timer = 0
+        # Matches the longest explosion particle lifetime, which used to
+        # decide when a bomb was removed (and replenished)
+        self.explosion_duration = 50
+
+    def snapshot(self):
+        """
+        Capture the bomb rules state as an immutable, hashable tuple
+        Returns:
+            tuple: State for restore()
+        """
+        return (self.x, self.y, self.explosion_radius, self.countdown,
+                self.active, self.exploded, self.explosion_timer)
+
+    def restore(self, state):
+        """Restore a snapshot() result (particles and other visuals are not saved)"""
+        (self.x, self.y, self.explosion_radius, self.countdown,
+         self.active, self.exploded, self.explosion_timer) = state
+
+    def update(self):
+        """Advance the bomb by one tick"""
+        if not self.exploded:
+            self.countdown -= 1
+            if self.countdown <= 0:
+                self.explode()
+        else:
+            self.update_explosion()
+
+    def explode(self):
+        """Trigger explosion"""
+        self.exploded = True
+        self.active = True
+
+    def update_explosion(self):
+        """Advance explosion timer and deactivate when finished"""
+        self.explosion_timer += 1
+        if self.explosion_timer >= self.explosion_duration:
+            self.active = False
+
+    def get_explosion_area(self):
+        """Get blast area as (x, y, radius), only during the early explosion"""
+        if self.exploded and self.explosion_timer < 10:
+            return (self.x, self.y, self.explosion_radius)
+        return None
+
+    def is_threat(self):
+        """Check whether the blast can still hurt: before or early in the explosion"""
+        return self.active and not (self.exploded and self.explosion_timer >= 10)
+
+    def blast_cells(self):
+        """
+        Get the grid cells the blast reaches
+        Uses the same test as the snake hit check: cell corner within radius + 5
+        Returns:
+            list: (col, row) cells on the board
+        """
+        radius = self.explosion_radius + 5
+        radius_sq = radius * radius
+        min_col = max(0, int((self.x - radius) // GRID_SIZE))
+        max_col = min(GRID_WIDTH - 1, int((self.x + radius) // GRID_SIZE))
+        min_row = max(0, int((self.y - radius) // GRID_SIZE))
+        max_row = min(GRID_HEIGHT - 1, int((self.y + radius) // GRID_SIZE))
+        cells = []
+        for row in range(min_row, max_row + 1):
+            dy_sq = (row * GRID_SIZE - self.y) ** 2
+            for col in range(min_col, max_col + 1):
+                if (col * GRID_SIZE - self.x) ** 2 + dy_sq < radius_sq:
+                    cells.append((col, row))
+        return cells
+
+    def is_colliding(self, x, y, radius=0):
+        """Check whether the blast reaches the given position"""
+        if self.exploded and self.explosion_timer < 15:
+            distance = math.sqrt((x - self.x)**2 + (y - self.y)**2)
+            return distance < self.explosion_radius + radius
+        return False
@@ -0,0 +1,42 @@
+"""
+Game Clock for the Simulation Core
+Tick-based game time used by every gameplay timer
+"""
+
+
+class GameClock:
+    """
+    Game time in milliseconds that only moves when the simulation steps
+
+    Each tick advances the clock by the tick's nominal length
+    (1000 / snake speed), so power-up lifetimes, effect durations and
+    combo windows cover the same number of ticks whether the game runs
+    live, paused, fast-forwarded or headless.
+    """
+
+    def __init__(self, start_ms=0):
+        """
+        Initialize clock
+        Args:
+            start_ms: Game time in milliseconds at tick 0
+        """
+        self.now_ms = start_ms
+
+    def __call__(self):
+        """Current game time in milliseconds (usable as a time source)"""
+        return self.now_ms
+
+    def advance_tick(self, ticks_per_second):
+        """
+        Advance by the length of one tick
+        Args:
+            ticks_per_second: Simulation rate during this tick (snake speed)
+        Returns:
+            float: New game time in milliseconds
+        """
+        self.now_ms += 1000.0 / ticks_per_second
+        return self.now_ms
+
+    def reset(self, start_ms=0):
+        """Rewind the clock"""
+        self.now_ms = start_ms
@@ -0,0 +1,235 @@
+"""
+Danger Analysis for the Simulation Core
+Reachable-space flood fill and blast checks around the snake's head
+"""
+
+from array import array
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+
+
+# The eight cells around a cell in ring order, orthogonal ones at even positions
+_RING = ((0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1))
+
+
+def _ring_table(wrap_around):
+    """Ring cell indices around every cell for a board topology (-1 off the board)"""
+    table = []
+    for index in range(GRID_WIDTH * GRID_HEIGHT):
+        col, row = index % GRID_WIDTH, index // GRID_WIDTH
+        ring = []
+        for dx, dy in _RING:
+            n_col, n_row = col + dx, row + dy
+            if wrap_around:
+                n_col %= GRID_WIDTH
+                n_row %= GRID_HEIGHT
+            elif not (0 <= n_col < GRID_WIDTH and 0 <= n_row < GRID_HEIGHT):
+                ring.append(-1)
+                continue
+            ring.append(n_row * GRID_WIDTH + n_col)
+        table.append(tuple(ring))
+    return table
+
+
+class DangerAnalyzer:
+    """
+    Measures how much room the snake has left
+
+    The flood fill stops as soon as it has found a little more room than
+    the snake is long, so on an open board it touches only a patch around
+    the head. Visited cells are marked with a generation number instead of
+    a fresh set, so nothing is cleared between fills.
+
+    in_danger() is also incremental while the head's open neighbors all
+    lie in one connected region. The head can only move into that region,
+    and removing the entered cell leaves parts that each touch the new
+    head; if the new head's open neighbors are also joined through the
+    ring of cells around it, those parts are still one region. The room
+    then loses at most one cell per tick while the snake gains at most one
+    segment, so the room found beyond the snake's length shrinks by at
+    most 2 per tick, and the fill is repeated only once that slack is used
+    up or the ring check fails. When the neighbors lead into separate
+    pockets, turning into the small one loses the big one at once, so
+    nothing is cached and the next tick fills again.
+    """
+
+    def __init__(self, slack_margin=32):
+        """
+        Initialize analyzer
+        Args:
+            slack_margin: Extra cells a fill looks for beyond the snake's length
+        """
+        self.visited = array('I', bytes(4 * GRID_WIDTH * GRID_HEIGHT))
+        self.generation = 0
+        self._tables = {}
+        self._rings = {}
+        self.slack_margin = slack_margin
+        self.slack = -1  # Room beyond the snake's length still guaranteed
+
+    def reset(self):
+        """Forget the incremental state (after a restore or a shielded crash)"""
+        self.slack = -1
+
+    def neighbors(self, wrap_around):
+        """Neighbor cell indices of every cell, from grid_neighbors() without the actions"""
+        if wrap_around not in self._tables:
+            # Imported here: grid imports Action from simulation, which imports this module
+            from src.core.grid import grid_neighbors
+            self._tables[wrap_around] = [tuple(neighbor for neighbor, _ in pairs)
+                                         for pairs in grid_neighbors(wrap_around)]
+        return self._tables[wrap_around]
+
+    def rings(self, wrap_around):
+        """Ring table for a topology (built on first use)"""
+        if wrap_around not in self._rings:
+            self._rings[wrap_around] = _ring_table(wrap_around)
+        return self._rings[wrap_around]
+
+    def neighbors_joined(self, snake, wrap_around):
+        """
+        Check that the head's open neighbors are joined through the ring around it
+        Consecutive ring cells touch, so the open neighbors are joined when
+        they all fall in one run of open ring cells
+        """
+        head = snake.index_of_cell(snake.head_cell)
+        if head is None:
+            return False
+        occupancy = snake.occupancy
+        tail = snake.index_of_cell(snake.body[-1])
+        ring = self.rings(wrap_around)[head]
+        is_open = [cell >= 0 and (not occupancy[cell] or cell == tail) for cell in ring]
+        if all(is_open):
+            return True
+        start = is_open.index(False)
+        run = 0
+        joined_run = None
+        for step in range(1, 9):
+            position = (start + step) % 8
+            if not is_open[position]:
+                run += 1
+            elif position % 2 == 0:
+                if joined_run is None:
+                    joined_run = run
+                elif joined_run != run:
+                    return False
+        return True
+
+    def reachable_space(self, snake, starts, wrap_around, limit=None):
+        """
+        Count free cells reachable from one or more cells
+        The tail cell counts as free because it moves away on the next tick
+        Args:
+            snake: Snake whose occupancy grid blocks the fill
+            starts: Cell indices to fill from (each counted only if free)
+            wrap_around: Whether the fill wraps through walls
+            limit: Stop counting once this many cells are found
+        Returns:
+            int: Reachable free cells, capped at limit
+        """
+        self.generation += 1
+        if self.generation == 0xFFFFFFFF:
+            self.visited = array('I', bytes(len(self.visited) * 4))
+            self.generation = 1
+        generation = self.generation
+        visited = self.visited
+        occupancy = snake.occupancy
+        neighbors = self.neighbors(wrap_around)
+        tail = snake.index_of_cell(snake.body[-1])
+        if limit is None:
+            limit = len(occupancy)
+
+        frontier = []
+        for start in starts:
+            if visited[start] != generation and (not occupancy[start] or start == tail):
+                visited[start] = generation
+                frontier.append(start)
+        count = len(frontier)
+        while frontier and count < limit:
+            next_frontier = []
+            for index in frontier:
+                for neighbor in neighbors[index]:
+                    if visited[neighbor] != generation and (not occupancy[neighbor] or neighbor == tail):
+                        visited[neighbor] = generation
+                        next_frontier.append(neighbor)
+                        count += 1
+            frontier = next_frontier
+        return min(count, limit)
+
+    def head_space(self, snake, wrap_around, limit=None):
+        """Free cells reachable from the head (the head itself excluded)"""
+        head = snake.index_of_cell(snake.head_cell)
+        if head is None:
+            return 0
+        if limit is None:
+            limit = len(snake.body)
+        return self.reachable_space(snake, self.neighbors(wrap_around)[head], wrap_around, limit)
+
+    def head_region(self, snake, wrap_around, limit):
+        """
+        head_space(), and whether the head's open neighbors form one region
+        Fills from the first open neighbor; only if that misses another one
+        (a separate pocket, or one beyond the limit) is the fill repeated
+        from all of them
+        Returns:
+            tuple: (reachable free cells capped at limit, connected)
+        """
+        head = snake.index_of_cell(snake.head_cell)
+        if head is None:
+            return 0, False
+        occupancy = snake.occupancy
+        tail = snake.index_of_cell(snake.body[-1])
+        starts = [n for n in self.neighbors(wrap_around)[head] if not occupancy[n] or n == tail]
+        if not starts:
+            return 0, True
+        space = self.reachable_space(snake, starts[:1], wrap_around, limit)
+        if all(self.visited[start] == self.generation for start in starts[1:]):
+            return space, True
+        return self.reachable_space(snake, starts, wrap_around, limit), False
+
+    @staticmethod
+    def blast_ahead(core):
+        """Check whether the head or the cell in front of it lies in a live blast zone"""
+        snake = core.snake
+        col, row = snake.head_cell
+        dx, dy = snake.direction
+        ahead = ((col + dx) * GRID_SIZE, (row + dy) * GRID_SIZE)
+        head = (col * GRID_SIZE, row * GRID_SIZE)
+        for bomb in core.bombs:
+            if not bomb.is_threat():
+                continue
+            radius_sq = (bomb.explosion_radius + 5) ** 2
+            for x, y in (head, ahead):
+                if (x - bomb.x) ** 2 + (y - bomb.y) ** 2 < radius_sq:
+                    return True
+        return False
+
+    def in_danger(self, core):
+        """
+        Check whether the snake is boxed in or heading into a blast
+        Returns:
+            bool: True if the room around the head is smaller than the
+                  snake or a live blast zone is at or ahead of the head
+        """
+        snake = core.snake
+        length = len(snake.body)
+        if length > 1:
+            if len(snake.free_cells) + 1 < length:
+                # Fewer free cells (plus the tail) than segments: no fill needed
+                self.slack = -1
+                return True
+            if self.slack >= 2 and self.neighbors_joined(snake, core.settings.wall_wrap_around):
+                self.slack -= 2
+            else:
+                limit = length + self.slack_margin
+                space, connected = self.head_region(snake, core.settings.wall_wrap_around, limit)
+                if space < length:
+                    self.slack = -1
+                    return True
+                # Separate pockets: the next move may lose all but one of them
+                self.slack = space - length if connected else -1
+        return self.blast_ahead(core)
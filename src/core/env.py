@@ -0,0 +1,204 @@
+"""
+Gym-style Environments for the Simulation Core
+reset()/step() wrappers returning compact bit-packed grid observations
+"""
+
+import numpy as np
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+from src.core.difficulty import DIFFICULTY_PRESETS, DifficultyLevel
+from src.core.simulation import SimulationCore
+from src.core.batch_env import BatchSnakeEnv
+
+# Observation channels
+CHANNEL_BODY = 0      # Cells covered by the snake (head included)
+CHANNEL_HEAD = 1      # The head cell
+CHANNEL_FOOD = 2      # The food cell
+CHANNEL_POWERUP = 3   # Cells holding a power-up
+CHANNEL_BLAST = 4     # Cells a bomb can still hit (fuse burning or early in its blast)
+NUM_CHANNELS = 5
+
+# Packed observation shape: one bit per cell, rows padded to whole bytes
+OBSERVATION_SHAPE = (NUM_CHANNELS, GRID_HEIGHT, (GRID_WIDTH + 7) // 8)
+
+# Top-left pixel of every cell, as used by the blast collision check
+_CELL_X = np.arange(GRID_WIDTH) * GRID_SIZE
+_CELL_Y = np.arange(GRID_HEIGHT) * GRID_SIZE
+
+
+def unpack_observation(observation):
+    """
+    Expand a packed observation to booleans
+    Args:
+        observation: (..., NUM_CHANNELS, GRID_HEIGHT, bytes) uint8 array
+    Returns:
+        ndarray: (..., NUM_CHANNELS, GRID_HEIGHT, GRID_WIDTH) bool array
+    """
+    return np.unpackbits(observation, axis=-1, count=GRID_WIDTH).astype(bool)
+
+
+def blast_zone(bomb):
+    """Cells the bomb's explosion reaches (same test as SimulationCore.update_bombs)"""
+    radius = bomb.explosion_radius + 5
+    dx = (_CELL_X - bomb.x) ** 2
+    dy = (_CELL_Y - bomb.y) ** 2
+    return dy[:, None] + dx[None, :] < radius * radius
+
+
+def observe(core):
+    """
+    Build the packed observation of a SimulationCore
+    Returns:
+        ndarray: uint8 array of OBSERVATION_SHAPE
+    """
+    grid = np.zeros((NUM_CHANNELS, GRID_HEIGHT, GRID_WIDTH), dtype=bool)
+    occupancy = np.frombuffer(core.snake.occupancy, dtype=np.uint8)
+    grid[CHANNEL_BODY] = occupancy.reshape(GRID_HEIGHT, GRID_WIDTH) > 0
+
+    head_col, head_row = core.snake.head_cell
+    if 0 <= head_col < GRID_WIDTH and 0 <= head_row < GRID_HEIGHT:
+        grid[CHANNEL_HEAD, head_row, head_col] = True
+
+    food_x, food_y = core.food.position
+    grid[CHANNEL_FOOD, food_y // GRID_SIZE, food_x // GRID_SIZE] = True
+
+    for powerup in core.powerups.powerups:
+        grid[CHANNEL_POWERUP, powerup.y // GRID_SIZE, powerup.x // GRID_SIZE] = True
+
+    for bomb in core.bombs:
+        if bomb.is_threat():
+            grid[CHANNEL_BLAST] |= blast_zone(bomb)
+
+    return np.packbits(grid, axis=-1)
+
+
+class SnakeEnv:
+    """
+    Single-board environment over the full SimulationCore
+
+    reset(seed) -> (observation, info)
+    step(action) -> (observation, reward, terminated, truncated, info)
+    Actions are Action values (a direction, optionally | Action.BOMB);
+    the reward is the points scored on the step.
+    """
+
+    def __init__(self, difficulty="medium", max_ticks=None):
+        """
+        Initialize environment
+        Args:
+            difficulty: DifficultyLevel value string
+            max_ticks: Truncate episodes after this many ticks (no limit when None)
+        """
+        self.settings = DIFFICULTY_PRESETS[DifficultyLevel(difficulty)]
+        self.max_ticks = max_ticks
+        self.core = None
+
+    def reset(self, seed=None):
+        """
+        Start a new game
+        Args:
+            seed: Game seed (random when None)
+        Returns:
+            tuple: (observation, info)
+        """
+        self.core = SimulationCore(self.settings, seed=seed)
+        return observe(self.core), self._info()
+
+    def step(self, action):
+        """
+        Advance one tick
+        Returns:
+            tuple: (observation, reward, terminated, truncated, info)
+        """
+        previous_score = self.core.score
+        result = self.core.step(action)
+        truncated = (not result.game_over and self.max_ticks is not None
+                     and result.tick >= self.max_ticks)
+        info = self._info()
+        info["events"] = result.events
+        return (observe(self.core), result.score - previous_score,
+                result.game_over, truncated, info)
+
+    def _info(self):
+        """Extra episode information"""
+        return {"tick": self.core.tick, "score": self.core.score,
+                "won": self.core.won, "seed": self.core.seed}
+
+
+class VectorSnakeEnv:
+    """
+    N boards stepped together on BatchSnakeEnv
+
+    Same interface as SnakeEnv with a leading batch axis on every value.
+    Boards that end are reset automatically; info["final_score"] holds
+    their score before the reset. The power-up and blast channels stay
+    empty because the batch simulation has no power-ups or bombs.
+    """
+
+    def __init__(self, num_envs, difficulty="medium", max_ticks=None):
+        """
+        Initialize environments
+        Args:
+            num_envs: Number of boards
+            difficulty: DifficultyLevel value string
+            max_ticks: Truncate (and reset) boards after this many ticks
+        """
+        self.num_envs = num_envs
+        self.settings = DIFFICULTY_PRESETS[DifficultyLevel(difficulty)]
+        self.max_ticks = max_ticks
+        self.batch = None
+        self._grid = np.zeros((num_envs, NUM_CHANNELS, GRID_HEIGHT * GRID_WIDTH), dtype=bool)
+
+    def reset(self, seed=None):
+        """
+        Start new games on every board
+        Returns:
+            tuple: (observations, info)
+        """
+        self.batch = BatchSnakeEnv(self.num_envs, self.settings, seed=seed)
+        return self._observe(), self._info()
+
+    def step(self, actions):
+        """
+        Advance every board one tick
+        Args:
+            actions: (N,) Action values
+        Returns:
+            tuple: (observations, rewards, terminated, truncated, info)
+        """
+        batch = self.batch
+        rewards, terminated = batch.step(actions)
+        final_score = np.where(terminated, batch.final_score, 0)
+
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        if self.max_ticks is not None:
+            truncated = batch.ticks >= self.max_ticks
+            cut = batch.boards[truncated]
+            if len(cut):
+                final_score[cut] = batch.score[cut]
+                batch.reset(cut)
+
+        info = self._info()
+        info["final_score"] = final_score
+        info["won"] = batch.won.copy()
+        return self._observe(), rewards, terminated, truncated, info
+
+    def _observe(self):
+        """Build packed observations for every board"""
+        batch = self.batch
+        grid = self._grid
+        grid[:] = False
+        grid[:, CHANNEL_BODY] = batch.occupancy > 0
+        grid[batch.boards, CHANNEL_HEAD, batch.head] = True
+        grid[batch.boards, CHANNEL_FOOD, batch.food] = True
+        shaped = grid.reshape(self.num_envs, NUM_CHANNELS, GRID_HEIGHT, GRID_WIDTH)
+        return np.packbits(shaped, axis=-1)
+
+    def _info(self):
+        """Extra per-board information"""
+        return {"tick": self.batch.ticks.copy(), "score": self.batch.score.copy()}
@@ -0,0 +1,62 @@
+"""
+Food Logic for the Simulation Core
+Pygame-free food placement and respawn rules
+"""
+
+import random
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+from src.core.zobrist import FOOD_KEYS, cell_of
+
+
+class FoodLogic:
+    """Food position and respawn rules without any rendering"""
+
+    def __init__(self, rng=None):
+        """
+        Initialize food
+        Args:
+            rng: random.Random stream for placement (defaults to the random module)
+        """
+        self.rng = rng or random
+        self.position = self.generate_position()
+        self.zobrist = FOOD_KEYS[cell_of(self.position)]  # Zobrist key of the food cell
+
+    def generate_position(self):
+        """
+        Generate random position
+        Returns:
+            tuple: (x, y) coordinates
+        """
+        x = self.rng.randint(0, GRID_WIDTH - 1) * GRID_SIZE
+        y = self.rng.randint(0, GRID_HEIGHT - 1) * GRID_SIZE
+        return (x, y)
+
+    def snapshot(self):
+        """Capture the food state (its position)"""
+        return self.position
+
+    def restore(self, state):
+        """Restore a snapshot() result"""
+        self.position = state
+        self.zobrist = FOOD_KEYS[cell_of(state)]
+
+    def respawn(self, snake):
+        """
+        Respawn food on a random cell not covered by the snake
+        Args:
+            snake: Snake whose free cell index lists the empty cells
+        Returns:
+            bool: False if the snake fills the whole board
+        """
+        index = snake.free_cells.sample(self.rng)
+        if index is None:
+            return False
+        self.position = ((index % GRID_WIDTH) * GRID_SIZE, (index // GRID_WIDTH) * GRID_SIZE)
+        self.zobrist = FOOD_KEYS[index]
+        return True
@@ -0,0 +1,66 @@
+"""
+Fixed Timestep Loop for Snake Game
+Decides how many fixed simulation ticks to run for each rendered frame
+"""
+
+
+class FixedTimestepLoop:
+    """Accumulator that turns variable frame times into fixed-length ticks"""
+
+    def __init__(self, tick_rate, max_ticks_per_frame=8, max_backlog=0.25):
+        """
+        Initialize loop
+        Args:
+            tick_rate: Simulation ticks per second
+            max_ticks_per_frame: Most ticks run for one frame before the rest is dropped
+            max_backlog: Most unsimulated time (seconds) kept after a stall
+        """
+        self.tick_rate = tick_rate
+        self.step = 1.0 / tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.max_backlog = max_backlog
+        self.accumulator = 0.0
+        self.ticks_this_frame = 0
+        self.dropped_time = 0.0  # Total simulated time discarded under load
+
+    def set_tick_rate(self, tick_rate):
+        """Change ticks per second, e.g. when the snake speeds up"""
+        if tick_rate != self.tick_rate:
+            self.tick_rate = tick_rate
+            self.step = 1.0 / tick_rate
+
+    def add_time(self, frame_seconds):
+        """Add the real time that passed since the previous frame"""
+        self.accumulator += frame_seconds
+        if self.accumulator > self.max_backlog:
+            self.dropped_time += self.accumulator - self.max_backlog
+            self.accumulator = self.max_backlog
+        self.ticks_this_frame = 0
+
+    def consume_tick(self):
+        """
+        Take one tick worth of time from the accumulator
+        Returns:
+            bool: True if a tick should be simulated now
+        """
+        if self.accumulator + 1e-9 < self.step:
+            return False
+        if self.ticks_this_frame >= self.max_ticks_per_frame:
+            # Too far behind: drop whole ticks rather than stall rendering
+            dropped = self.accumulator - self.accumulator % self.step
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+            return False
+        self.accumulator = max(0.0, self.accumulator - self.step)
+        self.ticks_this_frame += 1
+        return True
+
+    @property
+    def alpha(self):
+        """Fraction (0-1) of the way from the last tick to the next one"""
+        return max(0.0, min(1.0, self.accumulator / self.step))
+
+    def reset(self):
+        """Forget accumulated time (menus, pause, new game)"""
+        self.accumulator = 0.0
+        self.ticks_this_frame = 0
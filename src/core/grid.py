@@ -0,0 +1,78 @@
+"""
+Grid Helpers for the Simulation Core
+Cell arithmetic and move safety checks shared by the bot controllers
+"""
+
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+from src.core.simulation import Action
+
+
+_NEIGHBORS = {}
+
+
+def grid_neighbors(wrap_around):
+    """
+    Get the neighbor table for a board topology (built once per mode)
+    Returns:
+        list: For each cell index, a tuple of (neighbor index, action) pairs
+    """
+    if wrap_around not in _NEIGHBORS:
+        table = []
+        for index in range(GRID_WIDTH * GRID_HEIGHT):
+            cell = (index % GRID_WIDTH, index // GRID_WIDTH)
+            pairs = []
+            for action, direction in Action.DIRECTIONS.items():
+                neighbor = neighbor_cell(cell, direction, wrap_around)
+                if neighbor is not None:
+                    pairs.append((neighbor[1] * GRID_WIDTH + neighbor[0], action))
+            table.append(tuple(pairs))
+        _NEIGHBORS[wrap_around] = table
+    return _NEIGHBORS[wrap_around]
+
+
+def neighbor_cell(cell, direction, wrap_around):
+    """
+    Get the cell one step from cell in a direction
+    Returns:
+        tuple: (col, row), or None if the step leaves the board without wrapping
+    """
+    col = cell[0] + direction[0]
+    row = cell[1] + direction[1]
+    if wrap_around:
+        return (col % GRID_WIDTH, row % GRID_HEIGHT)
+    if 0 <= col < GRID_WIDTH and 0 <= row < GRID_HEIGHT:
+        return (col, row)
+    return None
+
+
+def cell_distance(a, b, wrap_around):
+    """Manhattan distance between two cells, going through walls when they wrap"""
+    dx = abs(a[0] - b[0])
+    dy = abs(a[1] - b[1])
+    if wrap_around:
+        dx = min(dx, GRID_WIDTH - dx)
+        dy = min(dy, GRID_HEIGHT - dy)
+    return dx + dy
+
+
+def is_safe_cell(snake, cell):
+    """Check that moving into cell next tick does not hit the snake"""
+    if cell is None:
+        return False
+    index = snake.index_of_cell(cell)
+    if not snake.occupancy[index]:
+        return True
+    # The tail moves away this tick unless the snake is growing
+    return cell == snake.body[-1] and not snake.grow_flag and snake.occupancy[index] == 1
+
+
+def legal_actions(snake):
+    """Directions the snake may turn to (every direction except straight back)"""
+    back = (-snake.direction[0], -snake.direction[1])
+    return [action for action, delta in Action.DIRECTIONS.items() if delta != back]
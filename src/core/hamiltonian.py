@@ -0,0 +1,164 @@
+"""
+Hamiltonian Cycle Solver for the Simulation Core
+Follows a cycle through every board cell, taking shortcuts when safe
+"""
+
+from array import array
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+from src.core.simulation import Action
+from src.core.grid import grid_neighbors, is_safe_cell
+
+
+def build_cycle(width, height):
+    """
+    Build a Hamiltonian cycle over a width x height grid
+    Rows are swept as a serpentine over columns 1..width-1 and column 0
+    is the way back up; the cycle never crosses an edge, so it is valid
+    with or without wrap-around.
+    Returns:
+        array: Cell indices (row * width + col) in cycle order
+    Raises:
+        ValueError: If both dimensions are odd (no cycle exists)
+    """
+    if height % 2 == 0 and width >= 2:
+        cells = []
+        for row in range(height):
+            cols = range(1, width) if row % 2 == 0 else range(width - 1, 0, -1)
+            cells.extend(row * width + col for col in cols)
+        cells.extend(row * width for row in range(height - 1, -1, -1))
+        return array('i', cells)
+    if width % 2 == 0 and height >= 2:
+        # Same construction on the transposed board
+        transposed = build_cycle(height, width)
+        return array('i', ((index % height) * width + index // height for index in transposed))
+    raise ValueError(f"No Hamiltonian cycle on a {width}x{height} board")
+
+
+def is_valid_cycle(cycle, width, height, wrap_around):
+    """Check that a cycle visits every cell once and only steps to neighbors"""
+    size = width * height
+    if len(cycle) != size or len(set(cycle)) != size or min(cycle) < 0 or max(cycle) >= size:
+        return False
+    for i, index in enumerate(cycle):
+        following = cycle[(i + 1) % size]
+        dx = abs(index % width - following % width)
+        dy = abs(index // width - following // width)
+        if wrap_around:
+            dx = min(dx, width - dx)
+            dy = min(dy, height - dy)
+        if dx + dy != 1:
+            return False
+    return True
+
+
+def cycle_cache_path(width, height, wrap_around):
+    """Cache file for one board size and wall mode"""
+    mode = "wrap" if wrap_around else "walls"
+    return os.path.join(CACHE_DIR, f"hamiltonian_{width}x{height}_{mode}.bin")
+
+
+def load_cycle(wrap_around):
+    """
+    Get the cycle for the configured board, from the disk cache when possible
+    Args:
+        wrap_around: Whether walls wrap (part of the cache key)
+    Returns:
+        array: Cell indices in cycle order
+    """
+    path = cycle_cache_path(GRID_WIDTH, GRID_HEIGHT, wrap_around)
+    try:
+        with open(path, "rb") as f:
+            cycle = array('i')
+            cycle.frombytes(f.read())
+        if is_valid_cycle(cycle, GRID_WIDTH, GRID_HEIGHT, wrap_around):
+            return cycle
+    except (OSError, ValueError):
+        pass
+
+    cycle = build_cycle(GRID_WIDTH, GRID_HEIGHT)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(cycle.tobytes())
+        os.replace(temp_path, path)  # Never leave a half-written cache
+    except OSError as e:
+        print(f"⚠️ 无法写入哈密顿回路缓存: {e}")
+    return cycle
+
+
+class HamiltonianSolver:
+    """
+    Policy that can always fill the board
+
+    The snake walks the cycle, so its body always covers a stretch of the
+    cycle that ends at the tail. A shortcut to a neighbor further along
+    the cycle is taken only if it stays behind the food and leaves a
+    margin before the tail, which keeps that invariant. Shortcuts stop
+    once the snake covers half the board, where they rarely pay off.
+    """
+
+    def __init__(self, seed=None, shortcut_limit=0.5, margin=3):
+        """
+        Initialize solver
+        Args:
+            seed: Unused; accepted so the solver fits the policy registry
+            shortcut_limit: Fraction of the board above which shortcuts stop
+            margin: Cells kept free between the head and the tail when cutting
+        """
+        self.shortcut_limit = shortcut_limit
+        self.margin = margin
+        self.wrap_around = None
+        self.cycle = None
+        self.position = None
+
+    def _prepare(self, wrap_around):
+        """Load the cycle and its reverse lookup for a wall mode"""
+        self.wrap_around = wrap_around
+        self.cycle = load_cycle(wrap_around)
+        self.position = array('i', bytes(4 * len(self.cycle)))
+        for order, index in enumerate(self.cycle):
+            self.position[index] = order
+        self.neighbors = grid_neighbors(wrap_around)
+
+    def __call__(self, core):
+        wrap_around = core.settings.wall_wrap_around
+        if self.cycle is None or wrap_around != self.wrap_around:
+            self._prepare(wrap_around)
+
+        snake = core.snake
+        size = len(self.cycle)
+        position = self.position
+        head = snake.index_of_cell(snake.head_cell)
+        head_order = position[head]
+
+        def ahead(index):
+            """Steps from the head to a cell along the cycle"""
+            return (position[index] - head_order) % size
+
+        next_index = self.cycle[(head_order + 1) % size]
+        best_index, best_distance = next_index, 1
+
+        length = len(snake.body)
+        if length < size * self.shortcut_limit:
+            tail_distance = ahead(snake.index_of_cell(snake.body[-1])) if length > 1 else size
+            limit = tail_distance - self.margin - (1 if snake.grow_flag else 0)
+            food = core.food.position
+            food_distance = ahead((food[1] // GRID_SIZE) * GRID_WIDTH + food[0] // GRID_SIZE)
+            for neighbor, _ in self.neighbors[head]:
+                distance = ahead(neighbor)
+                if best_distance < distance <= food_distance and distance < limit:
+                    cell = (neighbor % GRID_WIDTH, neighbor // GRID_WIDTH)
+                    if is_safe_cell(snake, cell):
+                        best_index, best_distance = neighbor, distance
+
+        for neighbor, action in self.neighbors[head]:
+            if neighbor == best_index:
+                return action
+        return Action.NONE
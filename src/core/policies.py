@@ -0,0 +1,98 @@
+"""
+Bot Policies for the Simulation Core
+Simple controllers that pick an Action for a SimulationCore each tick
+"""
+
+import random
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+from src.core.simulation import Action
+from src.core.grid import cell_distance, is_safe_cell, legal_actions, neighbor_cell
+from src.core.autopilot import Autopilot
+from src.core.hamiltonian import HamiltonianSolver
+from src.core.rollout_planner import RolloutPlanner
+
+
+class RandomPolicy:
+    """Turns in a random direction now and then"""
+
+    def __init__(self, seed=None, turn_chance=0.1):
+        """
+        Initialize policy
+        Args:
+            seed: Seed for the policy's own random stream
+            turn_chance: Probability of turning on a tick
+        """
+        self.rng = random.Random(seed)
+        self.turn_chance = turn_chance
+
+    def __call__(self, core):
+        if self.rng.random() < self.turn_chance:
+            return self.rng.choice(legal_actions(core.snake))
+        return Action.NONE
+
+
+class GreedyPolicy:
+    """Steps toward the food along safe cells, ignoring anything further ahead"""
+
+    def __init__(self, seed=None):
+        """
+        Initialize policy
+        Args:
+            seed: Seed used to break ties between equally good moves
+        """
+        self.rng = random.Random(seed)
+
+    def __call__(self, core):
+        snake = core.snake
+        wrap_around = core.settings.wall_wrap_around
+        head = snake.head_cell
+        food = (core.food.position[0] // GRID_SIZE, core.food.position[1] // GRID_SIZE)
+
+        best_actions = []
+        best_distance = None
+        for action in legal_actions(snake):
+            cell = neighbor_cell(head, Action.DIRECTIONS[action], wrap_around)
+            if not is_safe_cell(snake, cell):
+                continue
+            distance = cell_distance(cell, food, wrap_around)
+            if best_distance is None or distance < best_distance:
+                best_actions = [action]
+                best_distance = distance
+            elif distance == best_distance:
+                best_actions.append(action)
+
+        if not best_actions:
+            return Action.NONE  # Trapped: every move is fatal
+        return self.rng.choice(best_actions)
+
+
+# Policies by name, for the batch runner and command line
+POLICIES = {
+    "random": RandomPolicy,
+    "greedy": GreedyPolicy,
+    "autopilot": Autopilot,
+    "hamiltonian": HamiltonianSolver,
+    "rollout": RolloutPlanner,
+}
+
+
+def create_policy(name, seed=None):
+    """
+    Create a registered policy
+    Args:
+        name: Key of POLICIES
+        seed: Seed for the policy's own randomness
+    Raises:
+        ValueError: If no policy has that name
+    """
+    try:
+        policy_class = POLICIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown policy {name!r}; choose from {', '.join(POLICIES)}")
+    return policy_class(seed)
@@ -0,0 +1,225 @@
+"""
+Power-up Logic for the Simulation Core
+Pygame-free power-up spawning, collection and timed effects
+"""
+
+import random
+from enum import Enum, auto
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+from src.core.zobrist import cell_of, powerup_key
+
+
+class PowerUpType(Enum):
+    """Available power-up types"""
+    SLOW_POTION = auto()    # Reduces speed temporarily
+    SHIELD = auto()         # Protects from one death
+    DOUBLE_SCORE = auto()   # Doubles score temporarily
+
+
+class PowerUpLogic:
+    """Power-up state without any rendering"""
+
+    def __init__(self, x, y, powerup_type, spawn_time):
+        """
+        Initialize power-up
+        Args:
+            x, y: Position
+            powerup_type: PowerUpType enum value
+            spawn_time: Game time in milliseconds when spawned
+        """
+        self.x = x
+        self.y = y
+        self.type = powerup_type
+        self.active = True
+        self.spawn_time = spawn_time
+        self.lifetime = 10000  # 10 seconds before disappearing
+
+        # Type-specific properties
+        if powerup_type == PowerUpType.SLOW_POTION:
+            self.color = (100, 149, 237)  # Blue
+            self.duration = 5000  # 5 seconds
+            self.name = "Slow Potion"
+        elif powerup_type == PowerUpType.SHIELD:
+            self.color = (255, 215, 0)  # Gold
+            self.duration = 3000  # 3 seconds
+            self.name = "Shield"
+        elif powerup_type == PowerUpType.DOUBLE_SCORE:
+            self.color = (255, 20, 147)  # Pink
+            self.duration = 8000  # 8 seconds
+            self.name = "Double Score"
+
+        self.zobrist = powerup_key(powerup_type.name, cell_of((x, y)))
+
+    def update(self, current_time):
+        """Update power-up state"""
+        # Check if expired
+        if current_time - self.spawn_time > self.lifetime:
+            self.active = False
+
+    def snapshot(self):
+        """Capture the power-up as an immutable, hashable tuple"""
+        return (self.x, self.y, self.type.name, self.spawn_time, self.active)
+
+    def check_collision(self, position):
+        """Check if snake head collides with this power-up"""
+        head_x, head_y = position
+        return (abs(head_x - self.x) < GRID_SIZE and
+                abs(head_y - self.y) < GRID_SIZE)
+
+
+class PowerUpManagerLogic:
+    """Manages power-up spawning and active effects without rendering"""
+
+    # Class used for spawned power-ups; renderers override this
+    powerup_class = PowerUpLogic
+
+    def __init__(self, current_time=0, rng=None):
+        """
+        Initialize manager
+        Args:
+            current_time: Game time in milliseconds
+            rng: random.Random stream for spawning (defaults to the random module)
+        """
+        self.rng = rng or random
+        self.powerups = []
+        self.active_effects = []  # List of (type, end_time, original_value) tuples
+        self.spawn_interval = 15000  # 15 seconds between spawns
+        self.last_spawn_time = current_time
+        self.powerup_types = list(PowerUpType)
+        self.zobrist = 0  # XOR of the spawned power-ups' keys
+
+    def update(self, current_time, snake):
+        """
+        Update all power-ups and effects
+        Args:
+            current_time: Game time in milliseconds
+            snake: Snake whose free cell index is used for spawning
+        """
+        # Check if should spawn new power-up
+        if current_time - self.last_spawn_time > self.spawn_interval:
+            self.spawn_random_powerup(current_time, snake)
+            self.last_spawn_time = current_time
+
+        # Update existing power-ups
+        for powerup in self.powerups[:]:
+            powerup.update(current_time)
+            if not powerup.active:
+                self.powerups.remove(powerup)
+                self.zobrist ^= powerup.zobrist
+
+        # Expired effects are left for remove_effects(), which restores
+        # the values they changed before dropping them
+
+    def spawn_random_powerup(self, current_time, snake, attempts=8):
+        """Spawn a random power-up on a free cell away from the edges"""
+        # Random free cell (avoid edges); give up on a crowded board
+        for _ in range(attempts):
+            index = snake.free_cells.sample(self.rng)
+            if index is None:
+                return
+            col, row = index % GRID_WIDTH, index // GRID_WIDTH
+            if 2 <= col <= GRID_WIDTH - 3 and 2 <= row <= GRID_HEIGHT - 3:
+                break
+        else:
+            return
+        x = col * GRID_SIZE
+        y = row * GRID_SIZE
+
+        # Random type
+        powerup_type = self.rng.choice(self.powerup_types)
+
+        # Create and add power-up
+        powerup = self.powerup_class(x, y, powerup_type, current_time)
+        self.powerups.append(powerup)
+        self.zobrist ^= powerup.zobrist
+
+    def check_collection(self, snake_head, game, current_time):
+        """
+        Check if snake collected any power-ups
+        Returns: PowerUp object if collected, None otherwise
+        """
+        for powerup in self.powerups[:]:
+            if powerup.check_collision(snake_head):
+                # Apply effect
+                self._apply_effect(powerup, game, current_time)
+                # Remove power-up
+                self.powerups.remove(powerup)
+                self.zobrist ^= powerup.zobrist
+                return powerup
+
+        return None
+
+    def _apply_effect(self, powerup, game, current_time):
+        """Apply power-up effect to the game"""
+        end_time = current_time + powerup.duration
+
+        if powerup.type == PowerUpType.SLOW_POTION:
+            # Store original speed and reduce it
+            original_speed = game.snake.speed
+            game.snake.speed = max(5, game.snake.speed - 5)
+            self.active_effects.append((powerup.type, end_time, original_speed))
+
+        elif powerup.type == PowerUpType.SHIELD:
+            # Activate shield
+            game.shield_active = True
+            self.active_effects.append((powerup.type, end_time, None))
+
+        elif powerup.type == PowerUpType.DOUBLE_SCORE:
+            # Double score multiplier
+            game.score_multiplier = 2.0
+            self.active_effects.append((powerup.type, end_time, None))
+
+    def remove_effects(self, game, current_time):
+        """Remove expired effects from game"""
+        for effect_tuple in self.active_effects[:]:
+            effect_type, end_time, original_value = effect_tuple
+
+            if current_time > end_time:
+                # Restore original values
+                if effect_type == PowerUpType.SLOW_POTION:
+                    if original_value is not None:
+                        game.snake.speed = original_value
+                elif effect_type == PowerUpType.SHIELD:
+                    game.shield_active = False
+                elif effect_type == PowerUpType.DOUBLE_SCORE:
+                    game.score_multiplier = 1.0
+
+                self.active_effects.remove(effect_tuple)
+
+    def snapshot(self):
+        """
+        Capture spawned power-ups, active effects and the spawn timer
+        Returns:
+            tuple: Immutable, hashable state for restore()
+        """
+        return (self.last_spawn_time,
+                tuple(powerup.snapshot() for powerup in self.powerups),
+                tuple((effect_type.name, end_time, original_value)
+                      for effect_type, end_time, original_value in self.active_effects))
+
+    def restore(self, state):
+        """Restore a snapshot() result"""
+        self.last_spawn_time, powerups, effects = state
+        self.powerups = []
+        self.zobrist = 0
+        for x, y, type_name, spawn_time, active in powerups:
+            powerup = self.powerup_class(x, y, PowerUpType[type_name], spawn_time)
+            powerup.active = active
+            self.powerups.append(powerup)
+            self.zobrist ^= powerup.zobrist
+        self.active_effects = [(PowerUpType[type_name], end_time, original_value)
+                               for type_name, end_time, original_value in effects]
+
+    def clear(self, current_time=None):
+        """Clear all power-ups and effects"""
+        self.powerups.clear()
+        self.active_effects.clear()
+        self.zobrist = 0
+        if current_time is not None:
+            self.last_spawn_time = current_time
@@ -0,0 +1,434 @@
+"""
+Replay Recording for the Simulation Core
+Compact binary log of the seed, difficulty and per-tick inputs of a game,
+with optional full-state keyframes for seeking and headless playback
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import struct
+import time
+import zlib
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+from src.core.difficulty import DIFFICULTY_PRESETS, DifficultyLevel
+from src.core.simulation import SimulationCore, Action
+
+
+REPLAY_MAGIC = b"SNKR"
+REPLAY_VERSION = 3  # 3: spawns no longer depend on free-cell history
+INDEX_MAGIC = b"SNKI"
+TRAILER = struct.Struct("<I4s")  # Index offset, INDEX_MAGIC
+
+# File layout (all integers are LEB128 varints unless noted):
+#   magic, version byte, zigzag(seed), len(difficulty), difficulty (utf-8)
+#   input records: tick delta since the previous input, action byte
+#   0 (tick deltas are never 0, so this ends the inputs)
+#   result: final tick, final score, won flag byte
+#   keyframes (none unless recorded with a keyframe interval): zlib-compressed encode_value(core.snapshot()) blobs
+#   index: keyframe interval, count, then (tick, offset, length) per keyframe
+#   trailer: little-endian uint32 index offset, INDEX_MAGIC
+# Ticks without input are not stored, so an idle minute costs nothing.
+
+
+def write_varint(buffer, value):
+    """Append an unsigned integer to a bytearray as a LEB128 varint"""
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data, offset):
+    """
+    Read a LEB128 varint
+    Returns:
+        tuple: (value, offset just past the varint)
+    """
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated replay data")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def zigzag(value):
+    """Map a signed integer to an unsigned one (0, -1, 1, -2 -> 0, 1, 2, 3)"""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value):
+    """Inverse of zigzag()"""
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def encode_value(value, buffer=None):
+    """
+    Encode nested tuples of None, bool, int, float, str and bytes
+    Unlike pickle, decoding never runs code, so submitted files are safe
+    Returns:
+        bytearray: The encoded value
+    """
+    if buffer is None:
+        buffer = bytearray()
+    if value is None:
+        buffer += b"N"
+    elif value is True:
+        buffer += b"T"
+    elif value is False:
+        buffer += b"F"
+    elif isinstance(value, int):
+        buffer += b"i"
+        write_varint(buffer, zigzag(value))
+    elif isinstance(value, float):
+        buffer += b"f"
+        buffer += struct.pack("<d", value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        buffer += b"s"
+        write_varint(buffer, len(data))
+        buffer += data
+    elif isinstance(value, bytes):
+        buffer += b"b"
+        write_varint(buffer, len(value))
+        buffer += value
+    elif isinstance(value, tuple):
+        buffer += b"t"
+        write_varint(buffer, len(value))
+        for item in value:
+            encode_value(item, buffer)
+    else:
+        raise TypeError(f"Cannot encode {type(value).__name__} in a keyframe")
+    return buffer
+
+
+def decode_value(data, offset=0):
+    """
+    Decode a value written by encode_value()
+    Returns:
+        tuple: (value, offset just past the value)
+    """
+    if offset >= len(data):
+        raise ValueError("Truncated replay data")
+    tag = data[offset:offset + 1]
+    offset += 1
+    if tag == b"N":
+        return None, offset
+    if tag == b"T":
+        return True, offset
+    if tag == b"F":
+        return False, offset
+    if tag == b"i":
+        value, offset = read_varint(data, offset)
+        return unzigzag(value), offset
+    if tag == b"f":
+        if offset + 8 > len(data):
+            raise ValueError("Truncated replay data")
+        return struct.unpack_from("<d", data, offset)[0], offset + 8
+    if tag == b"s":
+        length, offset = read_varint(data, offset)
+        return bytes(data[offset:offset + length]).decode("utf-8"), offset + length
+    if tag == b"b":
+        length, offset = read_varint(data, offset)
+        if offset + length > len(data):
+            raise ValueError("Truncated replay data")
+        return bytes(data[offset:offset + length]), offset + length
+    if tag == b"t":
+        length, offset = read_varint(data, offset)
+        items = []
+        for _ in range(length):
+            item, offset = decode_value(data, offset)
+            items.append(item)
+        return tuple(items), offset
+    raise ValueError(f"Unknown keyframe tag {tag!r}")
+
+
+class ReplayRecorder:
+    """Collects the inputs of one game into the binary replay format"""
+
+    def __init__(self, seed, difficulty, keyframe_interval=REPLAY_KEYFRAME_INTERVAL):
+        """
+        Initialize recorder
+        Args:
+            seed: Integer session seed of the recorded game
+            difficulty: DifficultyLevel value string ("easy", "medium", "hard")
+            keyframe_interval: Ticks between keyframes (0 disables keyframes; each
+                               costs several KB, mostly random generator state)
+        """
+        self.seed = seed
+        self.difficulty = difficulty
+        self.keyframe_interval = keyframe_interval
+        self.inputs = bytearray()
+        self.last_input_tick = 0
+        self.keyframes = []  # (tick, compressed state) pairs
+        self.result = None  # (ticks, score, won) once the game has ended
+
+    def record(self, tick, action, core=None):
+        """
+        Log the action applied on a tick
+        Args:
+            tick: Tick number the action was applied on (1 for the first step)
+            action: Action value passed to SimulationCore.step()
+            core: Core after the step; a keyframe is taken from it every
+                  keyframe_interval ticks
+        """
+        if action != Action.NONE:
+            write_varint(self.inputs, tick - self.last_input_tick)
+            self.inputs.append(action)
+            self.last_input_tick = tick
+
+        if core is not None and self.keyframe_interval and tick % self.keyframe_interval == 0:
+            state = encode_value(core.snapshot())
+            self.keyframes.append((tick, zlib.compress(bytes(state))))
+
+    def finish(self, ticks, score, won=False):
+        """Store the final result the replay must reproduce"""
+        self.result = (ticks, score, won)
+
+    def to_bytes(self):
+        """
+        Encode the replay
+        Returns:
+            bytes: Complete replay file contents
+        """
+        if self.result is None:
+            raise ValueError("Replay has no result; call finish() first")
+
+        data = bytearray(REPLAY_MAGIC)
+        data.append(REPLAY_VERSION)
+        write_varint(data, zigzag(self.seed))
+        difficulty = self.difficulty.encode("utf-8")
+        write_varint(data, len(difficulty))
+        data += difficulty
+
+        data += self.inputs
+        write_varint(data, 0)
+
+        ticks, score, won = self.result
+        write_varint(data, ticks)
+        write_varint(data, score)
+        data.append(1 if won else 0)
+
+        index = []
+        for tick, blob in self.keyframes:
+            index.append((tick, len(data), len(blob)))
+            data += blob
+
+        index_offset = len(data)
+        write_varint(data, self.keyframe_interval)
+        write_varint(data, len(index))
+        for tick, offset, length in index:
+            write_varint(data, tick)
+            write_varint(data, offset)
+            write_varint(data, length)
+        data += TRAILER.pack(index_offset, INDEX_MAGIC)
+        return bytes(data)
+
+    def save(self, path):
+        """Write the replay to a file"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+@dataclass
+class Replay:
+    """A decoded replay file"""
+    seed: int
+    difficulty: str
+    ticks: int
+    score: int
+    won: bool
+    inputs: list = field(default_factory=list)  # (tick, action) for every non-idle tick
+    keyframe_interval: int = 0
+    keyframes: list = field(default_factory=list)  # (tick, offset, length) into data
+    data: bytes = field(default=b"", repr=False)
+    states: dict = field(default_factory=dict, repr=False)  # Tick -> decoded keyframe state
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Decode replay file contents (keyframes stay encoded until seek())
+        Raises:
+            ValueError: If the data is not a supported replay
+        """
+        if data[:len(REPLAY_MAGIC)] != REPLAY_MAGIC:
+            raise ValueError("Not a snake replay file")
+        offset = len(REPLAY_MAGIC)
+        if offset >= len(data) or data[offset] != REPLAY_VERSION:
+            raise ValueError("Unsupported replay version (recorded by another game version)")
+        offset += 1
+
+        seed, offset = read_varint(data, offset)
+        length, offset = read_varint(data, offset)
+        difficulty = bytes(data[offset:offset + length]).decode("utf-8")
+        offset += length
+
+        inputs = []
+        tick = 0
+        while True:
+            delta, offset = read_varint(data, offset)
+            if delta == 0:
+                break
+            if offset >= len(data):
+                raise ValueError("Truncated replay data")
+            tick += delta
+            inputs.append((tick, data[offset]))
+            offset += 1
+
+        ticks, offset = read_varint(data, offset)
+        score, offset = read_varint(data, offset)
+        if offset >= len(data):
+            raise ValueError("Truncated replay data")
+        won = bool(data[offset])
+        if ticks > REPLAY_MAX_TICKS:
+            raise ValueError(f"Replay is too long ({ticks} ticks, limit {REPLAY_MAX_TICKS})")
+        replay = cls(unzigzag(seed), difficulty, ticks, score, won, inputs, data=bytes(data))
+
+        if len(data) < TRAILER.size:
+            raise ValueError("Truncated replay data")
+        index_offset, magic = TRAILER.unpack_from(data, len(data) - TRAILER.size)
+        if magic != INDEX_MAGIC:
+            raise ValueError("Missing replay keyframe index")
+        replay.keyframe_interval, offset = read_varint(data, index_offset)
+        count, offset = read_varint(data, offset)
+        for _ in range(count):
+            tick, offset = read_varint(data, offset)
+            start, offset = read_varint(data, offset)
+            length, offset = read_varint(data, offset)
+            replay.keyframes.append((tick, start, length))
+
+        return replay
+
+    @classmethod
+    def load(cls, path):
+        """Read and decode a replay file"""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def actions(self, start_tick=1, end_tick=None):
+        """
+        Yield the action for every recorded tick in order
+        Args:
+            start_tick: First tick to yield
+            end_tick: Last tick to yield (defaults to the final tick)
+        Returns:
+            generator: One Action value per tick, ticks start_tick..end_tick
+        """
+        if end_tick is None:
+            end_tick = self.ticks
+        position = bisect_left(self.inputs, (start_tick, -1))
+        for tick in range(start_tick, end_tick + 1):
+            if position < len(self.inputs) and self.inputs[position][0] == tick:
+                yield self.inputs[position][1]
+                position += 1
+            else:
+                yield Action.NONE
+
+    def new_core(self, **kwargs):
+        """Create a fresh SimulationCore with this replay's seed and difficulty"""
+        settings = DIFFICULTY_PRESETS[DifficultyLevel(self.difficulty)]
+        return SimulationCore(settings, seed=self.seed, **kwargs)
+
+    def build_keyframes(self, interval=1200):
+        """
+        Index a replay for seeking by simulating its inputs once
+        The keyframes are kept in memory, so files can be saved without them
+        Args:
+            interval: Ticks between keyframes
+        """
+        core = self.new_core()
+        self.keyframe_interval = interval
+        self.keyframes = []
+        self.states = {}
+        for tick, action in enumerate(self.actions(1, self.ticks - self.ticks % interval), 1):
+            core.step(action)
+            if tick % interval == 0:
+                self.keyframes.append((tick, None, None))
+                self.states[tick] = core.snapshot()
+
+    def keyframe_state(self, keyframe):
+        """Decode a keyframe from the file data (once) into a snapshot() state"""
+        tick, offset, length = keyframe
+        state = self.states.get(tick)
+        if state is None:
+            state, _ = decode_value(zlib.decompress(self.data[offset:offset + length]))
+            self.states[tick] = state
+        return state
+
+    def keyframe_before(self, tick):
+        """
+        Find the latest keyframe at or before a tick
+        Keyframes are evenly spaced, so this is an index computation
+        Returns:
+            tuple: (tick, offset, length), or None if no keyframe qualifies
+        """
+        if not self.keyframes or not self.keyframe_interval:
+            return None
+        position = min(tick // self.keyframe_interval, len(self.keyframes)) - 1
+        if position < 0:
+            return None
+        return self.keyframes[position]
+
+    def seek(self, tick, core=None):
+        """
+        Get the game state after a given tick
+        Loads the nearest earlier keyframe and re-simulates only the rest
+        Args:
+            tick: Target tick (0 is the initial state)
+            core: Core to restore into (a new headless core by default)
+        Returns:
+            SimulationCore: Core positioned at the tick
+        """
+        tick = max(0, min(tick, self.ticks))
+        if core is None:
+            core = self.new_core()
+        keyframe = self.keyframe_before(tick)
+        start_tick = 1
+        if keyframe is not None:
+            core.restore(self.keyframe_state(keyframe))
+            start_tick = keyframe[0] + 1
+        for action in self.actions(start_tick, tick):
+            core.step(action)
+        return core
+
+
+def simulate_replay(replay, speed=None):
+    """
+    Re-simulate a replay headlessly
+    Args:
+        replay: Replay to play back
+        speed: Playback rate relative to real time (2.0 = twice as fast),
+               or None to run as fast as the CPU allows
+    Returns:
+        SimulationCore: The core after the last recorded tick, or after the
+                        tick the game ended on if that came first
+    Raises:
+        ValueError: If the replay names an unknown difficulty
+    """
+    core = replay.new_core()
+    next_tick_time = time.perf_counter()
+    for action in replay.actions():
+        if core.game_over:
+            break  # Any recorded ticks left over make the result mismatch
+        if speed is not None:
+            # Pace ticks at the snake speed scaled by the playback rate
+            next_tick_time += 1.0 / (core.snake.speed * speed)
+            delay = next_tick_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        core.step(action)
+    return core
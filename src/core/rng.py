@@ -0,0 +1,34 @@
+"""
+Seeded Random Streams for Snake Game
+Separate generators for gameplay and cosmetic randomness
+"""
+
+import random
+
+
+class RandomStreams:
+    """
+    Independent random.Random streams derived from one session seed
+
+    Gameplay streams (food, powerups) decide the outcome of a run and
+    are the only ones the simulation core uses. The cosmetic stream
+    feeds particles, explosions and screen shake, so headless and replay
+    runs can skip visual effects without changing any result.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initialize streams
+        Args:
+            seed: Session seed (int); a random one is chosen when None
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.food = self._derive("food")
+        self.powerups = self._derive("powerups")
+        self.cosmetic = self._derive("cosmetic")
+
+    def _derive(self, name):
+        """Create the stream for one subsystem (string seeds hash stably)"""
+        return random.Random(f"{self.seed}:{name}")
@@ -0,0 +1,268 @@
+"""
+Monte-Carlo Rollout Planner for the Simulation Core
+UCT search over cloned game states within a time budget per move
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import math
+import random
+import time
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+from src.core.simulation import Action, SimEvent, SimulationCore
+from src.core.grid import cell_distance, is_safe_cell, legal_actions, neighbor_cell
+from src.core.zobrist import shared_table
+
+
+def safe_actions(core):
+    """Legal moves whose next cell does not hit the snake or a wall"""
+    snake = core.snake
+    wrap_around = core.settings.wall_wrap_around
+    return [action for action in legal_actions(snake)
+            if is_safe_cell(snake, neighbor_cell(snake.head_cell, Action.DIRECTIONS[action], wrap_around))]
+
+
+def rollout_action(core, rng, epsilon):
+    """
+    Pick a rollout move: usually the safe move closest to the food,
+    sometimes (with probability epsilon) a random safe one
+    """
+    actions = safe_actions(core)
+    if not actions:
+        return Action.NONE  # Trapped: every move is fatal
+    if len(actions) == 1 or rng.random() < epsilon:
+        return rng.choice(actions)
+    snake = core.snake
+    wrap_around = core.settings.wall_wrap_around
+    food = (core.food.position[0] // GRID_SIZE, core.food.position[1] // GRID_SIZE)
+    return min(actions, key=lambda action: cell_distance(
+        neighbor_cell(snake.head_cell, Action.DIRECTIONS[action], wrap_around), food, wrap_around))
+
+
+class RolloutPlanner:
+    """
+    Policy choosing each move by Monte-Carlo tree search
+
+    Every iteration restores the position into one scratch SimulationCore
+    (restore() refills the existing buffers, so a clone costs a few copies
+    of the body and occupancy bytes), walks down the tree by UCB1, adds
+    one node and plays a short epsilon-greedy rollout from it. Tree nodes
+    live in a transposition table keyed by SimulationCore.state_hash(),
+    one table per difficulty since the hash covers only the board, so
+    positions reached by different move orders share statistics and the
+    subtree under the move played is reused on the next tick.
+
+    Search stops when the time budget or the iteration limit runs out.
+    With workers > 1 and a budget of at least parallel_threshold seconds,
+    each worker process searches the same position with its own tree and
+    the move counts are added up.
+    """
+
+    def __init__(self, seed=None, time_budget=PLANNER_TIME_BUDGET, max_iterations=None,
+                 rollout_depth=10, tree_depth=10, exploration=1.0, discount=0.95, epsilon=0.1,
+                 death_penalty=10.0, workers=1, parallel_threshold=0.05, table=None):
+        """
+        Initialize planner
+        Args:
+            seed: Seed for rollout and tie-breaking randomness
+            time_budget: Seconds to search per move (no limit when None)
+            max_iterations: Iterations per move (no limit when None)
+            rollout_depth: Ticks played by each rollout past the tree
+            tree_depth: Deepest walk down the tree (hashes ignore timers, so
+                        a short snake can revisit a node and loop)
+            exploration: UCB1 exploration constant
+            discount: Per-tick discount of future rewards
+            epsilon: Chance of a random rollout move instead of a greedy one
+            death_penalty: Negative reward for dying
+            workers: Processes to search with when the budget allows
+            parallel_threshold: Smallest time budget worth a process round trip
+            table: TranspositionTable for tree nodes, used for one difficulty only
+                   (by default each difficulty searched uses its shared table)
+        """
+        if time_budget is None and max_iterations is None:
+            raise ValueError("RolloutPlanner needs a time budget or an iteration limit")
+        self.rng = random.Random(seed)
+        self.time_budget = time_budget
+        self.max_iterations = max_iterations
+        self.rollout_depth = rollout_depth
+        self.tree_depth = tree_depth
+        self.exploration = exploration
+        self.discount = discount
+        self.epsilon = epsilon
+        self.death_penalty = death_penalty
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        self.fixed_table = table
+        self.table = table     # Table of the position being searched
+        self.scratch = None    # SimulationCore every iteration is restored into
+        self.executor = None   # Worker pool, started on the first parallel search
+        self.iterations = 0    # Iterations spent on the last move
+
+    def __call__(self, core):
+        actions = safe_actions(core)
+        if len(actions) <= 1:
+            return actions[0] if actions else Action.NONE
+
+        root = core.snapshot()
+        if (self.workers > 1 and self.time_budget is not None
+                and self.time_budget >= self.parallel_threshold):
+            edges = self.search_parallel(core.settings, root)
+        else:
+            edges = self.search(core.settings, root)
+
+        # Play the most visited move; mean value breaks ties
+        def rank(action):
+            visits, total = edges.get(action, (0, 0.0))
+            return (visits, total / visits if visits else 0.0)
+        return max(actions, key=rank)
+
+    def search(self, settings, root):
+        """
+        Search a snapshot() position in this process
+        Returns:
+            dict: Root move -> [visits, total value]
+        """
+        if self.scratch is None or self.scratch.settings != settings:
+            self.scratch = SimulationCore(settings)
+        if self.fixed_table is None:
+            self.table = shared_table(settings)
+        scratch = self.scratch
+        scratch.restore(root)
+        root_hash = scratch.state_hash()
+
+        start = time.perf_counter()
+        iterations = 0
+        while True:
+            scratch.restore(root)
+            self.iterate(scratch, root_hash)
+            iterations += 1
+            if self.max_iterations is not None and iterations >= self.max_iterations:
+                break
+            if self.time_budget is not None and time.perf_counter() - start >= self.time_budget:
+                break
+        self.iterations = iterations
+        return self.table.get(root_hash, {})
+
+    def search_parallel(self, settings, root):
+        """Search a position in every worker process and add up the root statistics"""
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        options = self.worker_options()
+        futures = [self.executor.submit(_search_in_worker, options, settings, root,
+                                        self.rng.getrandbits(32))
+                   for _ in range(self.workers)]
+        edges = {}
+        self.iterations = 0
+        for future in futures:
+            worker_edges, iterations = future.result()
+            self.iterations += iterations
+            for action, (visits, total) in worker_edges.items():
+                stat = edges.setdefault(action, [0, 0.0])
+                stat[0] += visits
+                stat[1] += total
+        return edges
+
+    def worker_options(self):
+        """Settings for the planners run inside worker processes"""
+        return (self.time_budget, self.max_iterations, self.rollout_depth, self.tree_depth,
+                self.exploration,
+                self.discount, self.epsilon, self.death_penalty)
+
+    def close(self):
+        """Shut down the worker pool, if one was started"""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def iterate(self, scratch, root_hash):
+        """Run one select, expand, rollout and backup pass from the root"""
+        table = self.table
+        path = []  # (node statistics, move, reward) down the tree
+        node_hash = root_hash
+        game_over = False
+        while True:
+            edges = table.get(node_hash)
+            if edges is None:
+                # New leaf: add it and estimate its value with a rollout
+                actions = safe_actions(scratch) or legal_actions(scratch.snake)
+                table.store(node_hash, {action: [0, 0.0] for action in actions})
+                break
+            action = self.select(edges)
+            reward, game_over = self.advance(scratch, action)
+            path.append((edges, action, reward))
+            if game_over or len(path) >= self.tree_depth:
+                break
+            node_hash = scratch.state_hash()
+
+        value = 0.0 if game_over else self.rollout(scratch)
+        for edges, action, reward in reversed(path):
+            value = reward + self.discount * value
+            stat = edges[action]
+            stat[0] += 1
+            stat[1] += value
+
+    def select(self, edges):
+        """Pick the move with the best UCB1 score, trying unvisited moves first"""
+        log_visits = math.log(max(1, sum(visits for visits, _ in edges.values())))
+        best_action = None
+        best_score = -math.inf
+        for action, (visits, total) in edges.items():
+            if visits == 0:
+                return action
+            score = total / visits + self.exploration * math.sqrt(log_visits / visits)
+            if score > best_score:
+                best_action = action
+                best_score = score
+        return best_action
+
+    def advance(self, core, action):
+        """
+        Step a core and score the tick
+        Returns:
+            tuple: (reward, game over)
+        """
+        result = core.step(action)
+        reward = 0.0
+        for event in result.events:
+            if event.kind == SimEvent.ATE:
+                reward += 1.0
+            elif event.kind == SimEvent.DIED:
+                reward -= self.death_penalty
+        return reward, result.game_over
+
+    def rollout(self, core):
+        """
+        Play epsilon-greedy moves for rollout_depth ticks
+        Returns:
+            float: Discounted reward, plus a small bonus for ending near the food
+        """
+        value = 0.0
+        weight = 1.0
+        for _ in range(self.rollout_depth):
+            reward, game_over = self.advance(core, rollout_action(core, self.rng, self.epsilon))
+            value += weight * reward
+            weight *= self.discount
+            if game_over:
+                return value
+        food = (core.food.position[0] // GRID_SIZE, core.food.position[1] // GRID_SIZE)
+        distance = cell_distance(core.snake.head_cell, food, core.settings.wall_wrap_around)
+        return value + weight / (1 + distance)
+
+
+_worker_planners = {}
+
+
+def _search_in_worker(options, settings, root, seed):
+    """Worker entry point: search a position with this process's planner"""
+    planner = _worker_planners.get(options)
+    if planner is None:
+        planner = RolloutPlanner(None, *options)
+        _worker_planners[options] = planner
+    planner.rng.seed(seed)
+    edges = planner.search(settings, root)
+    return {action: tuple(stat) for action, stat in edges.items()}, planner.iterations
@@ -0,0 +1,307 @@
+"""
+Headless Simulation Core for Snake Game
+Advances the game rules one tick at a time without pygame, sound or a display
+"""
+
+from dataclasses import dataclass, field
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+from src.core.snake_logic import SnakeLogic, SnakeExpression
+from src.core.food_logic import FoodLogic
+from src.core.bomb_logic import BombLogic
+from src.core.powerup_logic import PowerUpManagerLogic
+from src.core.rng import RandomStreams
+from src.core.clock import GameClock
+from src.core.danger import DangerAnalyzer
+from src.core.zobrist import BOMB_KEYS, cell_of
+
+
+class Action:
+    """Integer-encoded player input for a single tick"""
+    NONE = 0
+    UP = 1
+    DOWN = 2
+    LEFT = 3
+    RIGHT = 4
+    BOMB = 8        # Flag, may be combined with a direction: Action.UP | Action.BOMB
+
+    DIRECTION_MASK = 7
+
+    DIRECTIONS = {
+        UP: (0, -1),
+        DOWN: (0, 1),
+        LEFT: (-1, 0),
+        RIGHT: (1, 0),
+    }
+
+    @staticmethod
+    def from_direction(direction):
+        """Get the action for a (dx, dy) direction"""
+        for action, delta in Action.DIRECTIONS.items():
+            if delta == direction:
+                return action
+        return Action.NONE
+
+
+class SimEvent:
+    """Event kinds reported by SimulationCore.step()"""
+    ATE = "ate"                              # value: points scored
+    DIED = "died"                            # value: "wall", "self" or "bomb"
+    SHIELD_BROKEN = "shield_broken"
+    POWERUP_COLLECTED = "powerup_collected"  # value: collected power-up
+    BOMB_PLACED = "bomb_placed"
+    BOMB_EXPLODED = "bomb_exploded"
+    BOMB_REPLENISHED = "bomb_replenished"
+    BOARD_FULL = "board_full"                # The snake covers every cell: a win
+
+
+@dataclass
+class Event:
+    """A single thing that happened during a tick"""
+    kind: str
+    position: tuple = None
+    value: object = None
+
+
+@dataclass
+class StepResult:
+    """Outcome of advancing the simulation by one tick"""
+    tick: int
+    score: int
+    game_over: bool
+    events: list = field(default_factory=list)
+
+
+class SimulationCore:
+    """Pure game rules: snake, food, power-ups, bombs and scoring"""
+
+    def __init__(self, settings, seed=None, snake=None, food=None, powerups=None,
+                 bomb_factory=BombLogic, clock=None, max_bombs=3, analyze_danger=False):
+        """
+        Initialize a new game
+        Args:
+            settings: DifficultySettings for this game
+            seed: Session seed; the same seed and inputs replay the same game
+            snake: Snake object to drive (defaults to a headless SnakeLogic)
+            food: Food object to drive (defaults to a headless FoodLogic)
+            powerups: Power-up manager (defaults to a headless PowerUpManagerLogic)
+            bomb_factory: Callable creating a bomb at (x, y)
+            clock: GameClock driving all gameplay timers (a fresh one by default)
+            max_bombs: Bomb capacity when bombs are enabled
+            analyze_danger: Run the reachable-space check behind the WORRIED
+                            expression (off by default: it is cosmetic, so
+                            only the rendered game turns it on)
+        """
+        self.settings = settings
+        self.clock = clock if clock is not None else GameClock()
+        self.rng = RandomStreams(seed)
+        self.seed = self.rng.seed
+
+        self.snake = snake if snake is not None else SnakeLogic(100, 100)
+        self.snake.speed = settings.initial_speed
+
+        # Gameplay randomness only ever comes from the seeded streams
+        self.food = food if food is not None else FoodLogic()
+        self.food.rng = self.rng.food
+        self.food.respawn(self.snake)
+
+        now = self.clock()
+        self.powerups = powerups if powerups is not None else PowerUpManagerLogic(now)
+        self.powerups.rng = self.rng.powerups
+        self.powerups.clear(now)
+
+        self.bomb_factory = bomb_factory
+        self.bombs = []
+        self.max_bombs = max_bombs
+        self.bombs_available = max_bombs if settings.bomb_enabled else 0
+        self.bomb_cooldown = 0
+
+        self.score = 0
+        self.score_multiplier = 1.0  # For double score power-up
+        self.shield_active = False   # For shield power-up
+        self.tick = 0
+        self.game_over = False
+        self.won = False
+        self.last_eat_time = now
+        self.danger = DangerAnalyzer() if analyze_danger else None
+
+    def step(self, action=Action.NONE):
+        """
+        Advance the game by exactly one tick
+        Args:
+            action: Action value, a direction optionally combined with Action.BOMB
+        Returns:
+            StepResult with the new score, game-over flag and tick events
+        """
+        events = []
+        if self.game_over:
+            return StepResult(self.tick, self.score, True, events)
+
+        self.tick += 1
+        # Game time advances by one tick at the speed this tick runs at
+        now = self.clock.advance_tick(self.snake.speed)
+
+        # Apply player input
+        direction = Action.DIRECTIONS.get(action & Action.DIRECTION_MASK)
+        if direction is not None:
+            self.snake.change_direction(direction)
+        if action & Action.BOMB:
+            self.place_bomb(events)
+
+        self.snake.move()
+        self.snake.update_expression()
+
+        # Check collisions with wall wrapping support
+        wall_collision = self.snake.check_wall_collision(self.settings.wall_wrap_around)
+        self_collision = self.snake.check_self_collision()
+
+        if wall_collision or self_collision:
+            head = self.snake.positions[0]
+            if self.shield_active:
+                # Shield protects once
+                self.shield_active = False
+                if self.danger is not None:
+                    self.danger.reset()
+                events.append(Event(SimEvent.SHIELD_BROKEN, head))
+            else:
+                cause = "wall" if wall_collision else "self"
+                return self._finish(events, Event(SimEvent.DIED, head, cause))
+
+        self.update_bombs(events)
+        if self.game_over:
+            return StepResult(self.tick, self.score, True, events)
+
+        # Power-ups: spawn/expire, collect, then drop expired effects
+        self.powerups.update(now, self.snake)
+        collected = self.powerups.check_collection(self.snake.positions[0], self, now)
+        if collected:
+            events.append(Event(SimEvent.POWERUP_COLLECTED, (collected.x, collected.y), collected))
+        self.powerups.remove_effects(self, now)
+
+        # Check if food is eaten
+        if self.snake.positions[0] == self.food.position:
+            self.snake.grow()
+            points = int(SCORE_PER_FOOD * self.score_multiplier * self.settings.score_multiplier)
+            self.score += points
+            events.append(Event(SimEvent.ATE, self.food.position, points))
+            self.last_eat_time = now
+            if not self.food.respawn(self.snake):
+                # No free cell left for food: the board is full
+                self.won = True
+                return self._finish(events, Event(SimEvent.BOARD_FULL, self.snake.positions[0]))
+        elif now - self.last_eat_time > 2000:
+            # Reset combo after not eating for 2 seconds
+            self.snake.reset_combo()
+            self.last_eat_time = now
+
+        # Look worried while boxed in or about to be caught by a blast
+        if self.danger is not None and self.danger.in_danger(self):
+            self.snake.set_expression(SnakeExpression.WORRIED, 5)
+
+        return StepResult(self.tick, self.score, False, events)
+
+    def state_hash(self):
+        """
+        Zobrist hash of the board: snake cells, head, direction and growth,
+        food, power-ups and bomb cells
+        Timers, score and random streams are not part of it, so equal
+        hashes mean the same layout rather than identical snapshots.
+        Returns:
+            int: 64-bit hash, O(1) apart from the (few) live bombs
+        """
+        value = self.snake.zobrist ^ self.food.zobrist ^ self.powerups.zobrist
+        for bomb in self.bombs:
+            value ^= BOMB_KEYS[cell_of((bomb.x, bomb.y))]
+        return value
+
+    def snapshot(self):
+        """
+        Capture everything that decides the rest of the game
+        The result is nested tuples of plain values (immutable and hashable)
+        and includes the gameplay random streams, so restoring it and
+        stepping the same actions reproduces the same game.
+        Returns:
+            tuple: State for restore()
+        """
+        return (
+            self.tick, self.clock(), self.score, self.score_multiplier,
+            self.shield_active, self.game_over, self.won, self.last_eat_time,
+            self.bombs_available, self.bomb_cooldown,
+            self.snake.snapshot(),
+            self.food.snapshot(),
+            self.powerups.snapshot(),
+            tuple(bomb.snapshot() for bomb in self.bombs),
+            self.rng.food.getstate(),
+            self.rng.powerups.getstate(),
+        )
+
+    def restore(self, state):
+        """
+        Restore a snapshot() result
+        The core must use the same settings; bombs are rebuilt with bomb_factory
+        """
+        (self.tick, clock_ms, self.score, self.score_multiplier,
+         self.shield_active, self.game_over, self.won, self.last_eat_time,
+         self.bombs_available, self.bomb_cooldown,
+         snake_state, food_state, powerup_state, bomb_states,
+         food_rng, powerup_rng) = state
+        self.clock.reset(clock_ms)
+        self.snake.restore(snake_state)
+        self.food.restore(food_state)
+        self.powerups.restore(powerup_state)
+
+        self.bombs = []
+        for bomb_state in bomb_states:
+            bomb = self.bomb_factory(bomb_state[0], bomb_state[1])
+            bomb.restore(bomb_state)
+            self.bombs.append(bomb)
+
+        self.rng.food.setstate(food_rng)
+        self.rng.powerups.setstate(powerup_rng)
+        if self.danger is not None:
+            self.danger.reset()
+
+    def place_bomb(self, events):
+        """Place a bomb at snake's head position"""
+        if self.bombs_available > 0 and self.bomb_cooldown <= 0:
+            head_x, head_y = self.snake.positions[0]
+            self.bombs.append(self.bomb_factory(head_x, head_y))
+            self.bombs_available -= 1
+            self.bomb_cooldown = 30
+            events.append(Event(SimEvent.BOMB_PLACED, (head_x, head_y), self.bombs_available))
+
+    def update_bombs(self, events):
+        """Advance all active bombs and apply blast damage"""
+        if self.bomb_cooldown > 0:
+            self.bomb_cooldown -= 1
+
+        for bomb in self.bombs[:]:
+            bomb.update()
+
+            if bomb.exploded and bomb.explosion_timer == 1:
+                events.append(Event(SimEvent.BOMB_EXPLODED, (bomb.x, bomb.y)))
+
+            # Check if bomb explosion hits snake (only cells inside the blast are checked)
+            if bomb.exploded and bomb.explosion_timer < 10 and not self.game_over:
+                segment = self.snake.find_segment_near(bomb.x, bomb.y, bomb.explosion_radius + 5)
+                if segment is not None:
+                    self._finish(events, Event(SimEvent.DIED, segment, "bomb"))
+
+            # Remove inactive bombs
+            if not bomb.active:
+                self.bombs.remove(bomb)
+                # Replenish bomb if it exploded naturally
+                if bomb.exploded and self.bombs_available < self.max_bombs:
+                    self.bombs_available += 1
+                    events.append(Event(SimEvent.BOMB_REPLENISHED, (bomb.x, bomb.y), self.bombs_available))
+
+    def _finish(self, events, death_event):
+        """End the game with the given death event"""
+        self.game_over = True
+        events.append(death_event)
+        return StepResult(self.tick, self.score, True, events)
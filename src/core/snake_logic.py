@@ -0,0 +1,273 @@
+"""
+Snake Logic for the Simulation Core
+Pygame-free snake movement, growth, expressions and collision rules
+"""
+
+from collections import deque
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+from src.core.free_cells import FreeCellIndex
+from src.core.zobrist import BODY_KEYS, DIRECTION_KEYS, GROW_KEY, HEAD_KEYS
+
+
+class SnakeExpression:
+    """Snake facial expressions"""
+    NORMAL = "normal"
+    HAPPY = "happy"      # Just ate food
+    EXCITED = "excited"  # Combo eating
+    WORRIED = "worried"  # Near danger
+
+
+class BodyView:
+    """Read-only pixel view of the snake body, head first, without copying"""
+
+    def __init__(self, body):
+        self._body = body
+
+    def __len__(self):
+        return len(self._body)
+
+    def __getitem__(self, index):
+        # Indexing the ends (0 and -1) is O(1) on the underlying deque
+        col, row = self._body[index]
+        return (col * GRID_SIZE, row * GRID_SIZE)
+
+    def __iter__(self):
+        for col, row in self._body:
+            yield (col * GRID_SIZE, row * GRID_SIZE)
+
+
+class SnakeLogic:
+    """Snake state and rules without any rendering"""
+
+    def __init__(self, start_x, start_y):
+        """
+        Initialize snake
+        Args:
+            start_x: starting x coordinate
+            start_y: starting y coordinate
+        """
+        start_cell = (start_x // GRID_SIZE, start_y // GRID_SIZE)
+
+        # Body as grid cells, head on the left: O(1) head push and tail pop
+        self.body = deque([start_cell])
+        self.positions = BodyView(self.body)  # Pixel positions for rendering
+        self.previous_tail = start_cell  # Tail cell before the last move
+
+        # Segments per board cell, kept in step with every move and growth,
+        # so collision and spawn checks never scan the body
+        self.occupancy = bytearray(GRID_WIDTH * GRID_HEIGHT)
+        self.free_cells = FreeCellIndex(self.occupancy, GRID_WIDTH)
+        # Zobrist hash of the covered cells, head, direction and growth flag,
+        # updated alongside the occupancy grid
+        self.zobrist = 0
+        self._occupy(start_cell)
+        self.direction = (1, 0)  # Initial direction: right
+        self.zobrist ^= self._head_key(start_cell) ^ DIRECTION_KEYS[self.direction]
+        self.grow_flag = False  # Growth flag
+        self.speed = SNAKE_INITIAL_SPEED
+        self.expression = SnakeExpression.NORMAL
+        self.expression_timer = 0
+        self.combo_count = 0
+
+    @property
+    def head_cell(self):
+        """Grid cell (col, row) of the head"""
+        return self.body[0]
+
+    def move(self):
+        """Move snake"""
+        # Calculate new head cell
+        head_col, head_row = self.body[0]
+        dx, dy = self.direction
+        new_head = (head_col + dx, head_row + dy)
+
+        # Add new head
+        self.body.appendleft(new_head)
+        self._occupy(new_head)
+        self.zobrist ^= self._head_key(self.body[1]) ^ self._head_key(new_head)
+
+        # Remove tail if no growth flag
+        if not self.grow_flag:
+            self.previous_tail = self.body.pop()
+            self._vacate(self.previous_tail)
+        else:
+            self.grow_flag = False
+            self.zobrist ^= GROW_KEY
+            self.previous_tail = self.body[-1]
+
+    def change_direction(self, direction):
+        """
+        Change snake direction
+        Args:
+            direction: new direction in format (dx, dy)
+        """
+        # Prevent snake from turning back directly
+        if (direction[0] * -1, direction[1] * -1) != self.direction:
+            self.zobrist ^= DIRECTION_KEYS[self.direction] ^ DIRECTION_KEYS[direction]
+            self.direction = direction
+
+    def grow(self):
+        """Set growth flag"""
+        if not self.grow_flag:
+            self.zobrist ^= GROW_KEY
+        self.grow_flag = True
+        # Increase speed
+        self.speed = min(self.speed + SPEED_INCREMENT, MAX_SPEED)
+        # Update combo count
+        self.combo_count += 1
+        # Set expression based on combo
+        if self.combo_count >= 3:
+            self.set_expression(SnakeExpression.EXCITED, 40)
+        else:
+            self.set_expression(SnakeExpression.HAPPY, 30)
+
+    def set_expression(self, expression, duration=30):
+        """Set snake expression for a duration"""
+        self.expression = expression
+        self.expression_timer = duration
+
+    def update_expression(self):
+        """Update expression timer"""
+        if self.expression_timer > 0:
+            self.expression_timer -= 1
+        else:
+            self.expression = SnakeExpression.NORMAL
+
+    def reset_combo(self):
+        """Reset eating combo"""
+        self.combo_count = 0
+
+    def snapshot(self):
+        """
+        Capture the snake as an immutable, hashable tuple
+        Returns:
+            tuple: State for restore()
+        """
+        return (tuple(self.body), self.previous_tail, self.direction, self.grow_flag,
+                self.speed, self.expression, self.expression_timer, self.combo_count,
+                bytes(self.occupancy), self.free_cells.snapshot(), self.zobrist)
+
+    def restore(self, state):
+        """Restore a snapshot() result"""
+        (body, self.previous_tail, self.direction, self.grow_flag,
+         self.speed, self.expression, self.expression_timer, self.combo_count,
+         occupancy, free_rows, self.zobrist) = state
+        # Refill in place: positions is a view onto this deque
+        self.body.clear()
+        self.body.extend(body)
+        self.occupancy[:] = occupancy
+        self.free_cells.restore(free_rows)
+
+    def compute_zobrist(self):
+        """Hash the snake from scratch (the value zobrist is kept at)"""
+        value = self._head_key(self.body[0]) ^ DIRECTION_KEYS[self.direction]
+        if self.grow_flag:
+            value ^= GROW_KEY
+        # Each covered cell once, found from the body rather than the whole board
+        for index in {self.index_of_cell(cell) for cell in self.body}:
+            if index is not None:
+                value ^= BODY_KEYS[index]
+        return value
+
+    def _head_key(self, cell):
+        """Zobrist key of the head on a cell (0 off the board)"""
+        index = self.index_of_cell(cell)
+        return HEAD_KEYS[index] if index is not None else 0
+
+    @staticmethod
+    def index_of_cell(cell):
+        """
+        Get the occupancy grid index for a grid cell
+        Returns:
+            int: Cell index, or None if the cell is off the board
+        """
+        col, row = cell
+        if 0 <= col < GRID_WIDTH and 0 <= row < GRID_HEIGHT:
+            return row * GRID_WIDTH + col
+        return None
+
+    def cell_index(self, position):
+        """
+        Get the occupancy grid index for a pixel position
+        Returns:
+            int: Cell index, or None if the position is off the board
+        """
+        return self.index_of_cell((position[0] // GRID_SIZE, position[1] // GRID_SIZE))
+
+    def _occupy(self, cell):
+        """Count a segment entering a cell"""
+        index = self.index_of_cell(cell)
+        if index is not None:
+            if not self.occupancy[index]:
+                self.free_cells.remove(index)
+                self.zobrist ^= BODY_KEYS[index]
+            self.occupancy[index] += 1
+
+    def _vacate(self, cell):
+        """Count a segment leaving a cell"""
+        index = self.index_of_cell(cell)
+        if index is not None:
+            self.occupancy[index] -= 1
+            if not self.occupancy[index]:
+                self.free_cells.add(index)
+                self.zobrist ^= BODY_KEYS[index]
+
+    def occupies(self, position):
+        """Check if any segment is on the given pixel position"""
+        index = self.cell_index(position)
+        return index is not None and self.occupancy[index] > 0
+
+    def find_segment_near(self, x, y, radius):
+        """
+        Find a body segment whose position is closer than radius to (x, y)
+        Only the cells inside the radius are checked, not the whole body
+        Returns:
+            tuple: Segment position, or None if no segment is in range
+        """
+        min_col = max(0, int((x - radius) // GRID_SIZE))
+        max_col = min(GRID_WIDTH - 1, int((x + radius) // GRID_SIZE))
+        min_row = max(0, int((y - radius) // GRID_SIZE))
+        max_row = min(GRID_HEIGHT - 1, int((y + radius) // GRID_SIZE))
+        radius_sq = radius * radius
+        occupancy = self.occupancy
+        for row in range(min_row, max_row + 1):
+            base = row * GRID_WIDTH
+            seg_y = row * GRID_SIZE
+            for col in range(min_col, max_col + 1):
+                if occupancy[base + col]:
+                    seg_x = col * GRID_SIZE
+                    if (seg_x - x) ** 2 + (seg_y - y) ** 2 < radius_sq:
+                        return (seg_x, seg_y)
+        return None
+
+    def check_self_collision(self):
+        """Check if snake hits its own body"""
+        index = self.index_of_cell(self.body[0])
+        return index is not None and self.occupancy[index] > 1
+
+    def check_wall_collision(self, wrap_around=False):
+        """
+        Check if snake hits the wall
+        Args:
+            wrap_around: If True, wrap through walls (Easy mode)
+        """
+        head_col, head_row = self.body[0]
+
+        if wrap_around:
+            # Wrap around mode - teleport to opposite side
+            wrapped = (head_col % GRID_WIDTH, head_row % GRID_HEIGHT)
+            if wrapped != self.body[0]:
+                self._vacate(self.body[0])
+                self.zobrist ^= self._head_key(wrapped)  # The old head cell was off the board
+                self.body[0] = wrapped
+                self._occupy(wrapped)
+            return False
+        else:
+            # Normal collision detection
+            return not (0 <= head_col < GRID_WIDTH and 0 <= head_row < GRID_HEIGHT)
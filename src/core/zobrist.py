@@ -0,0 +1,157 @@
+"""
+Zobrist Hashing for the Simulation Core
+Random 64-bit keys per board feature and a shared LRU transposition table
+"""
+
+from collections import OrderedDict
+from dataclasses import astuple
+import random
+import os
+import sys
+
+# Add parent directory to Python path for relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config import *
+
+NUM_CELLS = GRID_WIDTH * GRID_HEIGHT
+
+
+def _keys(name, count):
+    """Fixed random keys for one feature (string seeds hash stably across processes)"""
+    rng = random.Random(f"zobrist:{name}")
+    return [rng.getrandbits(64) for _ in range(count)]
+
+
+# One key per cell for each feature that can sit on a cell
+BODY_KEYS = _keys("body", NUM_CELLS)
+HEAD_KEYS = _keys("head", NUM_CELLS)
+FOOD_KEYS = _keys("food", NUM_CELLS)
+BOMB_KEYS = _keys("bomb", NUM_CELLS)
+
+# Snake state that is not on the board
+DIRECTION_KEYS = dict(zip(((0, -1), (0, 1), (-1, 0), (1, 0)), _keys("direction", 4)))
+GROW_KEY = _keys("grow", 1)[0]
+
+_powerup_keys = {}
+
+
+def powerup_key(type_name, index):
+    """
+    Get the key of a power-up on a cell
+    Args:
+        type_name: PowerUpType member name
+        index: Cell index
+    """
+    if type_name not in _powerup_keys:
+        _powerup_keys[type_name] = _keys(f"powerup:{type_name}", NUM_CELLS)
+    return _powerup_keys[type_name][index]
+
+
+def cell_of(position):
+    """Cell index of a pixel position"""
+    return (position[1] // GRID_SIZE) * GRID_WIDTH + position[0] // GRID_SIZE
+
+
+def compute_hash(core):
+    """
+    Hash a SimulationCore from scratch
+    Matches core.state_hash(), which uses the incrementally kept hashes;
+    useful for checking them.
+    """
+    snake = core.snake
+    value = 0
+    for index, count in enumerate(snake.occupancy):
+        if count:
+            value ^= BODY_KEYS[index]
+    head = snake.index_of_cell(snake.head_cell)
+    if head is not None:
+        value ^= HEAD_KEYS[head]
+    value ^= DIRECTION_KEYS[snake.direction]
+    if snake.grow_flag:
+        value ^= GROW_KEY
+    value ^= FOOD_KEYS[cell_of(core.food.position)]
+    for powerup in core.powerups.powerups:
+        value ^= powerup_key(powerup.type.name, cell_of((powerup.x, powerup.y)))
+    for bomb in core.bombs:
+        value ^= BOMB_KEYS[cell_of((bomb.x, bomb.y))]
+    return value
+
+
+class TranspositionTable:
+    """
+    Bounded map from position hashes to search results
+
+    Entries are kept in least-recently-used order; storing past the
+    capacity evicts the entry that was looked up or stored longest ago.
+    One table can be shared by several bots (see shared_table()), so
+    positions one search expanded are reused by the next.
+    """
+
+    def __init__(self, capacity=TRANSPOSITION_TABLE_SIZE):
+        """
+        Initialize table
+        Args:
+            capacity: Maximum number of entries
+        """
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key, default=None):
+        """
+        Look up a position, marking it as recently used
+        Returns:
+            object: Stored value, or default if the position is unknown
+        """
+        entries = self.entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        return default
+
+    def store(self, key, value):
+        """Store a value for a position, evicting the oldest entries when full"""
+        entries = self.entries
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups that found an entry"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_shared_tables = {}
+
+
+def shared_table(settings):
+    """
+    Get the process-wide transposition table shared by search bots
+    Hashes cover the board only, so every difficulty gets its own table
+    Args:
+        settings: DifficultySettings of the positions to be stored
+    """
+    key = astuple(settings)
+    if key not in _shared_tables:
+        _shared_tables[key] = TranspositionTable()
+    return _shared_tables[key]
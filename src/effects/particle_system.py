@@ -17,22 +17,23 @@ from src.config.config import *
 class Particle:
     """Individual particle in the trail"""
 
-    def __init__(self, x, y, color, velocity_x=0, velocity_y=0):
+    def __init__(self, x, y, color, velocity_x=0, velocity_y=0, rng=random):
         """
         Initialize particle
         Args:
             x, y: Starting position
             color: RGB tuple
             velocity_x, velocity_y: Movement direction
+            rng: Random stream for lifetime and size
         """
         self.x = x
         self.y = y
         self.color = color
         self.velocity_x = velocity_x
         self.velocity_y = velocity_y
-        self.lifetime = random.randint(20, 40)  # Frames to live
+        self.lifetime = rng.randint(20, 40)  # Frames to live
         self.max_lifetime = self.lifetime
-        self.size = random.uniform(2, 5)
+        self.size = rng.uniform(2, 5)
 
     def update(self):
         """Update particle position and lifetime"""
@@ -83,8 +84,13 @@ class Particle:
 class ParticleSystem:
     """Manages all particles for trail effects"""
 
-    def __init__(self):
-        """Initialize particle system"""
+    def __init__(self, rng=None):
+        """
+        Initialize particle system
+        Args:
+            rng: Cosmetic random stream, kept apart from gameplay randomness
+        """
+        self.rng = rng or random.Random()
         self.particles = []
 
     def emit_trail_particle(self, x, y, color, intensity=1.0):
@@ -96,25 +102,26 @@ class ParticleSystem:
             intensity: Particle emission rate multiplier (0.0-1.0)
         """
         # Emit 2-5 particles per call based on intensity
-        num_particles = int(random.randint(2, 5) * intensity)
+        num_particles = int(self.rng.randint(2, 5) * intensity)
 
         for _ in range(num_particles):
             # Random velocity for spread effect
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(0.5, 1.5)
+            angle = self.rng.uniform(0, 2 * math.pi)
+            speed = self.rng.uniform(0.5, 1.5)
             velocity_x = math.cos(angle) * speed
             velocity_y = math.sin(angle) * speed
 
             # Add slight variation to position
-            offset_x = random.uniform(-3, 3)
-            offset_y = random.uniform(-3, 3)
+            offset_x = self.rng.uniform(-3, 3)
+            offset_y = self.rng.uniform(-3, 3)
 
             particle = Particle(
                 x + offset_x,
                 y + offset_y,
                 color,
                 velocity_x,
-                velocity_y
+                velocity_y,
+                self.rng
             )
             self.particles.append(particle)
 
@@ -127,12 +134,12 @@ class ParticleSystem:
             count: Number of particles to emit
         """
         for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 5)
+            angle = self.rng.uniform(0, 2 * math.pi)
+            speed = self.rng.uniform(2, 5)
             velocity_x = math.cos(angle) * speed
             velocity_y = math.sin(angle) * speed
 
-            particle = Particle(x, y, color, velocity_x, velocity_y)
+            particle = Particle(x, y, color, velocity_x, velocity_y, self.rng)
             self.particles.append(particle)
 
     def update(self):
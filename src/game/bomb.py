@@ -1,27 +1,23 @@
 """
 炸弹类
-实现炸弹放置、倒计时、爆炸效果和声音
+实现炸弹的爆炸粒子和绘制效果
+倒计时和爆炸判定规则位于 src.core.bomb_logic
 """
 
 import pygame
 import random
 import math
 from src.config.config import *
+from src.core.bomb_logic import BombLogic
 
-class Bomb:
-    """炸弹类，包含放置、倒计时和爆炸功能"""
+class Bomb(BombLogic):
+    """炸弹类，在炸弹规则之上添加粒子和绘制效果"""
     
-    def __init__(self, x, y, explosion_radius=100, countdown=180):  # 3秒倒计时（60帧/秒）
-        """初始化炸弹"""
-        self.x = x
-        self.y = y
-        self.explosion_radius = explosion_radius
-        self.countdown = countdown
-        self.active = True
-        self.exploded = False
+    def __init__(self, x, y, explosion_radius=100, countdown=180, rng=None):  # 3秒倒计时（60帧/秒）
+        """初始化炸弹（rng: 粒子效果使用的装饰性随机流）"""
+        super().__init__(x, y, explosion_radius, countdown)
+        self.rng = rng or random
         self.particles = []
-        self.explosion_timer = 0
-        self.explosion_duration = 45  # 爆炸效果持续时间
         
         # 炸弹颜色（红色到橙色的渐变）
         self.colors = [
@@ -30,31 +26,20 @@ class Bomb:
             (255, 140, 0),    # 深橙色
             (255, 165, 0)     # 橙色
         ]
-        
-    def update(self):
-        """更新炸弹状态"""
-        if not self.exploded:
-            self.countdown -= 1
-            if self.countdown <= 0:
-                self.explode()
-        else:
-            # 更新爆炸粒子
-            self.update_explosion()
     
     def explode(self):
         """触发爆炸"""
-        self.exploded = True
-        self.active = True
+        super().explode()
         self.create_explosion_particles()
     
     def create_explosion_particles(self):
         """创建爆炸粒子效果"""
         # 创建中心爆炸粒子
         for _ in range(80):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(3, 12)
-            size = random.randint(3, 8)
-            lifetime = random.randint(25, 50)
+            angle = self.rng.uniform(0, 2 * math.pi)
+            speed = self.rng.uniform(3, 12)
+            size = self.rng.randint(3, 8)
+            lifetime = self.rng.randint(25, 50)
             
             particle = {
                 'x': self.x,
@@ -62,7 +47,7 @@ class Bomb:
                 'dx': math.cos(angle) * speed,
                 'dy': math.sin(angle) * speed,
                 'size': size,
-                'color': (random.randint(200, 255), random.randint(50, 150), random.randint(0, 50)),
+                'color': (self.rng.randint(200, 255), self.rng.randint(50, 150), self.rng.randint(0, 50)),
                 'lifetime': lifetime,
                 'max_lifetime': lifetime
             }
@@ -70,10 +55,10 @@ class Bomb:
         
         # 创建冲击波粒子
         for _ in range(30):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(8, 15)
-            size = random.randint(4, 10)
-            lifetime = random.randint(15, 30)
+            angle = self.rng.uniform(0, 2 * math.pi)
+            speed = self.rng.uniform(8, 15)
+            size = self.rng.randint(4, 10)
+            lifetime = self.rng.randint(15, 30)
             
             particle = {
                 'x': self.x,
@@ -89,7 +74,7 @@ class Bomb:
     
     def update_explosion(self):
         """更新爆炸动画"""
-        self.explosion_timer += 1
+        super().update_explosion()
         
         # 更新粒子
         for particle in self.particles[:]:
@@ -100,17 +85,18 @@ class Bomb:
             # 移除死亡的粒子
             if particle['lifetime'] <= 0:
                 self.particles.remove(particle)
-        
-        # 爆炸结束
-        if self.explosion_timer >= self.explosion_duration and not self.particles:
-            self.active = False
     
-    def draw(self, screen):
-        """绘制炸弹"""
+    def draw(self, screen, current_time=0):
+        """
+        绘制炸弹
+        Args:
+            screen: Pygame screen surface
+            current_time: 游戏时钟毫秒数（暂停和快进时与逻辑同步）
+        """
         if not self.exploded:
             # 绘制炸弹本体（闪烁效果）
-            flash_intensity = (pygame.time.get_ticks() // 200) % 2  # 闪烁效果
-            color_index = (pygame.time.get_ticks() // 100) % len(self.colors)
+            flash_intensity = int(current_time // 200) % 2  # 闪烁效果
+            color_index = int(current_time // 100) % len(self.colors)
             
             bomb_color = self.colors[color_index]
             
@@ -161,16 +147,3 @@ class Bomb:
                     pygame.draw.circle(wave_surface, (255, 200, 0, wave_alpha), 
                                      (wave_radius, wave_radius), wave_radius)
                     screen.blit(wave_surface, (self.x - wave_radius, self.y - wave_radius))
-    
-    def get_explosion_area(self):
-        """获取爆炸影响区域"""
-        if self.exploded and self.explosion_timer < 10:  # 只在爆炸初期有效
-            return (self.x, self.y, self.explosion_radius)
-        return None
-    
-    def is_colliding(self, x, y, radius=0):
-        """检查是否与指定位置碰撞"""
-        if self.exploded and self.explosion_timer < 15:  # 爆炸影响时间
-            distance = math.sqrt((x - self.x)**2 + (y - self.y)**2)
-            return distance < self.explosion_radius + radius
-        return False
\ No newline at end of file
@@ -1,10 +1,10 @@
 """
 Enhanced Food Class Definition
-Responsible for food generation and display with visual effects
+Responsible for food display with visual effects
+Placement and respawn rules live in src.core.food_logic
 """
 
 import pygame
-import random
 import math
 import os
 import sys
@@ -13,37 +13,17 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.config.config import *
+from src.core.food_logic import FoodLogic
 
-class Food:
+class Food(FoodLogic):
     """Enhanced Food class with pulsing and glowing effects"""
     
-    def __init__(self):
+    def __init__(self, rng=None):
         """Initialize food"""
-        self.position = self.generate_position()
+        super().__init__(rng)
         self.pulse_timer = 0
         self.rotation_angle = 0
         
-    def generate_position(self):
-        """
-        Generate random position
-        Returns:
-            tuple: (x, y) coordinates
-        """
-        x = random.randint(0, GRID_WIDTH - 1) * GRID_SIZE
-        y = random.randint(0, GRID_HEIGHT - 1) * GRID_SIZE
-        return (x, y)
-        
-    def respawn(self, snake_positions):
-        """
-        Respawn food, ensuring it's not on the snake
-        Args:
-            snake_positions: list of snake body segment positions
-        """
-        while True:
-            self.position = self.generate_position()
-            if self.position not in snake_positions:
-                break
-                
     def update(self):
         """Update food animation"""
         self.pulse_timer += 1
@@ -51,9 +31,6 @@ class Food:
         
     def draw(self, screen):
         """Draw enhanced food with pulsing and glowing effects"""
-        # Update animation
-        self.update()
-        
         x, y = self.position[0], self.position[1]
         center_x, center_y = x + FOOD_SIZE // 2, y + FOOD_SIZE // 2
         
@@ -1,13 +1,14 @@
 """
 Enhanced Game Main Class with Sound Effects
-Responsible for game logic, state management, enhanced user interface and sound effects
+Responsible for state management, enhanced user interface and sound effects
+Game rules are advanced by the headless SimulationCore in src.core.simulation
 """
 
 import pygame
 import sys
 import math
 import os
-import random
+import time
 
 # Add parent directory to Python path for relative imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -21,6 +22,10 @@ from src.config.config import *
 from src.config.window_config import window_manager, create_game_window, toggle_fullscreen_mode, get_window_size
 from src.config.themes import ThemeManager
 from src.core.difficulty import DifficultyManager, DifficultyLevel
+from src.core.simulation import SimulationCore, Action, SimEvent
+from src.core.game_loop import FixedTimestepLoop
+from src.core.replay import ReplayRecorder
+from src.core.autopilot import Autopilot
 from src.effects.floating_text import FloatingTextManager
 from src.effects.particle_system import ParticleSystem
 from src.ui.hud_renderer import HUDRenderer
@@ -39,6 +44,11 @@ class SnakeGame:
             self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
             
         self.clock = pygame.time.Clock()
+
+        # Fixed simulation ticks (snake speed) and cosmetic effects run on
+        # their own timesteps, independent of the render frame rate
+        self.tick_loop = FixedTimestepLoop(SNAKE_INITIAL_SPEED, MAX_TICKS_PER_FRAME)
+        self.effects_loop = FixedTimestepLoop(EFFECTS_FPS, MAX_TICKS_PER_FRAME)
         
         # Get actual screen size and adjust fonts accordingly
         screen_width, screen_height = get_window_size()
@@ -75,27 +85,62 @@ class SnakeGame:
         # Create background surface
         self.background_surface = self.create_enhanced_background()
 
-        # Initialize game state
-        self.game_state = GAME_MENU  # Start with menu state
-        self.snake = None
-        self.food = None
-        self.score = 0
-        self.score_multiplier = 1.0  # For double score power-up
-        self.shield_active = False    # For shield power-up
-        self.walls = []
-        self.bombs = []
-        self.particles = []
-        self.explosions = []
-        self.bombs_available = 3
-        self.bomb_cooldown = 0
-        self.max_bombs = 3
-        self.explosion_active = False
-
         # Screen shake effects
         self.screen_shake_intensity = 0
         self.screen_shake_duration = 0
         self.screen_offset_x = 0
         self.screen_offset_y = 0
+
+        # Initialize game state (the simulation core owns snake, food, bombs and score)
+        self.core = None
+        self.pending_action = Action.NONE
+        self.autopilot_enabled = False  # Toggled with A during play
+        self.reset_game()
+
+    @property
+    def seed(self):
+        """Session seed of the current game"""
+        return self.core.seed
+
+    @property
+    def snake(self):
+        """Snake driven by the simulation core"""
+        return self.core.snake
+
+    @property
+    def food(self):
+        """Food driven by the simulation core"""
+        return self.core.food
+
+    @property
+    def bombs(self):
+        """Active bombs"""
+        return self.core.bombs
+
+    @property
+    def score(self):
+        """Current score"""
+        return self.core.score
+
+    @property
+    def score_multiplier(self):
+        """Score multiplier from the double score power-up"""
+        return self.core.score_multiplier
+
+    @property
+    def shield_active(self):
+        """Whether the shield power-up is active"""
+        return self.core.shield_active
+
+    @property
+    def bombs_available(self):
+        """Bombs the player can still place"""
+        return self.core.bombs_available
+
+    @property
+    def bomb_cooldown(self):
+        """Ticks until another bomb can be placed"""
+        return self.core.bomb_cooldown
         
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode using window manager"""
@@ -144,21 +189,35 @@ class SnakeGame:
         """Start the game from menu"""
         self.reset_game()
         self.game_state = GAME_RUNNING  # Set game state to running
+        print(f"🎲 游戏种子: {self.seed}")
         self.sound_manager.start_background_music()  # Start game music
         
-    def reset_game(self):
-        """Reset game to initial state"""
+    def reset_game(self, seed=None):
+        """
+        Reset game to initial state
+        Args:
+            seed: Session seed for gameplay randomness (random when None)
+        """
         # Get difficulty settings
         difficulty = self.difficulty_manager.get_settings()
 
-        # Create snake with difficulty-based speed
-        self.snake = Snake(100, 100)
-        self.snake.speed = difficulty.initial_speed
-
-        self.food = Food()
-        self.score = 0
-        self.score_multiplier = 1.0
-        self.shield_active = False
+        # Create a new simulation with renderable snake, food, power-ups and bombs
+        self.core = SimulationCore(
+            difficulty,
+            seed=seed,
+            snake=Snake(100, 100),
+            food=Food(),
+            powerups=self.powerup_manager,
+            bomb_factory=self.create_bomb,
+            analyze_danger=True,
+        )
+        # Visual effects draw from their own stream so they never change gameplay
+        self.cosmetic_rng = self.core.rng.cosmetic
+        self.particle_system.rng = self.cosmetic_rng
+        self.pending_action = Action.NONE
+        self.autopilot = Autopilot() if self.autopilot_enabled else None
+        # Inputs are logged per tick so the game can be re-simulated exactly
+        self.recorder = ReplayRecorder(self.seed, self.difficulty_manager.current_level.value)
         self.game_state = GAME_MENU
         self.paused = False
 
@@ -168,13 +227,7 @@ class SnakeGame:
         self.explosion_timer = 0
         self.explosion_duration = 60  # 1 second at 60 FPS
 
-        # Reset bomb system based on difficulty
-        self.bombs = []
-        self.bomb_cooldown = 0
-        self.bombs_available = self.max_bombs if difficulty.bomb_enabled else 0
-
-        # Clear power-ups and floating text
-        self.powerup_manager.clear()
+        # Clear floating text
         self.floating_text_manager.clear()
 
         # Clear particle system
@@ -211,15 +264,17 @@ class SnakeGame:
                         
                 elif self.game_state == GAME_RUNNING:
                     if event.key == pygame.K_UP:
-                        self.snake.change_direction((0, -1))
+                        self.queue_direction(Action.UP)
                     elif event.key == pygame.K_DOWN:
-                        self.snake.change_direction((0, 1))
+                        self.queue_direction(Action.DOWN)
                     elif event.key == pygame.K_LEFT:
-                        self.snake.change_direction((-1, 0))
+                        self.queue_direction(Action.LEFT)
                     elif event.key == pygame.K_RIGHT:
-                        self.snake.change_direction((1, 0))
+                        self.queue_direction(Action.RIGHT)
                     elif event.key == pygame.K_b:
-                        self.place_bomb()
+                        self.pending_action |= Action.BOMB
+                    elif event.key == pygame.K_a:
+                        self.toggle_autopilot()
                     elif event.key == pygame.K_p:
                         self.game_state = GAME_PAUSED
                         self.sound_manager.play_pause_sound()
@@ -256,10 +311,58 @@ class SnakeGame:
                         
         return True
         
+    def queue_direction(self, direction_action):
+        """Queue a direction for the next tick, keeping a queued bomb request"""
+        self.pending_action = (self.pending_action & Action.BOMB) | direction_action
+
+    def toggle_autopilot(self):
+        """Switch the A* autopilot on or off for the current and later games"""
+        self.autopilot_enabled = not self.autopilot_enabled
+        self.autopilot = Autopilot() if self.autopilot_enabled else None
+        message = "Autopilot ON" if self.autopilot_enabled else "Autopilot OFF"
+        self.floating_text_manager.add_message(
+            message,
+            WINDOW_WIDTH // 2,
+            WINDOW_HEIGHT // 2,
+            color=CYAN
+        )
+        print(f"🤖 自动驾驶: {'开启' if self.autopilot_enabled else '关闭'}")
+
+    def advance(self, frame_seconds):
+        """
+        Run every simulation tick and effects step that is due this frame
+        Args:
+            frame_seconds: Real time since the previous frame
+        """
+        if self.game_state != GAME_RUNNING:
+            self.tick_loop.reset()
+            self.effects_loop.reset()
+            return
+
+        self.tick_loop.set_tick_rate(self.snake.speed)
+        self.tick_loop.add_time(frame_seconds)
+        while self.game_state == GAME_RUNNING and self.tick_loop.consume_tick():
+            self.update()
+            self.tick_loop.set_tick_rate(self.snake.speed)
+
+        self.effects_loop.add_time(frame_seconds)
+        while self.effects_loop.consume_tick():
+            self.update_effects()
+
     def update(self):
-        """Update game state with sound effects"""
+        """Advance the simulation one tick and play its sounds"""
         if self.game_state == GAME_RUNNING:
-            self.snake.move()
+            action = self.pending_action
+            self.pending_action = Action.NONE
+            if self.autopilot is not None:
+                # The autopilot steers; a queued bomb is still placed
+                action = self.autopilot(self.core) | (action & Action.BOMB)
+            result = self.core.step(action)
+            if self.recorder is not None:
+                self.recorder.record(result.tick, action, self.core)
+            self.handle_sim_events(result.events)
+            if result.game_over:
+                self.save_replay()
 
             # Emit trail particles from snake tail
             if len(self.snake.positions) > 0:
@@ -274,86 +377,70 @@ class SnakeGame:
                     intensity=0.5
                 )
 
-            # Update particle system
-            self.particle_system.update()
-
-            # Update snake expression timer
-            self.snake.update_expression()
-
-            # Get difficulty settings
-            difficulty = self.difficulty_manager.get_settings()
-
-            # Check collisions with wall wrapping support
-            wall_collision = self.snake.check_wall_collision(difficulty.wall_wrap_around)
-            self_collision = self.snake.check_self_collision()
-
-            if self_collision or wall_collision:
-                # Check if shield is active
-                if self.shield_active:
-                    # Shield protects once
-                    self.shield_active = False
-                    self.sound_manager.play_shield_break_sound()  # Play shield break sound
-                    self.floating_text_manager.add_message(
-                        "Shield Saved You!",
-                        WINDOW_WIDTH // 2,
-                        WINDOW_HEIGHT // 2,
-                        color=(255, 215, 0)
-                    )
-                else:
-                    # Trigger explosion effect at snake head position
-                    self.trigger_explosion(self.snake.positions[0])
-                    self.trigger_screen_shake(intensity=15, duration=20)  # Strong shake on death
-                    self.game_state = GAME_OVER
-                    self.sound_manager.play_crash_sound()
-                    self.sound_manager.play_game_over_sound()
-                    self.sound_manager.stop_background_music()  # Stop game music
-                    self.sound_manager.start_game_over_music()  # Start game over music
-                
-            # Update explosion animation if active
-            if self.explosion_active:
-                self.update_explosion()
+    def save_replay(self):
+        """Write the finished game's replay to REPLAY_DIR"""
+        if not RECORD_REPLAYS or self.recorder is None:
+            return
+        self.recorder.finish(self.core.tick, self.score, self.core.won)
+        filename = f"{time.strftime('%Y%m%d_%H%M%S')}_{self.seed}.snkr"
+        path = os.path.join(REPLAY_DIR, filename)
+        try:
+            self.recorder.save(path)
+            print(f"🎬 回放已保存: {path}")
+        except OSError as e:
+            print(f"⚠️ 回放保存失败: {e}")
 
-            # Update screen shake effect
-            self.update_screen_shake()
+    def snapshot(self):
+        """
+        Capture the gameplay state (save-states, rewind, bot search)
+        Returns:
+            tuple: Immutable, hashable state for restore()
+        """
+        return self.core.snapshot()
 
-            # Update bombs
-            self.update_bombs()
+    def restore(self, state):
+        """
+        Restore a snapshot() taken in this game
+        Args:
+            state: Tuple from snapshot()
+        """
+        self.core.restore(state)
+        self.pending_action = Action.NONE
+        self.tick_loop.reset()
+        # A replay must start from tick 0, so a rewound game is not recorded
+        self.recorder = None
 
-            # Update power-ups
-            self.powerup_manager.update()
+        self.explosion_active = False
+        self.explosion_particles = []
+        if self.core.game_over:
+            self.game_state = GAME_OVER
+        elif self.game_state == GAME_OVER:
+            # Rewound to before the death: resume play
+            self.game_state = GAME_RUNNING
+            self.sound_manager.start_background_music()
 
-            # Check for power-up collection
-            collected_powerup = self.powerup_manager.check_collection(
-                self.snake.positions[0], self
-            )
-            if collected_powerup:
-                # Play power-up collection sound
-                from .powerups import PowerUpType
-                powerup_type_map = {
-                    PowerUpType.SLOW_POTION: 'slow_potion',
-                    PowerUpType.SHIELD: 'shield',
-                    PowerUpType.DOUBLE_SCORE: 'double_score'
-                }
-                self.sound_manager.play_powerup_sound(powerup_type_map.get(collected_powerup.type, 'slow_potion'))
+    def update_effects(self):
+        """Advance cosmetic animations by one effects step (EFFECTS_FPS per second)"""
+        # Update particle system
+        self.particle_system.update()
 
-                # Show floating text for power-up
-                self.floating_text_manager.add_message(
-                    f"{collected_powerup.name}!",
-                    collected_powerup.x + GRID_SIZE // 2,
-                    collected_powerup.y + GRID_SIZE // 2,
-                    color=collected_powerup.color
-                )
+        # Update food animation
+        self.food.update()
 
-            # Remove expired power-up effects
-            self.powerup_manager.remove_effects(self)
+        # Update explosion animation if active
+        if self.explosion_active:
+            self.update_explosion()
 
-            # Update floating text
-            self.floating_text_manager.update()
+        # Update screen shake effect
+        self.update_screen_shake()
 
-            # Check if food is eaten
-            if self.snake.positions[0] == self.food.position:
-                self.snake.grow()
+        # Update floating text
+        self.floating_text_manager.update()
 
+    def handle_sim_events(self, events):
+        """Turn simulation events into sounds, messages and visual effects"""
+        for event in events:
+            if event.kind == SimEvent.ATE:
                 # Play combo sound based on combo count
                 if self.snake.combo_count == 2:
                     self.sound_manager.play_combo_sound(2)
@@ -362,36 +449,78 @@ class SnakeGame:
                 elif self.snake.combo_count >= 5:
                     self.sound_manager.play_combo_sound(5)
 
-                # Apply score multiplier
-                points = int(SCORE_PER_FOOD * self.score_multiplier * difficulty.score_multiplier)
-                self.score += points
-
                 # Show floating score text
-                food_x, food_y = self.food.position
+                food_x, food_y = event.position
                 self.floating_text_manager.add_score_text(
-                    points,
+                    event.value,
                     food_x + GRID_SIZE // 2,
                     food_y + GRID_SIZE // 2
                 )
-
-                self.food.respawn(self.snake.positions)
                 self.sound_manager.play_eat_sound()
 
                 # Play speed up sound if speed increased
                 if self.snake.speed > SNAKE_INITIAL_SPEED:
                     self.sound_manager.play_speed_up_sound()
 
-                # Update last eat time for combo tracking
-                self._last_eat_time = pygame.time.get_ticks()
-            else:
-                # Reset combo if not eating consecutively
-                # (reset after not eating for 2 seconds)
-                if not hasattr(self, '_last_eat_time'):
-                    self._last_eat_time = pygame.time.get_ticks()
-                if pygame.time.get_ticks() - self._last_eat_time > 2000:
-                    self.snake.reset_combo()
-                    self._last_eat_time = pygame.time.get_ticks()
-                
+            elif event.kind == SimEvent.BOARD_FULL:
+                # The snake filled the board - game won
+                self.game_state = GAME_OVER
+                self.sound_manager.stop_background_music()
+                self.sound_manager.start_game_over_music()
+                print("🏆 棋盘已填满，胜利！")
+
+            elif event.kind == SimEvent.SHIELD_BROKEN:
+                self.sound_manager.play_shield_break_sound()  # Play shield break sound
+                self.floating_text_manager.add_message(
+                    "Shield Saved You!",
+                    WINDOW_WIDTH // 2,
+                    WINDOW_HEIGHT // 2,
+                    color=(255, 215, 0)
+                )
+
+            elif event.kind == SimEvent.DIED:
+                # Trigger explosion effect where the snake died
+                self.trigger_explosion(event.position)
+                self.game_state = GAME_OVER
+                if event.value == "bomb":
+                    self.sound_manager.play_bomb_explosion_sound()
+                else:
+                    self.trigger_screen_shake(intensity=15, duration=20)  # Strong shake on death
+                    self.sound_manager.play_crash_sound()
+                self.sound_manager.play_game_over_sound()
+                self.sound_manager.stop_background_music()  # Stop game music
+                self.sound_manager.start_game_over_music()  # Start game over music
+
+            elif event.kind == SimEvent.POWERUP_COLLECTED:
+                # Play power-up collection sound
+                from .powerups import PowerUpType
+                collected_powerup = event.value
+                powerup_type_map = {
+                    PowerUpType.SLOW_POTION: 'slow_potion',
+                    PowerUpType.SHIELD: 'shield',
+                    PowerUpType.DOUBLE_SCORE: 'double_score'
+                }
+                self.sound_manager.play_powerup_sound(powerup_type_map.get(collected_powerup.type, 'slow_potion'))
+
+                # Show floating text for power-up
+                self.floating_text_manager.add_message(
+                    f"{collected_powerup.name}!",
+                    collected_powerup.x + GRID_SIZE // 2,
+                    collected_powerup.y + GRID_SIZE // 2,
+                    color=collected_powerup.color
+                )
+
+            elif event.kind == SimEvent.BOMB_PLACED:
+                self.sound_manager.play_bomb_place_sound()
+                print(f"💣 炸弹放置成功！剩余: {event.value}")
+
+            elif event.kind == SimEvent.BOMB_EXPLODED:
+                # Trigger screen shake when bomb first explodes
+                self.trigger_screen_shake(intensity=12, duration=18)
+
+            elif event.kind == SimEvent.BOMB_REPLENISHED:
+                print(f"💣 炸弹补充！剩余炸弹: {event.value}")
+
     def draw(self):
         """Draw enhanced game interface"""
         # Check if screen is valid
@@ -409,10 +538,10 @@ class SnakeGame:
             self.particle_system.draw(self.screen)  # Draw particles first (background layer)
             self.draw_bombs()
             self.powerup_manager.draw(self.screen)
-            self.snake.draw(self.screen)
+            self.snake.draw(self.screen, self.tick_loop.alpha)  # Smooth motion between ticks
             self.food.draw(self.screen)  # Food drawn last so it's never hidden
             self.draw_enhanced_score()
-            self.powerup_manager.draw_active_effects(self.screen)
+            self.powerup_manager.draw_active_effects(self.screen, self.core.clock())
             self.floating_text_manager.draw(self.screen)
             
         elif self.game_state == GAME_PAUSED:
@@ -442,8 +571,6 @@ class SnakeGame:
         """Draw enhanced HUD with all game information"""
         # Prepare game state data for HUD
         difficulty_settings = self.difficulty_manager.get_settings()
-        current_time = pygame.time.get_ticks()
-
         # Prepare active power-ups data
         active_powerups = []
         for effect_type, end_time, original_value in self.powerup_manager.active_effects:
@@ -477,6 +604,7 @@ class SnakeGame:
             'difficulty': self.difficulty_manager.get_difficulty_name(),
             'music_style': self.sound_manager.current_music_style.replace('_', ' ').title(),
             'active_powerups': active_powerups,
+            'current_time': self.core.clock(),
             'bomb_count': self.bombs_available,
             'bomb_cooldown_remaining': self.bomb_cooldown,
             'bomb_cooldown_total': 3000,  # 3 seconds
@@ -522,10 +650,10 @@ class SnakeGame:
         
         # Create explosion particles
         for _ in range(50):  # Create 50 particles
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
-            size = random.randint(2, 6)
-            lifetime = random.randint(20, 40)
+            angle = self.cosmetic_rng.uniform(0, 2 * math.pi)
+            speed = self.cosmetic_rng.uniform(2, 8)
+            size = self.cosmetic_rng.randint(2, 6)
+            lifetime = self.cosmetic_rng.randint(20, 40)
             
             particle = {
                 'x': position[0],
@@ -533,7 +661,7 @@ class SnakeGame:
                 'dx': math.cos(angle) * speed,
                 'dy': math.sin(angle) * speed,
                 'size': size,
-                'color': (random.randint(200, 255), random.randint(50, 150), random.randint(0, 50)),
+                'color': (self.cosmetic_rng.randint(200, 255), self.cosmetic_rng.randint(50, 150), self.cosmetic_rng.randint(0, 50)),
                 'lifetime': lifetime,
                 'max_lifetime': lifetime
             }
@@ -572,8 +700,8 @@ class SnakeGame:
         if self.screen_shake_duration > 0:
             # Random offset based on remaining intensity
             current_intensity = self.screen_shake_intensity * (self.screen_shake_duration / 15)
-            self.screen_offset_x = random.randint(-int(current_intensity), int(current_intensity))
-            self.screen_offset_y = random.randint(-int(current_intensity), int(current_intensity))
+            self.screen_offset_x = self.cosmetic_rng.randint(-int(current_intensity), int(current_intensity))
+            self.screen_offset_y = self.cosmetic_rng.randint(-int(current_intensity), int(current_intensity))
             self.screen_shake_duration -= 1
         else:
             # Reset offset when shake ends
@@ -595,56 +723,14 @@ class SnakeGame:
             
             self.screen.blit(particle_surface, (particle['x'], particle['y']))
     
-    def place_bomb(self):
-        """Place a bomb at snake's head position"""
-        if self.bombs_available > 0 and self.bomb_cooldown <= 0:
-            snake_head = self.snake.positions[0]
-            bomb = Bomb(snake_head[0], snake_head[1])
-            self.bombs.append(bomb)
-            self.bombs_available -= 1
-            self.bomb_cooldown = 30
-            self.sound_manager.play_bomb_place_sound()
-            print(f"💣 炸弹放置成功！剩余: {self.bombs_available}")
-    
-    def update_bombs(self):
-        """Update all active bombs"""
-        # Update bomb cooldown
-        if self.bomb_cooldown > 0:
-            self.bomb_cooldown -= 1
-        
-        # Update each bomb
-        for bomb in self.bombs[:]:
-            bomb.update()
-
-            # Trigger screen shake when bomb first explodes
-            if bomb.exploded and bomb.explosion_timer == 1:
-                self.trigger_screen_shake(intensity=12, duration=18)
+    def create_bomb(self, x, y):
+        """Create a bomb whose particles use the cosmetic random stream"""
+        return Bomb(x, y, rng=self.cosmetic_rng)
 
-            # Check if bomb explosion hits snake
-            if bomb.exploded and bomb.explosion_timer < 10:
-                for segment in self.snake.positions:
-                    if bomb.is_colliding(segment[0], segment[1], 5):
-                        # Snake hit by bomb explosion
-                        self.trigger_explosion(segment)
-                        self.game_state = GAME_OVER
-                        self.sound_manager.play_bomb_explosion_sound()
-                        self.sound_manager.play_game_over_sound()
-                        self.sound_manager.stop_background_music()
-                        self.sound_manager.start_game_over_music()
-                        break
-            
-            # Remove inactive bombs
-            if not bomb.active:
-                self.bombs.remove(bomb)
-                # Replenish bomb if it exploded naturally
-                if bomb.exploded and self.bombs_available < self.max_bombs:
-                    self.bombs_available += 1
-                    print(f"💣 炸弹补充！剩余炸弹: {self.bombs_available}")
-    
     def draw_bombs(self):
         """Draw all active bombs"""
         for bomb in self.bombs:
-            bomb.draw(self.screen)
+            bomb.draw(self.screen, self.core.clock())
     
 
     
@@ -660,7 +746,8 @@ class SnakeGame:
             self.draw_explosion()
         
         # Game over text with red glow
-        game_over_text = self.big_font.render("GAME OVER", True, RED)
+        title = "YOU WIN!" if self.core.won else "GAME OVER"
+        game_over_text = self.big_font.render(title, True, RED)
         score_text = self.font.render(f"Final Score: {self.score}", True, GOLD)
         restart_text = self.font.render("Press R to restart", True, WHITE)
         quit_text = self.font.render("Press Q to quit", True, WHITE)
@@ -672,7 +759,7 @@ class SnakeGame:
         
         # Glow effect for game over text
         for i in range(3):
-            glow_surface = self.big_font.render("GAME OVER", True, (*RED, 100 - i*30))
+            glow_surface = self.big_font.render(title, True, (*RED, 100 - i*30))
             glow_rect = glow_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 60))
             self.screen.blit(glow_surface, glow_rect)
         
@@ -826,19 +913,14 @@ class SnakeGame:
         running = True
         try:
             while running:
+                # Render rate is capped by RENDER_FPS (0 = uncapped); the snake
+                # moves on its own fixed timestep, so slow frames skip drawing
+                # rather than slowing the snake down
+                frame_ms = self.clock.tick(RENDER_FPS) if RENDER_FPS else self.clock.tick()
                 running = self.handle_events()
-                self.update()
+                self.sound_manager.update()  # Swap in music rendered in the background
+                self.advance(frame_ms / 1000.0)
                 self.draw()
-                # Only tick the clock based on snake speed if game is running
-                if self.game_state == GAME_RUNNING:
-                    self.clock.tick(self.snake.speed)
-                else:
-                    self.clock.tick(60)  # Default 60 FPS for menu and other states
-                    
-                # Check if snake exists and is valid
-                if self.game_state == GAME_RUNNING and (not hasattr(self, 'snake') or self.snake is None):
-                    print("⚠️  Snake object is None, returning to menu")
-                    self.game_state = GAME_MENU
         except KeyboardInterrupt:
             print("\n👋 Game interrupted by user, exiting gracefully...")
             running = False
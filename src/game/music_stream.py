@@ -0,0 +1,59 @@
+"""
+Streaming Music Playback for Snake Game
+Feeds fixed-size chunks of a music source through one mixer channel
+"""
+
+import pygame
+
+
+class MusicStream:
+    """
+    Plays an endless source through a mixer channel, one chunk at a time
+
+    Only the playing chunk and the one queued behind it exist as Sounds,
+    so resident audio memory stays at two chunks however long the track
+    is. pump() must run more often than a chunk lasts (once per frame).
+    """
+
+    def __init__(self, channel, chunk_samples):
+        """
+        Initialize stream
+        Args:
+            channel: pygame Channel reserved for music
+            chunk_samples: Samples per queued chunk
+        """
+        self.channel = channel
+        self.chunk_samples = chunk_samples
+        self.source = None  # Object with read(count), None when stopped
+
+    @property
+    def playing(self):
+        return self.source is not None
+
+    def play(self, source):
+        """Stop whatever is playing and start a source right away"""
+        self.channel.stop()
+        self.source = source
+        self.channel.play(self.next_chunk())
+        self.channel.queue(self.next_chunk())
+
+    def switch(self, source):
+        """Continue with another source once the queued chunk has played (no gap)"""
+        if self.playing:
+            self.source = source
+        else:
+            self.play(source)
+
+    def pump(self):
+        """Keep a chunk queued behind the playing one"""
+        if self.source is not None and self.channel.get_queue() is None:
+            self.channel.queue(self.next_chunk())  # Also restarts an idle channel
+
+    def stop(self):
+        """Stop playback and drop the queued chunk"""
+        self.source = None
+        self.channel.stop()
+
+    def next_chunk(self):
+        """Read the next chunk of the source into a Sound"""
+        return pygame.sndarray.make_sound(self.source.read(self.chunk_samples))
@@ -3,9 +3,7 @@ Power-up System for Snake Game
 Provides collectible items that grant temporary abilities
 """
 import pygame
-import random
 import math
-from enum import Enum, auto
 import os
 import sys
 
@@ -13,53 +11,27 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.config.config import *
+from src.core.powerup_logic import PowerUpType, PowerUpLogic, PowerUpManagerLogic
 
 
-class PowerUpType(Enum):
-    """Available power-up types"""
-    SLOW_POTION = auto()    # Reduces speed temporarily
-    SHIELD = auto()         # Protects from one death
-    DOUBLE_SCORE = auto()   # Doubles score temporarily
+class PowerUp(PowerUpLogic):
+    """Power-up with pulsing animation and name label"""
 
-
-class PowerUp:
-    """Base power-up class"""
-
-    def __init__(self, x, y, powerup_type):
+    def __init__(self, x, y, powerup_type, spawn_time):
         """
         Initialize power-up
         Args:
             x, y: Position
             powerup_type: PowerUpType enum value
+            spawn_time: Game time in milliseconds when spawned
         """
-        self.x = x
-        self.y = y
-        self.type = powerup_type
-        self.active = True
-        self.spawn_time = pygame.time.get_ticks()
-        self.lifetime = 10000  # 10 seconds before disappearing
+        super().__init__(x, y, powerup_type, spawn_time)
         self.pulse_timer = 0
 
-        # Type-specific properties
-        if powerup_type == PowerUpType.SLOW_POTION:
-            self.color = (100, 149, 237)  # Blue
-            self.duration = 5000  # 5 seconds
-            self.name = "Slow Potion"
-        elif powerup_type == PowerUpType.SHIELD:
-            self.color = (255, 215, 0)  # Gold
-            self.duration = 3000  # 3 seconds
-            self.name = "Shield"
-        elif powerup_type == PowerUpType.DOUBLE_SCORE:
-            self.color = (255, 20, 147)  # Pink
-            self.duration = 8000  # 8 seconds
-            self.name = "Double Score"
-
-    def update(self):
+    def update(self, current_time):
         """Update power-up state"""
         self.pulse_timer += 1
-        # Check if expired
-        if pygame.time.get_ticks() - self.spawn_time > self.lifetime:
-            self.active = False
+        super().update(current_time)
 
     def draw(self, screen):
         """Draw the power-up with pulsing animation and name label"""
@@ -127,121 +99,27 @@ class PowerUp:
             rect = text.get_rect(center=(cx, cy))
             screen.blit(text, rect)
 
-    def check_collision(self, position):
-        """Check if snake head collides with this power-up"""
-        head_x, head_y = position
-        return (abs(head_x - self.x) < GRID_SIZE and
-                abs(head_y - self.y) < GRID_SIZE)
-
 
-class PowerUpManager:
+class PowerUpManager(PowerUpManagerLogic):
     """Manages power-up spawning and active effects"""
 
-    def __init__(self):
-        self.powerups = []
-        self.active_effects = []  # List of (type, end_time, original_value) tuples
-        self.spawn_interval = 15000  # 15 seconds between spawns
-        self.last_spawn_time = pygame.time.get_ticks()
-        self.powerup_types = list(PowerUpType)
-
-    def update(self):
-        """Update all power-ups and effects"""
-        current_time = pygame.time.get_ticks()
-
-        # Check if should spawn new power-up
-        if current_time - self.last_spawn_time > self.spawn_interval:
-            self.spawn_random_powerup()
-            self.last_spawn_time = current_time
-
-        # Update existing power-ups
-        for powerup in self.powerups[:]:
-            powerup.update()
-            if not powerup.active:
-                self.powerups.remove(powerup)
-
-        # Check if effects have expired
-        for effect_tuple in self.active_effects[:]:
-            effect_type, end_time, _ = effect_tuple
-            if current_time > end_time:
-                self.active_effects.remove(effect_tuple)
-
-    def spawn_random_powerup(self):
-        """Spawn a random power-up at a random location"""
-        # Random position (avoid edges)
-        x = random.randint(2, (WINDOW_WIDTH // GRID_SIZE) - 3) * GRID_SIZE
-        y = random.randint(2, (WINDOW_HEIGHT // GRID_SIZE) - 3) * GRID_SIZE
-
-        # Random type
-        powerup_type = random.choice(self.powerup_types)
-
-        # Create and add power-up
-        powerup = PowerUp(x, y, powerup_type)
-        self.powerups.append(powerup)
-
-    def check_collection(self, snake_head, game):
-        """
-        Check if snake collected any power-ups
-        Returns: PowerUp object if collected, None otherwise
-        """
-        current_time = pygame.time.get_ticks()
-
-        for powerup in self.powerups[:]:
-            if powerup.check_collision(snake_head):
-                # Apply effect
-                self._apply_effect(powerup, game, current_time)
-                # Remove power-up
-                self.powerups.remove(powerup)
-                return powerup
+    powerup_class = PowerUp
 
-        return None
-
-    def _apply_effect(self, powerup, game, current_time):
-        """Apply power-up effect to the game"""
-        end_time = current_time + powerup.duration
-
-        if powerup.type == PowerUpType.SLOW_POTION:
-            # Store original speed and reduce it
-            original_speed = game.snake.speed
-            game.snake.speed = max(5, game.snake.speed - 5)
-            self.active_effects.append((powerup.type, end_time, original_speed))
-
-        elif powerup.type == PowerUpType.SHIELD:
-            # Activate shield
-            game.shield_active = True
-            self.active_effects.append((powerup.type, end_time, None))
-
-        elif powerup.type == PowerUpType.DOUBLE_SCORE:
-            # Double score multiplier
-            game.score_multiplier = 2.0
-            self.active_effects.append((powerup.type, end_time, None))
-
-    def remove_effects(self, game):
-        """Remove expired effects from game"""
-        current_time = pygame.time.get_ticks()
-
-        for effect_tuple in self.active_effects[:]:
-            effect_type, end_time, original_value = effect_tuple
-
-            if current_time > end_time:
-                # Restore original values
-                if effect_type == PowerUpType.SLOW_POTION:
-                    if original_value is not None:
-                        game.snake.speed = original_value
-                elif effect_type == PowerUpType.SHIELD:
-                    game.shield_active = False
-                elif effect_type == PowerUpType.DOUBLE_SCORE:
-                    game.score_multiplier = 1.0
-
-                self.active_effects.remove(effect_tuple)
+    def __init__(self):
+        super().__init__(0)
 
     def draw(self, screen):
         """Draw all power-ups"""
         for powerup in self.powerups:
             powerup.draw(screen)
 
-    def draw_active_effects(self, screen):
-        """Draw indicators for active effects"""
-        current_time = pygame.time.get_ticks()
+    def draw_active_effects(self, screen, current_time):
+        """
+        Draw indicators for active effects
+        Args:
+            screen: Pygame screen surface
+            current_time: Game time in milliseconds (the simulation clock)
+        """
         y_offset = 120
 
         for effect_type, end_time, _ in self.active_effects:
@@ -267,8 +145,3 @@ class PowerUpManager:
                 screen.blit(time_text, (50, y_offset - 8))
 
                 y_offset += 30
-
-    def clear(self):
-        """Clear all power-ups and effects"""
-        self.powerups.clear()
-        self.active_effects.clear()
@@ -1,9 +1,11 @@
 """
 Enhanced Snake Class Definition
-Responsible for snake movement, growth and collision detection with visual effects
+Responsible for drawing the snake with visual effects and expressions
+Movement and collision rules live in src.core.snake_logic
 """
 
 import pygame
+import itertools
 import os
 import sys
 import math
@@ -12,117 +14,42 @@ import math
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.config.config import *
+from src.core.snake_logic import SnakeLogic, SnakeExpression
 
 
-class SnakeExpression:
-    """Snake facial expressions"""
-    NORMAL = "normal"
-    HAPPY = "happy"      # Just ate food
-    EXCITED = "excited"  # Combo eating
-    WORRIED = "worried"  # Near danger
-
-
-class Snake:
+class Snake(SnakeLogic):
     """Enhanced Snake class with visual effects and expressions"""
 
-    def __init__(self, start_x, start_y):
+    def interpolated_positions(self, alpha):
         """
-        Initialize snake
+        Segment positions blended between the previous and current tick
         Args:
-            start_x: starting x coordinate
-            start_y: starting y coordinate
+            alpha: 0.0 = previous tick, 1.0 = current tick
+        Returns:
+            list: (x, y) pixel positions, head first
         """
-        self.positions = [(start_x, start_y)]  # Snake body segment positions
-        self.direction = (1, 0)  # Initial direction: right
-        self.grow_flag = False  # Growth flag
-        self.speed = SNAKE_INITIAL_SPEED
-        self.expression = SnakeExpression.NORMAL
-        self.expression_timer = 0
-        self.combo_count = 0
-        
-    def move(self):
-        """Move snake"""
-        # Calculate new head position
-        head_x, head_y = self.positions[0]
-        dx, dy = self.direction
-        new_head = (head_x + dx * GRID_SIZE, head_y + dy * GRID_SIZE)
-        
-        # Add new head
-        self.positions.insert(0, new_head)
-        
-        # Remove tail if no growth flag
-        if not self.grow_flag:
-            self.positions.pop()
-        else:
-            self.grow_flag = False
-            
-    def change_direction(self, direction):
+        # After a move, segment i was where segment i + 1 is now; the last
+        # segment was on the vacated tail cell
+        previous_cells = itertools.chain(itertools.islice(self.body, 1, None), (self.previous_tail,))
+        blended = []
+        for (col, row), (prev_col, prev_row) in zip(self.body, previous_cells):
+            if abs(col - prev_col) > 1 or abs(row - prev_row) > 1:
+                # Wrapped through a wall - don't slide across the board
+                blended.append((col * GRID_SIZE, row * GRID_SIZE))
+            else:
+                blended.append((round((prev_col + (col - prev_col) * alpha) * GRID_SIZE),
+                                round((prev_row + (row - prev_row) * alpha) * GRID_SIZE)))
+        return blended
+
+    def draw(self, screen, alpha=1.0):
         """
-        Change snake direction
+        Draw enhanced snake with gradient effects and expressions
         Args:
-            direction: new direction in format (dx, dy)
+            screen: Pygame screen surface
+            alpha: Interpolation between the previous and current tick
         """
-        # Prevent snake from turning back directly
-        if (direction[0] * -1, direction[1] * -1) != self.direction:
-            self.direction = direction
-            
-    def grow(self):
-        """Set growth flag"""
-        self.grow_flag = True
-        # Increase speed
-        self.speed = min(self.speed + SPEED_INCREMENT, MAX_SPEED)
-        # Update combo count
-        self.combo_count += 1
-        # Set expression based on combo
-        if self.combo_count >= 3:
-            self.set_expression(SnakeExpression.EXCITED, 40)
-        else:
-            self.set_expression(SnakeExpression.HAPPY, 30)
-
-    def set_expression(self, expression, duration=30):
-        """Set snake expression for a duration"""
-        self.expression = expression
-        self.expression_timer = duration
-
-    def update_expression(self):
-        """Update expression timer"""
-        if self.expression_timer > 0:
-            self.expression_timer -= 1
-        else:
-            self.expression = SnakeExpression.NORMAL
-
-    def reset_combo(self):
-        """Reset eating combo"""
-        self.combo_count = 0
-
-    def check_self_collision(self):
-        """Check if snake hits its own body"""
-        head = self.positions[0]
-        return head in self.positions[1:]
-
-    def check_wall_collision(self, wrap_around=False):
-        """
-        Check if snake hits the wall
-        Args:
-            wrap_around: If True, wrap through walls (Easy mode)
-        """
-        head_x, head_y = self.positions[0]
-
-        if wrap_around:
-            # Wrap around mode - teleport to opposite side
-            new_x = head_x % WINDOW_WIDTH
-            new_y = head_y % WINDOW_HEIGHT
-            if (new_x, new_y) != self.positions[0]:
-                self.positions[0] = (new_x, new_y)
-            return False
-        else:
-            # Normal collision detection
-            return (head_x < 0 or head_x >= WINDOW_WIDTH or
-                    head_y < 0 or head_y >= WINDOW_HEIGHT)
-        
-    def draw(self, screen):
-        """Draw enhanced snake with gradient effects and expressions"""
-        for i, position in enumerate(self.positions):
+        positions = self.positions if alpha >= 1.0 else self.interpolated_positions(alpha)
+        for i, position in enumerate(positions):
             rect = pygame.Rect(position[0], position[1], GRID_SIZE, GRID_SIZE)
 
             # Head is brighter, body is darker
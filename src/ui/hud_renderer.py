@@ -125,13 +125,13 @@ class HUDRenderer:
         Draw active power-ups panel (left side)
         Args:
             screen: Pygame screen surface
-            game_state: Dict with 'active_powerups' list
+            game_state: Dict with 'active_powerups' list and 'current_time' (game clock ms)
                 Each powerup: {'type': PowerUpType, 'end_time': int, 'color': tuple, 'name': str}
         """
         theme = self.theme_manager.current_theme
         x = 20
         y = 130
-        current_time = pygame.time.get_ticks()
+        current_time = game_state.get('current_time', 0)
 
         active_powerups = game_state.get('active_powerups', [])
 
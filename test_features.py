@@ -17,7 +17,7 @@ print("Testing Snake Game New Features")
 print("=" * 60)
 
 # Test 1: Import theme system
-print("\n[1/7] Testing theme system import...")
+print("\n[1/23] Testing theme system import...")
 try:
     from src.config.themes import ThemeManager, DARK_TECH_THEME, KIDS_BRIGHT_THEME
     theme_manager = ThemeManager()
@@ -31,7 +31,7 @@ except Exception as e:
     sys.exit(1)
 
 # Test 2: Import difficulty system
-print("\n[2/7] Testing difficulty system import...")
+print("\n[2/23] Testing difficulty system import...")
 try:
     from src.core.difficulty import DifficultyManager, DifficultyLevel
     difficulty_manager = DifficultyManager()
@@ -46,7 +46,7 @@ except Exception as e:
     sys.exit(1)
 
 # Test 3: Import floating text
-print("\n[3/7] Testing floating text system import...")
+print("\n[3/23] Testing floating text system import...")
 try:
     from src.effects.floating_text import FloatingTextManager
     floating_text_manager = FloatingTextManager()
@@ -60,7 +60,7 @@ except Exception as e:
     sys.exit(1)
 
 # Test 4: Import snake with expressions
-print("\n[4/7] Testing snake expressions...")
+print("\n[4/23] Testing snake expressions...")
 try:
     from src.game.snake import Snake, SnakeExpression
     snake = Snake(100, 100)
@@ -77,7 +77,7 @@ except Exception as e:
     sys.exit(1)
 
 # Test 5: Import powerups
-print("\n[5/7] Testing powerup system import...")
+print("\n[5/23] Testing powerup system import...")
 try:
     from src.game.powerups import PowerUpManager, PowerUpType
     powerup_manager = PowerUpManager()
@@ -89,7 +89,7 @@ except Exception as e:
     sys.exit(1)
 
 # Test 6: Test game integration (without pygame display)
-print("\n[6/7] Testing game.py imports...")
+print("\n[6/23] Testing game.py imports...")
 try:
     from src.game.game import SnakeGame
     print(f"✓ Game class imported successfully")
@@ -101,7 +101,7 @@ except Exception as e:
     sys.exit(1)
 
 # Test 7: Test difficulty presets
-print("\n[7/7] Testing difficulty presets...")
+print("\n[7/23] Testing difficulty presets...")
 try:
     from src.core.difficulty import DIFFICULTY_PRESETS, DifficultyLevel
     for level in DifficultyLevel:
@@ -115,6 +115,568 @@ except Exception as e:
     print(f"✗ Failed to test difficulty presets: {e}")
     sys.exit(1)
 
+# Test 8: Headless simulation core
+print("\n[8/23] Testing headless simulation core...")
+try:
+    from src.core.simulation import SimulationCore, Action, SimEvent
+    core = SimulationCore(DIFFICULTY_PRESETS[DifficultyLevel.EASY])
+    result = core.step(Action.DOWN)
+    print(f"✓ Simulation core stepped without a display")
+    print(f"  - Tick: {result.tick}, Score: {result.score}, Game over: {result.game_over}")
+    ticks = 0
+    while not core.game_over and ticks < 10000:
+        core.step(Action.NONE)
+        ticks += 1
+    print(f"  - Ran {ticks} more ticks headless")
+except Exception as e:
+    print(f"✗ Failed to run simulation core: {e}")
+    sys.exit(1)
+
+# Test 9: Incremental danger check against a fresh flood fill
+print("\n[9/23] Testing incremental danger analysis...")
+try:
+    from src.core.danger import DangerAnalyzer
+    from src.core.policies import create_policy
+    checked = 0
+    for level, policy_name, seed in (("medium", "greedy", 0), ("easy", "greedy", 1),
+                                     ("hard", "autopilot", 2), ("medium", "random", 3)):
+        core = SimulationCore(DIFFICULTY_PRESETS[DifficultyLevel(level)], seed=seed, analyze_danger=True)
+        policy = create_policy(policy_name, seed)
+        incremental = core.danger.in_danger
+        answers = []
+        core.danger.in_danger = lambda c: answers.append(incremental(c)) or answers[-1]
+        while not core.game_over and core.tick < 2000:
+            core.step(policy(core))
+            if answers:
+                fresh = DangerAnalyzer().in_danger(core)
+                assert answers[-1] == fresh, f"{level}/{policy_name} seed {seed} tick {core.tick}"
+                checked += 1
+            answers.clear()
+    print(f"✓ in_danger matched a fresh fill on {checked} ticks")
+except Exception as e:
+    print(f"✗ Danger analysis failed: {e}")
+    sys.exit(1)
+
+# Test 10: Replay verifier on good and bad files
+print("\n[10/23] Testing replay verification...")
+try:
+    import random
+    import tempfile
+    import time
+    from main import run_replays
+    from src.core.replay import ReplayRecorder
+
+    def recorded_game(seed, difficulty, extra_ticks=0):
+        recorder = ReplayRecorder(seed, difficulty)
+        core = SimulationCore(DIFFICULTY_PRESETS[DifficultyLevel(difficulty)], seed=seed)
+        moves = random.Random(seed)
+        while not core.game_over:
+            action = moves.choice([Action.NONE] * 6 + [Action.UP, Action.DOWN, Action.LEFT, Action.RIGHT])
+            result = core.step(action)
+            recorder.record(result.tick, action, core)
+        recorder.finish(core.tick + extra_ticks, core.score, core.won)
+        return recorder
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {}
+        for name, recorder in (("good", recorded_game(5, "medium")),
+                               ("inflated", recorded_game(6, "medium", extra_ticks=50)),
+                               ("huge", recorded_game(7, "easy", extra_ticks=10 ** 9)),
+                               ("corrupt", ReplayRecorder(8, "xyz"))):
+            if recorder.result is None:
+                recorder.finish(10, 0)
+            paths[name] = os.path.join(directory, f"{name}.snkr")
+            recorder.save(paths[name])
+        start = time.perf_counter()
+        assert run_replays([paths["good"]], None), "valid replay rejected"
+        for name in ("inflated", "huge", "corrupt"):
+            assert not run_replays([paths[name]], None), f"{name} replay accepted"
+        # A bad file must not stop the files after it from being checked
+        ok = run_replays([paths["corrupt"], paths["good"]], None)
+        assert not ok
+        assert time.perf_counter() - start < 10, "verifier took too long"
+    print(f"✓ Bad replays fail on their own; valid ones still verify")
+except Exception as e:
+    print(f"✗ Replay verification failed: {e}")
+    sys.exit(1)
+
+# Test 11: Keyframes and seeking
+print("\n[11/23] Testing replay keyframes and seek...")
+try:
+    from src.core.replay import Replay
+    core = SimulationCore(DIFFICULTY_PRESETS[DifficultyLevel.EASY], seed=11)
+    moves = random.Random(11)
+    with_keyframes = ReplayRecorder(11, "easy", keyframe_interval=100)
+    plain = ReplayRecorder(11, "easy")
+    states = {}
+    while not core.game_over and core.tick < 1500:
+        action = moves.choice([Action.UP, Action.DOWN, Action.LEFT, Action.RIGHT]) if moves.random() < 0.1 else Action.NONE
+        result = core.step(action)
+        with_keyframes.record(result.tick, action, core)
+        plain.record(result.tick, action, core)
+        states[core.tick] = core.snapshot()
+    for recorder in (with_keyframes, plain):
+        recorder.finish(core.tick, core.score, core.won)
+    from_file = Replay.from_bytes(with_keyframes.to_bytes())
+    indexed = Replay.from_bytes(plain.to_bytes())
+    indexed.build_keyframes(100)
+    assert from_file.keyframes and indexed.keyframes
+    for replay in (from_file, indexed):
+        for tick in (0, 1, 99, 100, 101, 777, 1234, core.tick):
+            assert replay.seek(tick).snapshot() == states.get(tick, replay.new_core().snapshot()), f"seek {tick}"
+        # Play on from a keyframe to the recorded end
+        seeked = replay.seek(250)
+        for action in replay.actions(251):
+            seeked.step(action)
+        assert (seeked.tick, seeked.score) == (replay.ticks, replay.score)
+    print(f"✓ Seeking matches the live game ({len(from_file.keyframes)} keyframes)")
+    print(f"  - {core.tick} ticks: {len(plain.to_bytes())} bytes without keyframes, "
+          f"{len(with_keyframes.to_bytes())} with")
+except Exception as e:
+    print(f"✗ Keyframe seek failed: {e}")
+    sys.exit(1)
+
+# Test 12: Replay encoding round trips
+print("\n[12/23] Testing replay encoding round trip...")
+try:
+    from src.core.replay import (write_varint, read_varint, zigzag, unzigzag,
+                                 encode_value, decode_value)
+    for value in (0, 1, 127, 128, 300, 2 ** 32, 2 ** 64 + 5):
+        buffer = bytearray()
+        write_varint(buffer, value)
+        assert read_varint(buffer, 0) == (value, len(buffer)), f"varint {value}"
+    assert [zigzag(v) for v in (0, -1, 1, -2, 2)] == [0, 1, 2, 3, 4]
+    for value in (0, 1, -1, 63, -64, 10 ** 12, -10 ** 12):
+        assert unzigzag(zigzag(value)) == value, f"zigzag {value}"
+    nested = (None, True, False, -7, 2.5, "蛇", b"\x00\xff", (1, (2, ())))
+    data = encode_value(nested)
+    assert decode_value(data) == (nested, len(data))
+    for cut in (1, len(data) // 2, len(data) - 1):
+        try:
+            decode_value(data[:cut])
+        except ValueError:
+            continue
+        raise AssertionError(f"truncated value decoded at {cut} bytes")
+    recorder = ReplayRecorder(12, "hard")
+    moves = random.Random(12)
+    choices = [Action.UP, Action.DOWN, Action.LEFT, Action.RIGHT, Action.BOMB, Action.UP | Action.BOMB]
+    played = [moves.choice(choices) if moves.random() < 0.2 else Action.NONE for _ in range(3000)]
+    for tick, action in enumerate(played, 1):
+        recorder.record(tick, action)
+    recorder.finish(len(played), 120, False)
+    replay = Replay.from_bytes(recorder.to_bytes())
+    assert (replay.seed, replay.difficulty) == (12, "hard")
+    assert (replay.ticks, replay.score, replay.won) == recorder.result
+    assert list(replay.actions()) == played, "inputs changed in the round trip"
+    assert list(replay.actions(1000, 1010)) == played[999:1010]
+    print(f"✓ Varints, zigzag, values and a {len(recorder.to_bytes())}-byte replay round trip")
+except Exception as e:
+    print(f"✗ Replay encoding failed: {e}")
+    sys.exit(1)
+
+# Test 13: Snapshot and restore
+print("\n[13/23] Testing snapshot and restore...")
+try:
+    settings = DIFFICULTY_PRESETS[DifficultyLevel.MEDIUM]
+    core = SimulationCore(settings, seed=21)
+    policy = create_policy("greedy", 21)
+    for _ in range(300):
+        core.step(policy(core) | (Action.BOMB if core.tick % 97 == 0 else 0))
+    assert not core.game_over
+    saved = core.snapshot()
+    hash(saved)  # Immutable and hashable
+    clone = SimulationCore(settings, seed=99)
+    clone.restore(saved)
+    assert clone.snapshot() == saved and clone.state_hash() == core.state_hash(), "restored state differs"
+    # Same actions from equal states give the same game, tick for tick
+    actions = []
+    live = []
+    for _ in range(400):
+        actions.append(policy(core))
+        core.step(actions[-1])
+        live.append((core.state_hash(), core.score, core.game_over))
+    for target in (clone, core):
+        target.restore(saved)
+        for tick, action in enumerate(actions):
+            target.step(action)
+            assert (target.state_hash(), target.score, target.game_over) == live[tick], f"diverged at {tick}"
+    # Two games with one seed hash identically on every tick
+    first, second = (SimulationCore(settings, seed=22) for _ in range(2))
+    bots = (create_policy("greedy", 22), create_policy("greedy", 22))
+    while not first.game_over and first.tick < 1000:
+        first.step(bots[0](first))
+        second.step(bots[1](second))
+        assert first.state_hash() == second.state_hash(), f"seed 22 diverged at tick {first.tick}"
+    assert (first.score, first.tick, first.game_over) == (second.score, second.tick, second.game_over)
+    start = time.perf_counter()
+    for _ in range(1000):
+        core.restore(core.snapshot())
+    per_call = (time.perf_counter() - start) * 1000
+    print(f"✓ restore(snapshot()) reproduces the game (score {core.score}, tick {core.tick})")
+    print(f"  - Snapshot + restore: {per_call:.1f} µs")
+except Exception as e:
+    print(f"✗ Snapshot/restore failed: {e}")
+    sys.exit(1)
+
+# Test 14: Batch environment
+print("\n[14/23] Testing batch environment...")
+try:
+    import numpy as np
+    from src.core.batch_env import BatchSnakeEnv
+    for level in (DifficultyLevel.EASY, DifficultyLevel.HARD):
+        envs = [BatchSnakeEnv(64, DIFFICULTY_PRESETS[level], seed=13) for _ in range(2)]
+        moves = np.random.default_rng(13)
+        games = 0
+        for _ in range(300):
+            actions = moves.integers(0, 5, size=64)
+            results = [env.step(actions) for env in envs]
+            env = envs[0]
+            # Same seed and actions give the same boards
+            assert all(np.array_equal(a, b) for a, b in zip(results[0], results[1]))
+            assert np.array_equal(env.occupancy, envs[1].occupancy) and np.array_equal(env.food, envs[1].food)
+            # Every board's occupancy matches its body, and food is on a free cell
+            assert np.array_equal(env.occupancy.sum(axis=1), env.length), f"{level.value} occupancy"
+            assert not env.occupancy[env.boards, env.food].any(), f"{level.value} food on the snake"
+            games += int(results[0][1].sum())
+        print(f"✓ {level.value}: 64 boards x 300 steps reproducible, {games} games ended")
+except Exception as e:
+    print(f"✗ Batch environment failed: {e}")
+    sys.exit(1)
+
+# Test 15: Incremental Zobrist hash and transposition table
+print("\n[15/23] Testing Zobrist hashing...")
+try:
+    from src.core.zobrist import compute_hash, TranspositionTable
+    checked = 0
+    for level in DifficultyLevel:
+        core = SimulationCore(DIFFICULTY_PRESETS[level], seed=19)
+        policy = create_policy("greedy", 19)
+        saved = None
+        while not core.game_over and core.tick < 1500:
+            core.step(policy(core) | (Action.BOMB if core.tick % 50 == 0 else 0))
+            assert core.state_hash() == compute_hash(core), f"{level.value} tick {core.tick}"
+            checked += 1
+            if core.tick == 400:
+                saved = core.snapshot()
+        # Restoring rebuilds the incremental hashes from the restored parts
+        for state in (saved, core.snapshot()):
+            if state is not None:
+                core.restore(state)
+                assert core.state_hash() == compute_hash(core), f"{level.value} after restore"
+    table = TranspositionTable(3)
+    for key in range(4):
+        table.store(key, key * 10)
+    assert 0 not in table and table.evictions == 1
+    assert table.get(1) == 10
+    table.store(4, 40)  # Evicts 2: 1 was used more recently
+    assert 2 not in table and 1 in table and table.get(2) is None
+    print(f"✓ Incremental hash matched a full recompute on {checked} ticks and after restores")
+    print(f"  - Transposition table evicts least recently used (hit rate {table.hit_rate:.2f})")
+except Exception as e:
+    print(f"✗ Zobrist hashing failed: {e}")
+    sys.exit(1)
+
+# Test 16: Gym-style environments
+print("\n[16/23] Testing RL environments...")
+try:
+    from src.core.env import (SnakeEnv, VectorSnakeEnv, observe, unpack_observation, OBSERVATION_SHAPE,
+                              CHANNEL_BODY, CHANNEL_HEAD, CHANNEL_FOOD, CHANNEL_BLAST)
+    from src.config.config import GRID_SIZE, SCORE_PER_FOOD
+    points = int(SCORE_PER_FOOD * DIFFICULTY_PRESETS[DifficultyLevel.MEDIUM].score_multiplier)
+
+    env = SnakeEnv("medium")
+    observation, info = env.reset(seed=15)
+    assert observation.shape == OBSERVATION_SHAPE and observation.dtype == np.uint8
+    grid = unpack_observation(observation)
+    head_col, head_row = env.core.snake.head_cell
+    assert grid[CHANNEL_HEAD].sum() == 1 and grid[CHANNEL_HEAD, head_row, head_col]
+    assert grid[CHANNEL_BODY].sum() == len(env.core.snake.body)
+    food_x, food_y = env.core.food.position
+    assert grid[CHANNEL_FOOD].sum() == 1 and grid[CHANNEL_FOOD, food_y // GRID_SIZE, food_x // GRID_SIZE]
+    # Food straight ahead is eaten on the next step
+    env.core.food.restore(((head_col + 1) * GRID_SIZE, head_row * GRID_SIZE))
+    observation, reward, terminated, truncated, info = env.step(Action.NONE)
+    assert (reward, terminated, truncated, info["score"]) == (points, False, False, points)
+    # Blast cells show only while the bomb can still hurt
+    env.core.place_bomb([])
+    bomb = env.core.bombs[0]
+    for exploded, timer, threat in ((False, 0, True), (True, 5, True), (True, 20, False)):
+        bomb.exploded, bomb.explosion_timer = exploded, timer
+        blast = unpack_observation(observe(env.core))[CHANNEL_BLAST].any()
+        assert blast == threat == bomb.is_threat(), f"blast channel at timer {timer}"
+    # Running into the wall ends the episode
+    reward = terminated = None
+    while not terminated:
+        observation, reward, terminated, truncated, info = env.step(Action.UP)
+    assert reward == 0 and env.core.game_over
+    env = SnakeEnv("medium", max_ticks=5)
+    env.reset(seed=15)
+    assert [env.step(Action.NONE)[3] for _ in range(5)] == [False] * 4 + [True]
+
+    vector = VectorSnakeEnv(8, "medium", max_ticks=20)
+    observations, info = vector.reset(seed=15)
+    assert observations.shape == (8,) + OBSERVATION_SHAPE
+    batch = vector.batch
+    batch.food[:4] = batch.head[:4] + 1  # Food ahead of the first four heads
+    observations, rewards, terminated, truncated, info = vector.step(np.zeros(8, dtype=np.int64))
+    assert rewards.shape == terminated.shape == truncated.shape == (8,)
+    assert list(rewards) == [points] * 4 + [0] * 4
+    grids = unpack_observation(observations)
+    assert np.array_equal(grids[:, CHANNEL_BODY].sum(axis=(1, 2)), batch.length)
+    # Boards driven into the top wall end together and are reset in the same step
+    steps = 1
+    while not terminated.any():
+        observations, rewards, terminated, truncated, info = vector.step(np.full(8, Action.UP))
+        steps += 1
+    assert terminated.all() and list(info["final_score"]) == [points] * 4 + [0] * 4
+    assert not batch.ticks.any() and (batch.length == 1).all()
+    while not truncated.any():
+        observations, rewards, terminated, truncated, info = vector.step(np.full(8, Action.DOWN))
+    assert truncated.all() and not batch.ticks.any()
+    print(f"✓ Observations, rewards, episode ends and auto-reset behave ({steps} steps to the wall)")
+except Exception as e:
+    print(f"✗ RL environments failed: {e}")
+    sys.exit(1)
+
+# Test 17: Rollout planner
+print("\n[17/23] Testing rollout planner...")
+try:
+    from src.core.rollout_planner import RolloutPlanner, safe_actions
+    from src.core.zobrist import shared_table
+    try:
+        RolloutPlanner(time_budget=None)
+        raise AssertionError("planner without a budget or iteration limit was accepted")
+    except ValueError:
+        pass
+    # Fixed iteration counts and seeds give the same moves
+    games = []
+    for _ in range(2):
+        core = SimulationCore(DIFFICULTY_PRESETS[DifficultyLevel.HARD], seed=20)
+        planner = RolloutPlanner(20, time_budget=None, max_iterations=40, table=TranspositionTable())
+        moves = []
+        while not core.game_over and core.tick < 150:
+            safe = safe_actions(core)
+            moves.append(planner(core))
+            assert not safe or moves[-1] in safe, f"unsafe move at tick {core.tick}"
+            core.step(moves[-1])
+        games.append((moves, core.score, core.state_hash()))
+    assert games[0] == games[1], "planner is not deterministic"
+    # Searching does not disturb the position it was given
+    before = core.snapshot()
+    planner(core)
+    assert core.snapshot() == before
+    # Each difficulty keeps its own shared table
+    easy, hard = (DIFFICULTY_PRESETS[level] for level in (DifficultyLevel.EASY, DifficultyLevel.HARD))
+    assert shared_table(easy) is not shared_table(hard) and shared_table(hard) is shared_table(hard)
+    planner = RolloutPlanner(21, time_budget=0.02)
+    planner(SimulationCore(easy, seed=21))
+    assert len(shared_table(easy)) > 0 and len(shared_table(hard)) == 0
+    print(f"✓ Planner is deterministic, never picks an unsafe move and keeps tables per difficulty")
+    print(f"  - {planner.iterations} iterations in a 20 ms move, score {games[0][1]} after 150 ticks")
+except Exception as e:
+    print(f"✗ Rollout planner failed: {e}")
+    sys.exit(1)
+
+# Test 18: Fixed timestep loop driven by fake frame times
+print("\n[18/23] Testing fixed timestep loop...")
+try:
+    from src.core.game_loop import FixedTimestepLoop
+
+    def run_frames(loop, frame_times):
+        """Feed frame times to a loop the way SnakeGame.advance() does; returns ticks per frame"""
+        ticks = []
+        for frame_seconds in frame_times:
+            loop.add_time(frame_seconds)
+            count = 0
+            while loop.consume_tick():
+                count += 1
+            ticks.append(count)
+        return ticks
+
+    # 60 Hz frames at 10 ticks/s: one tick every sixth frame, 10 per second
+    loop = FixedTimestepLoop(10)
+    ticks = run_frames(loop, [1 / 60] * 60)
+    assert sum(ticks) == 10 and max(ticks) == 1, ticks
+    # Slow 8 Hz frames at 10 ticks/s: the snake keeps its speed (1 or 2 ticks a frame)
+    loop = FixedTimestepLoop(10)
+    ticks = run_frames(loop, [0.125] * 8)
+    assert sum(ticks) == 10 and set(ticks) == {1, 2}, ticks
+    # A 2 s stall keeps only max_backlog of unsimulated time
+    loop = FixedTimestepLoop(10, max_backlog=0.25)
+    assert run_frames(loop, [2.0]) == [2] and abs(loop.dropped_time - 1.75) < 1e-9
+    # A frame never runs more than max_ticks_per_frame; whole ticks beyond it are dropped
+    loop = FixedTimestepLoop(100, max_ticks_per_frame=8, max_backlog=0.25)
+    assert run_frames(loop, [0.25]) == [8] and loop.accumulator < loop.step
+    # Time is conserved: simulated + dropped + still accumulated = real time
+    loop = FixedTimestepLoop(12)
+    frames = [1 / 60] * 30 + [0.5] + [1 / 144] * 50 + [0.1] * 5
+    simulated = sum(run_frames(loop, frames)) / 12
+    assert abs(simulated + loop.dropped_time + loop.accumulator - sum(frames)) < 1e-6
+    # Speeding up changes the step; reset forgets the backlog
+    loop.set_tick_rate(20)
+    assert loop.step == 0.05
+    loop.add_time(0.04)
+    loop.reset()
+    assert loop.accumulator == 0 and not loop.consume_tick()
+    print(f"✓ Accumulator, backlog clamp and per-frame tick cap behave")
+except Exception as e:
+    print(f"✗ Fixed timestep loop failed: {e}")
+    sys.exit(1)
+
+# Test 19: Render interpolation
+print("\n[19/23] Testing render interpolation...")
+try:
+    loop = FixedTimestepLoop(10)
+    run_frames(loop, [0.15])
+    assert abs(loop.alpha - 0.5) < 1e-9, loop.alpha
+    loop.add_time(0.02)
+    assert abs(loop.alpha - 0.7) < 1e-9, loop.alpha
+    loop.add_time(0.2)  # Ticks not consumed yet: alpha stays clamped
+    assert loop.alpha == 1.0
+
+    core = SimulationCore(DIFFICULTY_PRESETS[DifficultyLevel.EASY], seed=3, snake=Snake(100, 100))
+    core.step(Action.NONE)
+    core.snake.grow()
+    core.step(Action.NONE)
+    core.step(Action.DOWN)
+    snake = core.snake
+    previous = [((col - dx) * GRID_SIZE, (row - dy) * GRID_SIZE)
+                for (col, row), (dx, dy) in zip(snake.body, [(0, 1), (1, 0)])]
+    assert snake.interpolated_positions(1.0) == list(snake.positions)
+    assert snake.interpolated_positions(0.0) == previous, snake.interpolated_positions(0.0)
+    halfway = snake.interpolated_positions(0.5)
+    assert halfway[0] == (previous[0][0], previous[0][1] + GRID_SIZE // 2), halfway
+    # A head that wrapped through the wall is drawn on its new cell, not slid across the board
+    while snake.head_cell[1] != 0:
+        core.step(Action.NONE)
+    assert snake.interpolated_positions(0.5)[0] == snake.positions[0]
+    print(f"✓ Alpha tracks the time into the next tick; segments blend between ticks")
+except Exception as e:
+    print(f"✗ Render interpolation failed: {e}")
+    sys.exit(1)
+
+# Test 20: Free-cell spawning and a full board
+print("\n[20/23] Testing free-cell spawning and board full...")
+try:
+    from src.core.hamiltonian import build_cycle
+    from src.config.config import GRID_WIDTH, GRID_HEIGHT
+    core = SimulationCore(DIFFICULTY_PRESETS[DifficultyLevel.MEDIUM], seed=6)
+    snake = core.snake
+    # Cover every cell but one with a snake whose head is next to the gap
+    cycle = [(index % GRID_WIDTH, index // GRID_WIDTH) for index in build_cycle(GRID_WIDTH, GRID_HEIGHT)]
+    gap = cycle[0]
+    snake.body.clear()
+    snake.body.extend(cycle[1:])
+    snake.occupancy[:] = bytes(GRID_WIDTH * GRID_HEIGHT)
+    for col, row in cycle[1:]:
+        snake.occupancy[row * GRID_WIDTH + col] = 1
+    snake.free_cells.rebuild()
+    snake.direction = (gap[0] - cycle[1][0], gap[1] - cycle[1][1])
+    snake.zobrist = snake.compute_zobrist()
+    assert len(snake.free_cells) == 1
+    # The only free cell is always the one picked
+    for _ in range(5):
+        assert core.food.respawn(snake) and core.food.position == (gap[0] * GRID_SIZE, gap[1] * GRID_SIZE)
+    # Eating it while growing fills the board: the game is won
+    snake.grow()
+    result = core.step(Action.NONE)
+    kinds = [event.kind for event in result.events]
+    assert result.game_over and core.won and SimEvent.BOARD_FULL in kinds, kinds
+    assert SimEvent.DIED not in kinds and len(snake.free_cells) == 0
+    assert not core.food.respawn(snake), "respawn succeeded on a full board"
+    print(f"✓ Last free cell always picked; filling all {len(cycle)} cells ends the game as a win")
+except Exception as e:
+    print(f"✗ Board full check failed: {e}")
+    sys.exit(1)
+
+# Test 21: Multiprocess batch runner
+print("\n[21/23] Testing batch runner...")
+try:
+    from src.core.batch_runner import run_batch
+    serial = run_batch(12, "medium", "greedy", workers=1, base_seed=40, max_ticks=3000)
+    parallel = run_batch(12, "medium", "greedy", workers=3, base_seed=40, max_ticks=3000)
+    assert [result.seed for result in serial.results] == list(range(40, 52))
+    # Each game depends only on its seed, so sharding must not change anything
+    assert serial.results == parallel.results, "worker count changed the results"
+    assert serial.total_ticks == parallel.total_ticks and serial.causes == parallel.causes
+    print(f"✓ 1 and 3 workers agree on {serial.games} games ({serial.total_ticks} ticks)")
+except Exception as e:
+    print(f"✗ Batch runner check failed: {e}")
+    sys.exit(1)
+
+# Test 22: A* autopilot never steers into a wall or itself
+print("\n[22/23] Testing autopilot safety...")
+try:
+    from src.core.grid import is_safe_cell, legal_actions, neighbor_cell
+    checked = 0
+    for level, seed in ((DifficultyLevel.EASY, 1), (DifficultyLevel.MEDIUM, 2), (DifficultyLevel.HARD, 3)):
+        core = SimulationCore(DIFFICULTY_PRESETS[level], seed=seed)
+        policy = create_policy("autopilot")
+        wrap_around = core.settings.wall_wrap_around
+        while not core.game_over and core.tick < 3000:
+            snake = core.snake
+            action = policy(core) & Action.DIRECTION_MASK
+            direction = Action.DIRECTIONS.get(action, snake.direction)
+            cell = neighbor_cell(snake.head_cell, direction, wrap_around)
+            # A move into a wall or the body is only allowed when every move is one
+            safe = [a for a in legal_actions(snake)
+                    if is_safe_cell(snake, neighbor_cell(snake.head_cell, Action.DIRECTIONS[a], wrap_around))]
+            assert is_safe_cell(snake, cell) or not safe, \
+                f"{level.value} seed {seed} tick {core.tick}: unsafe move with {safe} available"
+            core.step(action)
+            checked += 1
+    print(f"✓ {checked} autopilot moves checked, none chose death over a safe move")
+except Exception as e:
+    print(f"✗ Autopilot safety check failed: {e}")
+    sys.exit(1)
+
+# Test 23: Hamiltonian cycle construction and disk cache
+print("\n[23/23] Testing Hamiltonian cycle and cache...")
+try:
+    from array import array
+    import src.core.hamiltonian as hamiltonian
+    from src.core.hamiltonian import is_valid_cycle, load_cycle, cycle_cache_path
+    for width, height in ((2, 2), (4, 3), (3, 4), (6, 5), (7, 8), (GRID_WIDTH, GRID_HEIGHT)):
+        cycle = build_cycle(width, height)
+        for wrap_around in (False, True):
+            assert is_valid_cycle(cycle, width, height, wrap_around), (width, height, wrap_around)
+    for width, height in ((3, 3), (5, 7)):
+        try:
+            build_cycle(width, height)
+            raise AssertionError(f"odd {width}x{height} board gave a cycle")
+        except ValueError:
+            pass
+    # A broken cycle is rejected: swapping two cells breaks adjacency
+    broken = array('i', build_cycle(4, 4))
+    broken[1], broken[5] = broken[5], broken[1]
+    assert not is_valid_cycle(broken, 4, 4, False)
+
+    saved_cache_dir = hamiltonian.CACHE_DIR
+    with tempfile.TemporaryDirectory() as temp_dir:
+        hamiltonian.CACHE_DIR = temp_dir
+        try:
+            path = cycle_cache_path(GRID_WIDTH, GRID_HEIGHT, False)
+            cycle = load_cycle(False)
+            assert os.path.exists(path) and not os.path.exists(path + ".tmp")
+            # The cache is what gets loaded: a reversed (still valid) cycle comes back as is
+            reversed_cycle = array('i', reversed(cycle))
+            with open(path, "wb") as f:
+                f.write(reversed_cycle.tobytes())
+            assert load_cycle(False) == reversed_cycle, "cached cycle not used"
+            # A corrupt cache is rebuilt and rewritten
+            with open(path, "wb") as f:
+                f.write(b"\x00" * 10)
+            assert load_cycle(False) == cycle
+            with open(path, "rb") as f:
+                assert f.read() == cycle.tobytes()
+            assert not os.path.exists(cycle_cache_path(GRID_WIDTH, GRID_HEIGHT, True))
+        finally:
+            hamiltonian.CACHE_DIR = saved_cache_dir
+    print("✓ Cycles valid on 6 board sizes, odd boards rejected, cache round trip works")
+except Exception as e:
+    print(f"✗ Hamiltonian check failed: {e}")
+    sys.exit(1)
+
 print("\n" + "=" * 60)
 print("✓ ALL TESTS PASSED!")
 print("=" * 60)
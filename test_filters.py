@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Test script for the audio filters, the music generators that use them, the audio cache
+and the streaming loop source
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+print("=" * 60)
+print("Testing Audio Filters")
+print("=" * 60)
+
+
+def reference_smooth(signal, window_size):
+    """The per-sample smoothing loop the music generators used before"""
+    smoothed = np.zeros_like(signal)
+    for i in range(len(signal)):
+        start = max(0, i - window_size // 2)
+        end = min(len(signal), i + window_size // 2 + 1)
+        smoothed[i] = np.mean(signal[start:end])
+    return smoothed
+
+
+def reference_lowpass(signal, cutoff, sample_rate):
+    """One-pole low-pass written as the plain recursion"""
+    alpha = 1.0 - np.exp(-2 * np.pi * cutoff / sample_rate)
+    out = np.zeros_like(signal)
+    state = 0.0
+    for i, sample in enumerate(signal):
+        state += alpha * (sample - state)
+        out[i] = state
+    return out
+
+
+rng = np.random.default_rng(42)
+noise = rng.uniform(-1, 1, 20000)
+t = np.arange(20000) / 22050
+tone = 0.4 * np.sin(2 * np.pi * 440 * t) + 0.2 * np.sign(np.sin(2 * np.pi * 110 * t))
+
+# Test 1: Moving average against the old smoothing loop
+print("\n[1/7] Testing moving average...")
+try:
+    from src.audio.filters import moving_average
+    for window_size in (5, 10, 15, 20, 30, 50):
+        for signal in (noise, tone, noise[:7]):
+            error = np.max(np.abs(moving_average(signal, window_size) - reference_smooth(signal, window_size)))
+            assert error < 1e-9, f"window {window_size}: error {error}"
+    print(f"✓ Moving average matches the smoothing loop (windows 5-50)")
+except Exception as e:
+    print(f"✗ Moving average failed: {e}")
+    sys.exit(1)
+
+# Test 2: One-pole low-pass against the recursion
+print("\n[2/7] Testing one-pole low-pass...")
+try:
+    from src.audio.filters import one_pole_lowpass
+    for cutoff in (5, 200, 1000, 8000):
+        error = np.max(np.abs(one_pole_lowpass(noise, cutoff, 22050) - reference_lowpass(noise, cutoff, 22050)))
+        assert error < 1e-9, f"cutoff {cutoff}: error {error}"
+    print(f"✓ Low-pass matches the per-sample recursion (5 Hz - 8 kHz)")
+except Exception as e:
+    print(f"✗ Low-pass failed: {e}")
+    sys.exit(1)
+
+# Test 3: Delay
+print("\n[3/7] Testing delay...")
+try:
+    from src.audio.filters import delay
+    delayed = delay(tone, 441, 0.2)
+    assert np.all(delayed[:441] == 0)
+    assert np.array_equal(delayed[441:], tone[:-441] * 0.2)
+    assert np.all(delay(tone[:100], 441) == 0)
+    print(f"✓ Delay shifts and scales the signal")
+except Exception as e:
+    print(f"✗ Delay failed: {e}")
+    sys.exit(1)
+
+# Test 4: The smoothing step matches the old loop; every music loop renders
+# bit-identical to the original per-sample generators (SHA-1 prefixes taken
+# from them with np.random seeded to 0, default tempo, volume and sample rate)
+MUSIC_CHECKSUMS = {
+    ("retro_arcade", "menu"): "c1c55a890f44beea",
+    ("retro_arcade", "game"): "b44dd749d0fd8524",
+    ("retro_arcade", "game_over"): "c54e90ec489beb08",
+    ("chiptune", "menu"): "cc73feb77674333c",
+    ("chiptune", "game"): "e041123ccdb6f27c",
+    ("chiptune", "game_over"): "5d2bd848af391468",
+    ("ambient", "menu"): "68e938c69ac46d43",
+    ("ambient", "game"): "b412da957ead8ce5",
+    ("ambient", "game_over"): "160c8e24d9cc5c0b",
+    ("kids", "menu"): "37364c1382edc709",
+    ("kids", "game"): "1c4a84f4feb1672b",
+    ("kids", "game_over"): "9f04a159d112a021",
+}
+print("\n[4/7] Testing smoothing and music rendering...")
+try:
+    from src.audio.synth import MUSIC_PHASES, MUSIC_STYLES, render_track, to_int16
+    for window_size in (5, 15, 20, 10, 30, 50):
+        old = to_int16(reference_smooth(tone, window_size), 0.2)
+        new = to_int16(moving_average(tone, window_size), 0.2)
+        assert np.max(np.abs(old.astype(int) - new.astype(int))) <= 1, f"window {window_size}"
+    assert set(MUSIC_CHECKSUMS) == {(style, phase) for style in MUSIC_STYLES for phase in MUSIC_PHASES}
+    start = time.perf_counter()
+    for style in MUSIC_STYLES:
+        for phase in MUSIC_PHASES:
+            np.random.seed(0)
+            music = render_track(style, phase)
+            assert music.dtype == np.int16 and music.shape[1] == 2, f"{style}/{phase}"
+            checksum = hashlib.sha1(music.tobytes()).hexdigest()[:16]
+            assert checksum == MUSIC_CHECKSUMS[(style, phase)], f"{style}/{phase} output changed"
+    elapsed = time.perf_counter() - start
+    print(f"✓ Smoothing matches the old loop within 1 LSB")
+    print(f"  - All music loops match the original generators bit for bit")
+    print(f"  - Rendered {len(MUSIC_STYLES) * len(MUSIC_PHASES)} music loops in {elapsed:.2f}s")
+except Exception as e:
+    print(f"✗ Music output failed: {e}")
+    sys.exit(1)
+
+# Test 5: Audio cache round trip
+print("\n[5/7] Testing audio cache...")
+try:
+    import src.audio.cache as audio_cache
+    with tempfile.TemporaryDirectory() as directory:
+        audio_cache.AUDIO_CACHE_DIR = directory
+        params = {"style": "kids", "phase": "menu", "bpm": 128, "volume": 0.2, "version": 1}
+        renders = []
+        render = lambda: renders.append(1) or render_track("kids", "menu", 128, 0.2)
+        first = audio_cache.cached_render("music_kids_menu", params, render)
+        second = audio_cache.cached_render("music_kids_menu", params, render)
+        assert len(renders) == 1, "warm load rendered again"
+        assert isinstance(second, np.memmap) and np.array_equal(first, second)
+        audio_cache.cached_render("music_kids_menu", dict(params, volume=0.3), render)
+        assert len(renders) == 2, "new parameters reused the old buffer"
+        assert len(os.listdir(directory)) == 1, "stale render was kept"
+    print(f"✓ Buffers are stored once, memory-mapped and keyed by parameters")
+except Exception as e:
+    print(f"✗ Audio cache failed: {e}")
+    sys.exit(1)
+
+# Test 6: Streaming a loop in chunks
+print("\n[6/7] Testing streamed loop chunks...")
+try:
+    from src.audio.stream import LoopSource
+    loop = render_track("chiptune", "game_over")
+    source = LoopSource(loop)
+    chunks = [source.read(11025) for _ in range(3 * len(loop) // 11025 + 1)]
+    streamed = np.concatenate(chunks)
+    assert all(chunk.shape == (11025, 2) and chunk.dtype == np.int16 for chunk in chunks)
+    assert np.array_equal(streamed, np.tile(loop, (4, 1))[:len(streamed)]), "chunks do not match the loop"
+    print(f"✓ {len(chunks)} chunks replay the loop seamlessly across wrap-arounds")
+except Exception as e:
+    print(f"✗ Streaming failed: {e}")
+    sys.exit(1)
+
+# Test 7: Only the playing music style stays in memory
+print("\n[7/7] Testing music buffer release...")
+try:
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    import pygame
+    import src.game.sound_manager as sound_module
+    sound_module.AUDIO_CACHE_ENABLED = False  # Loops are plain arrays: the case that needs bounding
+    audio_cache.AUDIO_CACHE_ENABLED = False
+    pygame.init()
+    manager = sound_module.SoundManager()
+
+    def wait_for_music(manager):
+        for _ in range(500):
+            manager.update()
+            if manager.loaded_music_style == manager.current_music_style:
+                return
+            time.sleep(0.01)
+        raise AssertionError("music did not load")
+
+    wait_for_music(manager)
+    manager.start_menu_music()  # Would prefetch every style with the cache on
+    assert list(manager.music_jobs) == [manager.current_music_style], "other styles were kept"
+    for _ in range(2):
+        manager.switch_music_style()
+        wait_for_music(manager)
+        assert list(manager.music_jobs) == [manager.current_music_style], "old style was kept"
+    assert manager.music_stream.playing
+    manager.cleanup()
+    print(f"✓ Only {manager.current_music_style} loops are held after two style switches")
+except Exception as e:
+    print(f"✗ Music buffer release failed: {e}")
+    sys.exit(1)
+
+print("\n" + "=" * 60)
+print("✓ ALL FILTER TESTS PASSED!")
+print("=" * 60)